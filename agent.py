@@ -1,78 +1,65 @@
 # agent.py
 import time
 import random
-from typing import List, Tuple, Optional, Iterable, Deque, Set
+import heapq
+from typing import List, Tuple, Optional, Iterable, Deque, Set, Dict
 from collections import deque
 
 from recette import (
     Aliment, EtatAliment, Recette, IngredientRequis,
-    prendre_au_bac, prendre_legume, nouvelle_recette
+    prendre_au_bac, prendre_legume, nouvelle_recette,
+    BITS_PAR_CODE, signature_aliments, masque_compatibles
 )
-from carte import Carte
+from anticipation import STRATEGIE as STRATEGIE_ANTICIPATION
+from ordonnancement import STRATEGIE as STRATEGIE_ORDONNANCE
+from carte import Carte, LEGUMES_BAC, BAC, DECOUPE, FOUR, POELE, ASSEMBLAGE, SERVICE
+from replanification import ReplanificateurIncremental
+from reservations import astar_cooperatif, FENETRE_PAS
 
 Coord = Tuple[int, int]
 
 # --- HELPERS LOGIQUE RECETTE ---
 
 def recettes_possibles_pour_items(items: List[Aliment], recettes: List[Recette]) -> List[Recette]:
-    possibles = []
-    for r in recettes:
-        requis = r.requis
-        used = [False] * len(requis)
-        ok = True
-        for a in items:
-            matched = False
-            for i, req in enumerate(requis):
-                if used[i]: continue
-                if a.nom == req.nom and a.etat == req.etat_final:
-                    used[i] = True
-                    matched = True
-                    break
-            if not matched:
-                ok = False
-                break
-        if ok:
-            possibles.append(r)
-    return possibles
+    return recettes_compatibles(signature_aliments(items), recettes)
+
+def recettes_compatibles(sig: int, recettes: List[Recette]) -> List[Recette]:
+    """Recettes actives dont chaque aliment de `sig` occupe un requis distinct."""
+    m = masque_compatibles(sig)
+    return [r for r in recettes if (m >> r.uid) & 1]
 
 def items_completent_recette(items: List[Aliment], r: Recette) -> bool:
     """Vérifie si les items présents sont tous valides pour la recette r."""
-    used = [False] * len(r.requis)
-    for a in items:
-        found = False
-        for i, req in enumerate(r.requis):
-            if used[i]: continue
-            if a.nom == req.nom and a.etat == req.etat_final:
-                used[i] = True
-                found = True
-                break
-        if not found: return False
-    return True
+    return r.accepte(signature_aliments(items))
 
 def matched_flags_for_recipe(items: List[Aliment], r: Recette) -> List[bool]:
-    flags = [False] * len(r.requis)
-    for a in items:
-        for i, req in enumerate(r.requis):
-            if not flags[i] and a.nom == req.nom and a.etat == req.etat_final:
-                flags[i] = True
-                break
+    sig = signature_aliments(items)
+    flags = []
+    for c in r.codes:
+        champ = BITS_PAR_CODE * c
+        if (sig >> champ) & 0x7F:
+            sig -= 1 << champ
+            flags.append(True)
+        else:
+            flags.append(False)
     return flags
 
 # --- PATHFINDING AMÉLIORÉ ---
 
 def voisins_libres(carte: Carte, x: int, y: int, obstacles_dynamiques: Set[Coord] = None) -> Iterable[Coord]:
-    if obstacles_dynamiques is None: obstacles_dynamiques = set()
-    for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
-        nx, ny = x+dx, y+dy
-        if 0 <= nx < carte.cols and 0 <= ny < carte.rows:
-            # On ne traverse pas les murs/stations ET on évite les obstacles dynamiques (l'autre joueur)
-            if not carte.est_bloquant(nx, ny) and (nx, ny) not in obstacles_dynamiques:
-                yield (nx, ny)
+    # Voisins praticables précalculés par la carte, moins les obstacles dynamiques (l'autre joueur)
+    voisins = carte.voisins_praticables(x, y)
+    if not obstacles_dynamiques: return voisins
+    return [c for c in voisins if c not in obstacles_dynamiques]
 
 def bfs_path(carte: Carte, start: Coord, goals: Iterable[Coord], obstacles_dynamiques: Set[Coord] = None) -> Optional[List[Coord]]:
     goal_set = set(goals)
     # Si on est déjà sur l'objectif
     if start in goal_set: return []
+
+    # Sans obstacle dynamique, la table toutes-paires de la carte donne directement le chemin
+    if not obstacles_dynamiques or obstacles_dynamiques == {start}:
+        return carte.table_chemins.chemin(start, goal_set)
     
     q: Deque[Coord] = deque([start])
     parent: dict[Coord, Optional[Coord]] = {start: None}
@@ -82,6 +69,8 @@ def bfs_path(carte: Carte, start: Coord, goals: Iterable[Coord], obstacles_dynam
     if obstacles_dynamiques and start in obstacles_dynamiques:
         obstacles_dynamiques.remove(start)
 
+    voisins, cols = carte.voisins_praticables, carte.cols
+    obstacles = obstacles_dynamiques or ()
     while q:
         cur = q.popleft()
         if cur in goal_set:
@@ -92,41 +81,100 @@ def bfs_path(carte: Carte, start: Coord, goals: Iterable[Coord], obstacles_dynam
             path.reverse()
             return path
         
-        for nxt in voisins_libres(carte, *cur, obstacles_dynamiques=obstacles_dynamiques):
-            if nxt not in visited:
+        for nxt in voisins(*cur):
+            if nxt not in visited and nxt not in obstacles:
                 visited.add(nxt)
                 parent[nxt] = cur
                 q.append(nxt)
     return None
 
+def reparation_locale(carte: Carte, champ: Dict[Coord, int], start: Coord, obstacles_dynamiques: Set[Coord]) -> Optional[List[Coord]]:
+    """
+    A* guidé par le champ statique (heuristique exacte hors obstacles) : seules les cases
+    autour des obstacles dynamiques sont réellement explorées.
+    """
+    if start not in champ: return None
+    parent: Dict[Coord, Optional[Coord]] = {start: None}
+    g: Dict[Coord, int] = {start: 0}
+    ouverts = [(champ[start], 0, start)]
+    while ouverts:
+        _, gc, cur = heapq.heappop(ouverts)
+        if gc > g[cur]: continue
+        if champ[cur] == 0 and cur not in obstacles_dynamiques:
+            path = [cur]
+            while parent[cur] is not None:
+                cur = parent[cur]
+                path.append(cur)
+            path.reverse()
+            return path
+        for nxt in voisins_libres(carte, *cur, obstacles_dynamiques=obstacles_dynamiques):
+            ng = gc + 1
+            if ng < g.get(nxt, 1 << 30):
+                g[nxt] = ng
+                parent[nxt] = cur
+                heapq.heappush(ouverts, (ng + champ[nxt], ng, nxt))
+    return None
+
+def chemin_vers_stations(carte: Carte, start: Coord, stations: List[Coord], obstacles_dynamiques: Set[Coord] = None) -> Optional[List[Coord]]:
+    """
+    Chemin (start inclus) vers une case adjacente à l'une des `stations`.
+    Cas statique : simple lecture du champ de distance précalculé de la carte.
+    Si un obstacle dynamique (un coéquipier) gêne la route, on répare localement.
+    """
+    champ = carte.champ_distance(stations)
+    if obstacles_dynamiques and start in obstacles_dynamiques:
+        obstacles_dynamiques = obstacles_dynamiques - {start}
+    if champ.get(start) == 0 and not (obstacles_dynamiques and start in obstacles_dynamiques):
+        return []
+    path = carte.descendre_champ(champ, start)
+    if path is None: return None
+    if obstacles_dynamiques and any(c in obstacles_dynamiques for c in path[1:]):
+        return reparation_locale(carte, champ, start, obstacles_dynamiques)
+    return path
+
 def cases_adjacentes_a_stations(carte: Carte, stations: List[Coord], obstacles_dynamiques: Set[Coord] = None) -> List[Coord]:
     adj: set[Coord] = set()
     for (sx, sy) in stations:
         for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
             nx, ny = sx+dx, sy+dy
             # Une case est valide si elle est dans la grille, pas un mur, ET pas occupée par l'autre joueur
-            if 0 <= nx < carte.cols and 0 <= ny < carte.rows:
-                if not carte.est_bloquant(nx, ny):
-                    if obstacles_dynamiques is None or (nx, ny) not in obstacles_dynamiques:
-                        adj.add((nx, ny))
+            if carte.est_praticable(nx, ny):
+                if obstacles_dynamiques is None or (nx, ny) not in obstacles_dynamiques:
+                    adj.add((nx, ny))
     return list(adj)
 
 
 class Agent:
-    def __init__(self, game_instance, player_instance, strategie: str, agent_id: int = 0):
+    def __init__(self, game_instance, player_instance, strategie: str, agent_id: int = 0,
+                 rng: Optional[random.Random] = None):
         self.game = game_instance
         self.player = player_instance
         self.strategie = strategie
         self.agent_id = agent_id 
-        self.partner: Optional['Agent'] = None # Référence vers l'autre agent
+        # Flux aléatoire propre à l'agent (pauses, dégagements) ; à défaut, le module `random`
+        self.rng = rng or random
+        # Coéquipiers : positions (game.occupation) et intentions (game.revendications) partagées
+        self.occupation = self.game.occupation
+        self.revendications = self.game.revendications
 
         self.current_path: List[Coord] = []
-        self.target_station: Optional[Coord] = None # La station précise que l'on vise
+        self._target_station: Optional[Coord] = None # La station précise que l'on vise
+        self.stations_visees: Optional[List[Coord]] = None # Stations candidates du chemin courant
+        self.replanif = ReplanificateurIncremental(self.game.carte)
+        self.pauses_evitees = 0
         
         self.move_cooldown = 0
         self.move_every_ticks = 2.0
+        # Réservation espace-temps du chemin courant dans la table partagée du jeu
+        self._chemin_reserve = False
+        self._tick_reservation = 0
+
+        # Dernière réflexion sans effet (ni action, ni chemin), datée par la version du monde
+        self._memo_reflexion: Optional[tuple] = None
+        self.reflexions_executees = 0
+        self.reflexions_evitees = 0
 
-        self.bot_recette: Optional[Recette] = None
+        self._bot_recette: Optional[Recette] = None
         self.next_req_idx: int = 0
         self.current_assembly: Optional[Coord] = None
 
@@ -135,59 +183,185 @@ class Agent:
         self.pause_until = 0.0
         self.retreat_threshold_s = 2.0  # Au bout de 2s, on tente de reculer
         self.block_timeout_s = 5.0      # Au bout de 5s, on reset tout (hard reset)
+        self.game.reservations.garer(self.agent_id, self.last_pos, self.game.tick_courant)
+        self.occupation.placer(self.agent_id, self.last_pos)
 
     @property
     def carte(self):
         return self.game.carte
 
+    # Attributs de décision sauvegardés par `instantane` (valeurs immuables ou remplacées, jamais modifiées en place)
+    _CHAMPS_INSTANTANE = (
+        "_target_station", "stations_visees", "pauses_evitees", "move_cooldown", "_chemin_reserve",
+        "_tick_reservation", "_memo_reflexion", "reflexions_executees", "reflexions_evitees",
+        "_bot_recette", "next_req_idx", "current_assembly", "last_pos", "last_progress_time", "pause_until",
+    )
+
+    def instantane(self) -> tuple:
+        """État propre de l'agent ; les registres partagés (revendications...) sont sauvegardés par le jeu."""
+        return (list(self.current_path), tuple(getattr(self, n) for n in self._CHAMPS_INSTANTANE),
+                self.replanif.instantane(), self.rng.getstate())
+
+    def restaurer(self, inst: tuple) -> None:
+        chemin, valeurs, replanif, etat_rng = inst
+        self.current_path = list(chemin)
+        for nom, v in zip(self._CHAMPS_INSTANTANE, valeurs):
+            setattr(self, nom, v)
+        self.replanif.restaurer(replanif)
+        self.rng.setstate(etat_rng)
+
+    @property
+    def bot_recette(self) -> Optional[Recette]:
+        return self._bot_recette
+
+    @bot_recette.setter
+    def bot_recette(self, recette: Optional[Recette]):
+        self._bot_recette = recette
+        self.revendications.choisir_recette(self.agent_id, recette)
+
+    @property
+    def target_station(self) -> Optional[Coord]:
+        return self._target_station
+
+    @target_station.setter
+    def target_station(self, station: Optional[Coord]):
+        self._target_station = station
+        self.revendications.viser_station(self.agent_id, station)
+
+    def _coequipiers(self) -> List['Agent']:
+        return [a for a in self.game.agents if a is not self]
+
+    @property
+    def pas_ticks(self) -> int:
+        """Nombre de ticks de jeu passés sur chaque case d'un chemin."""
+        return max(1, int(round(self.move_every_ticks)))
+
     def tick(self):
         now = self.game.get_time()
         if now < self.pause_until: return
 
         self._check_blockage(now)
 
-        # Si on n'a pas de chemin, on réfléchit
+        # Si on n'a pas de chemin, on réfléchit (sauf si rien n'a changé depuis le dernier échec)
         if not self.current_path:
+            cle = self._cle_reflexion()
+            if cle == self._memo_reflexion:
+                self.reflexions_evitees += 1
+                return
+            self.reflexions_executees += 1
             acted = self.try_action()
             if not acted:
                 self._planifier()
+            # Réflexion sans aucun effet : on la mémorise pour ne pas la refaire à l'identique
+            if not acted and not self.current_path and self._cle_reflexion() == cle:
+                self._memo_reflexion = cle
+            else:
+                self._memo_reflexion = None
         else:
             self.move_cooldown += 1
+            # Chemin pas (ou plus) couvert par la table : on prolonge la fenêtre coopérative
+            if (not self._chemin_reserve
+                    or self.game.tick_courant - self._tick_reservation >= (FENETRE_PAS // 2) * self.pas_ticks):
+                self._replanifier_cooperatif()
             if self.move_cooldown >= self.move_every_ticks:
                 if self._chemin_est_libre_prochaine_etape():
                     self._suivre_chemin()
                     self.move_cooldown = 0
                 else:
-                    # --- CORRECTION 1 : GESTION DU BLOCAGE (PATIENCE) ---
-                    # Au lieu de replanifier tout de suite, on attend un peu de façon aléatoire
-                    # pour laisser l'autre passer.
-                    self.current_path = [] 
-                    # Pause aléatoire entre 0.2 et 0.8 secondes
-                    self.pause_until = now + random.uniform(0.2, 0.8)
-                    # On ne replanifie pas ici, le prochain tick le fera après la pause
+                    # On répare d'abord le chemin autour des coéquipiers (D* Lite incrémental)
+                    path = self._reparer_chemin()
+                    if path and self._chemin_est_libre_prochaine_etape(path[1:]):
+                        self.current_path = path[1:]
+                        self._reserver_chemin()
+                        self.pauses_evitees += 1
+                        self._suivre_chemin()
+                        self.move_cooldown = 0
+                    else:
+                        # --- CORRECTION 1 : GESTION DU BLOCAGE (PATIENCE) ---
+                        # Pas de détour possible : on attend un peu de façon aléatoire
+                        # pour laisser l'autre passer.
+                        self.current_path = []
+                        self._stationner()
+                        # Pause aléatoire entre 0.2 et 0.8 secondes
+                        self.pause_until = now + self.rng.uniform(0.2, 0.8)
+                        # On ne replanifie pas ici, le prochain tick le fera après la pause
 
                 if not self.current_path:
                     if self.try_action():
                         self._mark_progress()
 
-    def _chemin_est_libre_prochaine_etape(self) -> bool:
-        """Vérifie si la prochaine case est libre (pas occupée par le partenaire)."""
-        if not self.current_path: return True
-        next_pos = self.current_path[0]
-        if self.partner:
-            partner_pos = (self.partner.player.x, self.partner.player.y)
-            if next_pos == partner_pos:
-                return False
-        return True
+    def _cle_reflexion(self) -> tuple:
+        """Tout ce dont dépend la décision de try_action/_planifier, hormis l'horloge."""
+        return (self.game.version_monde, self.revendications.version,
+                id(self._bot_recette), self.next_req_idx, self.current_assembly)
+
+    def _chemin_est_libre_prochaine_etape(self, path: Optional[List[Coord]] = None) -> bool:
+        """Vérifie si la prochaine case est libre (pas occupée par un coéquipier). O(1)."""
+        if path is None: path = self.current_path
+        if not path: return True
+        return not self.occupation.occupee_par_autre(path[0], self.agent_id)
+
+    # --- RÉSERVATIONS ESPACE-TEMPS ---
+    def _t0_reservation(self) -> int:
+        """Tick de référence : le prochain pas a lieu à t0 + pas_ticks."""
+        return self.game.tick_courant - int(self.move_cooldown)
+
+    def _reserver_chemin(self):
+        self.game.reservations.reserver(self.agent_id, (self.player.x, self.player.y), self.current_path,
+                                        self._t0_reservation(), self.pas_ticks)
+        self._chemin_reserve = True
+        self._tick_reservation = self.game.tick_courant
+
+    def _stationner(self):
+        """L'agent ne suit plus de chemin : il bloque sa case jusqu'à nouvel ordre."""
+        self.game.reservations.liberer(self.agent_id)
+        self.game.reservations.garer(self.agent_id, (self.player.x, self.player.y), self.game.tick_courant)
+        self._chemin_reserve = False
+
+    def _chemin_cooperatif(self, stations: List[Coord]) -> Optional[List[Coord]]:
+        """A* coopératif fenêtré (départ exclu) en tenant compte des réservations des autres agents."""
+        bloques = [c for c in self.carte.voisins_praticables(self.player.x, self.player.y)
+                   if self.occupation.occupee_par_autre(c, self.agent_id)]
+        return astar_cooperatif(self.carte, (self.player.x, self.player.y), stations, self.game.reservations,
+                                self.agent_id, self._t0_reservation(), self.pas_ticks, bloques_immediats=bloques)
+
+    def _aller_vers(self, stations: List[Coord]) -> Optional[List[Coord]]:
+        """
+        Planifie et réserve un chemin vers `stations`. Retourne le chemin (départ inclus),
+        [] si on est déjà arrivé, None si aucune route.
+        """
+        start = (self.player.x, self.player.y)
+        self.move_cooldown = 0
+        suite = self._chemin_cooperatif(stations)
+        if suite is None:
+            path = chemin_vers_stations(self.carte, start, stations, self._get_dynamic_obstacles())
+            if not path: return path
+            suite = path[1:]
+        if not suite: return []
+        self.current_path = suite
+        self.stations_visees = stations
+        self._reserver_chemin()
+        self.revendications.nouveau_chemin()
+        return [start] + suite
+
+    def _replanifier_cooperatif(self):
+        if self.stations_visees:
+            suite = self._chemin_cooperatif(self.stations_visees)
+            if suite: self.current_path = suite
+        self._reserver_chemin()
+
+    def _reparer_chemin(self) -> Optional[List[Coord]]:
+        """Répare le chemin courant autour des obstacles dynamiques, sans repartir de zéro."""
+        if not self.stations_visees: return None
+        return self.replanif.chemin((self.player.x, self.player.y), self.stations_visees, self._get_dynamic_obstacles())
 
     def _mark_progress(self):
         self.last_progress_time = self.game.get_time()
         self.last_pos = (self.player.x, self.player.y)
 
     def _tenter_degagement(self):
-        """Essaie de trouver une case adjacente libre pour laisser passer le partenaire."""
+        """Essaie de trouver une case adjacente libre pour laisser passer les coéquipiers."""
         px, py = self.player.x, self.player.y
-        partner_pos = (self.partner.player.x, self.partner.player.y) if self.partner else (-999, -999)
         
         candidates = []
         # On regarde les 4 voisins
@@ -202,8 +376,8 @@ class Agent:
             if self.carte.est_bloquant(nx, ny):
                 continue
                 
-            # CRITIQUE : On ne va pas SUR le partenaire (puisqu'on veut lui laisser la place)
-            if (nx, ny) == partner_pos:
+            # CRITIQUE : On ne va pas SUR un coéquipier (puisqu'on veut lui laisser la place)
+            if self.occupation.occupee_par_autre((nx, ny), self.agent_id):
                 continue
             
             # Si on a un chemin actuel, on essaie d'éviter la prochaine case prévue (pour ne pas insister)
@@ -214,10 +388,12 @@ class Agent:
         
         if candidates:
             # On choisit une case de fuite au hasard
-            retreat_target = random.choice(candidates)
+            retreat_target = self.rng.choice(candidates)
             
-            # On force le mouvement : chemin d'un seul pas
+            # On force le mouvement : chemin d'un seul pas (réservé à la reprise)
             self.current_path = [retreat_target]
+            self.stations_visees = None
+            self._stationner()
             
             # On met une pause après le mouvement pour laisser le temps à l'autre de passer
             self.pause_until = self.game.get_time() + 1.5 
@@ -250,6 +426,8 @@ class Agent:
             # On lâche l'item s'il ne sert à rien, ou on change de recette
             self.current_path = []
             self.target_station = None
+            self.stations_visees = None
+            self._stationner()
             
             # Si on a un item en main, on le pose par terre (optionnel) ou on le garde
             # Reset complet de la logique
@@ -269,28 +447,31 @@ class Agent:
         if self.strategie == "simple":
             # Les plus rapides d'abord
             sorted_recettes.sort(key=lambda r: r.temps_estime)
-        elif self.strategie == "complexe":
+        elif self.strategie in ("complexe", STRATEGIE_ANTICIPATION, STRATEGIE_ORDONNANCE):
             # Les plus difficiles d'abord (rapporter plus de points)
             sorted_recettes.sort(key=lambda r: r.difficulte_reelle, reverse=True)
         # Si "naive", on garde l'ordre d'arrivée
         
-        # 2. Identification de la recette du partenaire
-        recette_partenaire = None
-        if self.partner and self.partner.bot_recette:
-            recette_partenaire = self.partner.bot_recette
+        # 2. Identification des recettes des coéquipiers
+        recettes_prises = self.revendications.recettes_des_autres(self.agent_id)
 
         # 3. Sélection intelligente
-        # On parcourt la liste triée. On prend la première qui n'est PAS celle du partenaire.
+        # Anticipation : on simule la suite du match pour chaque recette libre (ordre statique en repli)
+        if self.strategie == STRATEGIE_ANTICIPATION and not self.game.anticipation.en_cours:
+            libres = [r for r in sorted_recettes if id(r) not in recettes_prises]
+            if len(libres) > 1: return self.game.anticipation.choisir(self, libres)
+
+        # On parcourt la liste triée. On prend la première qu'aucun coéquipier n'a choisie.
         for r in sorted_recettes:
-            # On vérifie l'identité de l'objet (is) ou le nom
-            if r is not recette_partenaire:
-                #print(f"Agent {self.agent_id} choisit : {r.nom} (Évite {recette_partenaire.nom if recette_partenaire else 'rien'})")
+            # On vérifie l'identité de l'objet (is), pas le nom
+            if id(r) not in recettes_prises:
+                #print(f"Agent {self.agent_id} choisit : {r.nom} (Évite {len(recettes_prises)} recette(s) prise(s))")
                 return r
         
         # 4. Fallback (Cas rare)
-        # Si on arrive ici, c'est qu'il n'y a qu'une seule recette disponible 
-        # et que le partenaire est déjà dessus. On aide le partenaire !
-        #print(f"Agent {self.agent_id} aide son partenaire sur : {sorted_recettes[0].nom}")
+        # Si on arrive ici, c'est que toutes les recettes disponibles sont déjà
+        # prises par des coéquipiers. On aide le premier !
+        #print(f"Agent {self.agent_id} aide ses coéquipiers sur : {sorted_recettes[0].nom}")
         return sorted_recettes[0]
 
     def _ensure_bot_recette_valide(self):
@@ -302,33 +483,8 @@ class Agent:
             self.current_assembly = None
 
     def _next_req_index_disponible(self, recette: Recette) -> Optional[int]:
-        """Cherche le prochain ingrédient nécessaire qui n'est pas déjà en cours."""
-        cuisson_noms = {alim.nom for (alim, _, _) in self.game.cuissons.values()}
-        couverts = [False] * len(recette.requis)
-
-        def mark_couvert(nom: str, etat):
-            for i, req in enumerate(recette.requis):
-                if couverts[i]: continue
-                if nom == req.nom and etat == req.etat_final:
-                    couverts[i] = True
-                    return
-
-        # Ce que j'ai en main
-        if self.player.item: mark_couvert(self.player.item.nom, self.player.item.etat)
-        
-        # Ce qui est sur les tables
-        for stock in self.carte.assemblage_stock.values():
-            for a in stock: mark_couvert(a.nom, a.etat)
-            
-        # Ce qui cuit
-        for alim, _, _ in self.game.cuissons.values():
-            mark_couvert(alim.nom, alim.etat)
-
-        for i, req in enumerate(recette.requis):
-            if couverts[i]: continue
-            if req.nom in cuisson_noms: continue
-            return i
-        return None
+        """Cherche le prochain ingrédient nécessaire qui n'est pas déjà en cours (ma main, tables, cuissons)."""
+        return self.game.inventaire.prochain_requis_manquant(recette, self.player.item)
 
     def _stations_cuisson_pretes(self) -> List[Tuple[int, int]]:
         now = self.game.get_time()
@@ -349,6 +505,8 @@ class Agent:
         # 1. J'ai un item en main : Que faire avec ?
         if self.player.item and self.bot_recette:
             a = self.player.item
+            if self.strategie == STRATEGIE_ORDONNANCE:
+                self.current_assembly = self.game.ordonnanceur.table_pour(self)
             etat_requis = None
             
             # Vérifier si cet item sert dans MA recette
@@ -381,15 +539,17 @@ class Agent:
         # A. Une cuisson est finie ? Je vais la chercher
         stations_pretes = self._stations_cuisson_pretes()
         if stations_pretes:
-            # On filtre les stations que le partenaire vise déjà ? 
+            # On filtre les stations que les coéquipiers visent déjà ? 
             # Pour simplifier, BFS gérera la proximité, mais on pourrait filtrer ici.
-            adj = cases_adjacentes_a_stations(self.carte, stations_pretes, self._get_dynamic_obstacles())
-            path = bfs_path(self.carte, (self.player.x, self.player.y), adj, self._get_dynamic_obstacles())
+            path = self._aller_vers(stations_pretes)
             if path: 
-                self.current_path = path
                 self.target_station = stations_pretes[0] # Approx
                 return
 
+        # Ordonnancement central : la tâche vient de l'ordonnanceur de l'équipe
+        if self.strategie == STRATEGIE_ORDONNANCE:
+            self._executer_tache(self.game.ordonnanceur.tache(self)); return
+
         # B. Assemblage incomplet optimal ?
         best = None
         for pos, stock in self.carte.assemblage_stock.items():
@@ -397,7 +557,7 @@ class Agent:
             flags = matched_flags_for_recipe(stock, self.bot_recette)
             matches = sum(flags)
             if matches > 0:
-                dist = abs(self.player.x - pos[0]) + abs(self.player.y - pos[1])
+                dist = self.carte.distance_station((self.player.x, self.player.y), pos)
                 cand = (pos, flags, matches, dist)
                 if best is None or cand[2] > best[2] or (cand[2] == best[2] and cand[3] < best[3]):
                     best = cand
@@ -425,14 +585,26 @@ class Agent:
             target_req = self.bot_recette.requis[idx]
             self._aller_adjacent("BAC", cible_aliment=target_req.nom); return
 
+    def _executer_tache(self, tache) -> None:
+        """Se met en route pour une tâche de l'ordonnanceur (voir ordonnancement.Tache)."""
+        if tache is None: return
+        self.bot_recette = tache.recette
+        if tache.genre == "ingredient":
+            self.next_req_idx = tache.idx
+            self.current_assembly = tache.station
+            self._aller_adjacent("BAC", cible_aliment=tache.recette.requis[tache.idx].nom)
+        elif tache.genre == "servir":
+            self.current_assembly = tache.station
+            self._aller_adjacent("ASSEMBLAGE")
+        elif self._aller_vers([tache.station]):
+            self.target_station = tache.station
+
     def _get_dynamic_obstacles(self) -> Set[Coord]:
         obs = set()
-        if self.partner:
-            obs.add((self.partner.player.x, self.partner.player.y))
-            if self.partner.current_path:
-                 # On considère ses 2 prochaines étapes comme bloquées pour fluidifier
-                 for step in self.partner.current_path[:2]:
-                     obs.add(step)
+        for autre in self._coequipiers():
+            obs.add((autre.player.x, autre.player.y))
+            # On considère ses 2 prochaines étapes comme bloquées pour fluidifier
+            obs.update(autre.current_path[:2])
         return obs
 
     def _aller_adjacent(self, type_cible: str, cible_aliment: Optional[str] = None):
@@ -441,10 +613,7 @@ class Agent:
         
         # --- (Le début de la fonction reste identique pour récupérer les stations) ---
         if type_cible == "BAC":
-            for pos, (nom_bac, _) in self.carte.bacs_config.items():
-                if nom_bac == (cible_aliment or ""): stations.append(pos)
-                if nom_bac == "legume" and cible_aliment in ["tomate", "salade", "aubergine", "courgette", "poivron"]:
-                    stations.append(pos)
+            stations = self.carte.bacs_pour(cible_aliment)
         elif type_cible == "DECOUPE": 
             stations = self.carte.pos_decoupes
         elif type_cible == "FOUR_OU_POELE":
@@ -458,19 +627,22 @@ class Agent:
 
         # --- CORRECTION 2 : FILTRAGE INTELLIGENT AVEC DISTANCE ---
         stations_candidates = []
-        partner_target = self.partner.target_station if self.partner else None
-        partner_pos = (self.partner.player.x, self.partner.player.y) if self.partner else (999,999)
+        positions = self.occupation.positions
 
         for s in stations:
-            # Si le partenaire vise cette station PRÉCISEMMENT
-            if s == partner_target:
+            # Si un coéquipier vise cette station PRÉCISEMMENT (registre des revendications)
+            cedee = False
+            for autre_id in self.revendications.agents_sur_station(s):
+                if autre_id == self.agent_id: continue
                 # On calcule les distances
-                dist_me = abs(px - s[0]) + abs(py - s[1])
-                dist_partner = abs(partner_pos[0] - s[0]) + abs(partner_pos[1] - s[1])
+                dist_me = self.carte.distance_station((px, py), s)
+                dist_autre = self.carte.distance_station(positions[autre_id], s)
                 
                 # Si je suis plus loin (ou égal mais j'ai un ID plus grand), je lui laisse
-                if dist_me > dist_partner or (dist_me == dist_partner and self.agent_id > self.partner.agent_id):
-                    continue # Je saute cette station, elle est "réservée"
+                if dist_me > dist_autre or (dist_me == dist_autre and self.agent_id > autre_id):
+                    cedee = True; break
+            if cedee:
+                continue # Je saute cette station, elle est "réservée"
             
             stations_candidates.append(s)
 
@@ -478,67 +650,68 @@ class Agent:
         if not stations_candidates:
             stations_candidates = stations
 
-        obstacles = self._get_dynamic_obstacles()
-        adj = cases_adjacentes_a_stations(self.carte, stations_candidates, obstacles)
-        
-        path = bfs_path(self.carte, (px, py), adj, obstacles)
+        path = self._aller_vers(stations_candidates)
         
         if path:
-            self.current_path = path
             end_x, end_y = path[-1]
-            # On assigne la target_station pour que l'autre agent puisse la voir
+            # On assigne la target_station pour que les coéquipiers puissent la voir
             closest_s = min(stations_candidates, key=lambda s: abs(s[0]-end_x) + abs(s[1]-end_y))
             self.target_station = closest_s
         else:
             self.current_path = []
             self.target_station = None
+            self.stations_visees = None
 
     def _suivre_chemin(self):
         if not self.current_path: return
-        # On ignore la position actuelle si elle est encore en tête de liste
-        if self.current_path[0] == (self.player.x, self.player.y): self.current_path.pop(0)
-        if not self.current_path: return
-        
+        # Le chemin ne contient que les positions suivantes (une case répétée = attente réservée)
         nx, ny = self.current_path.pop(0)
         dx, dy = nx - self.player.x, ny - self.player.y
         
-        # Mouvement physique
-        if abs(dx) + abs(dy) != 1: return # Mouvement invalide (diagonale ou saut)
-        
-        if dx == -1: self.player.gauche(self.carte)
-        elif dx == 1: self.player.droite(self.carte)
-        elif dy == -1: self.player.haut(self.carte)
-        elif dy == 1: self.player.bas(self.carte)
-        
-        self._mark_progress()
+        # Mouvement physique (sinon : attente, ou mouvement invalide type diagonale/saut)
+        if abs(dx) + abs(dy) == 1:
+            if dx == -1: self.player.gauche(self.carte)
+            elif dx == 1: self.player.droite(self.carte)
+            elif dy == -1: self.player.haut(self.carte)
+            elif dy == 1: self.player.bas(self.carte)
+            self.occupation.placer(self.agent_id, (self.player.x, self.player.y))
+            self.game.monde_modifie()
+            self._mark_progress()
+
+        # Arrivé : on stationne sur place tant qu'on n'a pas de nouveau chemin
+        if not self.current_path: self._stationner()
 
     # --- ACTIONS ---
     def try_action(self) -> bool:
         self._ensure_bot_recette_valide() # être sûr que la recette est bonne avant de faire l'action
         p = self.player
+        adjacente = self.carte.station_adjacente
         
         # 1. BAC
-        adj_bac = p.est_adjacent_a(self.carte.pos_bacs)
+        adj_bac = adjacente(p.x, p.y, BAC)
         if p.item is None and adj_bac and self.bot_recette:
             target_req = self.bot_recette.requis[self.next_req_idx % len(self.bot_recette.requis)]
             wanted = target_req.nom
             nom_bac, _ = self.carte.bacs_config.get(adj_bac, ("?", 0))
 
             if nom_bac == "legume":
-                if wanted in ["tomate", "salade", "aubergine", "courgette", "poivron"]:
+                if wanted in LEGUMES_BAC:
                     p.item = prendre_legume(wanted)
+                    self.game.inventaire.prise(p.item)
                     self._mark_progress(); return True
                 # Si on est devant le mauvais bac, ne rien faire (évite de spammer)
                 return False
             
             if nom_bac != wanted: return False
             p.item = prendre_au_bac(nom_bac)
+            self.game.inventaire.prise(p.item)
             self._mark_progress(); return True
 
         # 2. DECOUPE
         # Vérification qu'on ne "vole" pas la découpe si quelqu'un d'autre l'utilise (géré par actions_en_cours dans main)
         # Mais ici on vérifie juste si c'est possible
-        if p.item and p.est_adjacent_a(self.carte.pos_decoupes) and self.bot_recette:
+        pos_dec = adjacente(p.x, p.y, DECOUPE)
+        if p.item and pos_dec and self.bot_recette:
             etat_requis = None
             for req in self.bot_recette.requis:
                 if req.nom == p.item.nom:
@@ -547,7 +720,6 @@ class Agent:
             if etat_requis == EtatAliment.COUPE and p.item.etat == EtatAliment.SORTI_DU_BAC:
                 from recette import TEMPS_COUPE
                 duree = TEMPS_COUPE.get(p.item.nom, 1.0)
-                pos_dec = p.est_adjacent_a(self.carte.pos_decoupes)
                 
                 # Vérifier si la station est occupée par l'autre agent (via main)
                 occupied = False
@@ -560,8 +732,8 @@ class Agent:
                     return True
 
         # 3. CUISSON
-        adj_four = p.est_adjacent_a(self.carte.pos_fours)
-        adj_poele = p.est_adjacent_a(self.carte.pos_poeles)
+        adj_four = adjacente(p.x, p.y, FOUR)
+        adj_poele = adjacente(p.x, p.y, POELE)
         pos_station = adj_four or adj_poele
 
         # Récupérer item cuit
@@ -572,6 +744,7 @@ class Agent:
                 if self.game.get_time() >= tfin:
                     p.item = alim
                     del self.game.cuissons[pos_station]
+                    self.game.inventaire.sortie_cuisson(alim)
                     self._mark_progress(); return True
 
         # Poser item à cuire
@@ -590,9 +763,10 @@ class Agent:
                     self._mark_progress(); return True
 
         # 4. ASSEMBLAGE (SECTION CORRIGÉE)
-        adj_ass = p.est_adjacent_a(self.carte.pos_assemblages)
+        adj_ass = adjacente(p.x, p.y, ASSEMBLAGE)
         if adj_ass:
             stock = self.carte.assemblage_stock.setdefault(adj_ass, [])
+            sig_stock = signature_aliments(stock)  # multiensemble packé, calculé une seule fois
             
             # --- CORRECTION 2 : NETTOYAGE FORCÉ ---
             # Si le stock actuel sur la table ne correspond à AUCUNE recette active,
@@ -602,57 +776,45 @@ class Agent:
                 est_plat_final = (len(stock) == 1 and any(r.nom == stock[0].nom for r in self.game.recettes) and stock[0].etat == EtatAliment.CUIT)
                 
                 if not est_plat_final:
-                    compatible_any = False
-                    for r in self.game.recettes:
-                        if items_completent_recette(stock, r): 
-                            compatible_any = True 
-                            break
-                        flags = matched_flags_for_recipe(stock, r)
-                        # Si tous les items présents sont utiles pour R
-                        if sum(flags) == len(stock): 
-                            compatible_any = True
-                            break
+                    # Le stock est utile s'il tient entièrement dans au moins une recette active
+                    compatible_any = bool(recettes_compatibles(sig_stock, self.game.recettes))
                     
                     if not compatible_any:
-                        stock.clear() # C'est une poubelle (recette annulée), on vide
+                        self.game.inventaire.vider_table(stock) # C'est une poubelle (recette annulée), on vide
+                        sig_stock = 0
                         self._mark_progress()
                         # On ne retourne pas True ici, car on veut peut-être poser notre item juste après
 
             # --- DÉPÔT / RÉCUPÉRATION ---
             
             # Cas A : C'est prêt pour MOI ?
-            if self.bot_recette and p.item is None and items_completent_recette(stock, self.bot_recette):
-                stock.clear()
-                stock.append(Aliment(nom=self.bot_recette.nom, etat=EtatAliment.CUIT))
+            if self.bot_recette and p.item is None and self.bot_recette.accepte(sig_stock):
+                self.game.inventaire.assembler(stock, Aliment(nom=self.bot_recette.nom, etat=EtatAliment.CUIT))
                 self._mark_progress(); return True
             
             # Cas B : C'est prêt pour n'importe qui ?
             if p.item is None and stock:
-                for r in self.game.recettes:
-                    if items_completent_recette(stock, r):
-                        stock.clear()
-                        stock.append(Aliment(nom=r.nom, etat=EtatAliment.CUIT))
-                        self._mark_progress(); return True
+                for r in recettes_compatibles(sig_stock, self.game.recettes):
+                    self.game.inventaire.assembler(stock, Aliment(nom=r.nom, etat=EtatAliment.CUIT))
+                    self._mark_progress(); return True
 
             # Cas C : Je pose mon ingrédient
             if p.item:
-                tentative = stock + [p.item]
-                recettes_possibles = recettes_possibles_pour_items(tentative, self.game.recettes)
+                sig_tentative = sig_stock + signature_aliments([p.item])
+                recettes_possibles = recettes_compatibles(sig_tentative, self.game.recettes)
 
                 if recettes_possibles:
-                    stock.append(p.item); p.item = None
-                    for r in recettes_possibles:
-                        if items_completent_recette(stock, r):
-                            stock.clear()
-                            stock.append(Aliment(nom=r.nom, etat=EtatAliment.CUIT))
-                            break
+                    # Le stock + mon item tient dans la 1re recette possible : on assemble
+                    r = recettes_possibles[0]
+                    self.game.inventaire.assembler(stock, Aliment(nom=r.nom, etat=EtatAliment.CUIT), depuis_main=p.item)
+                    p.item = None
                     self._mark_progress(); return True
                 
                 # --- CORRECTION 3 : STOCKAGE TAMPON ROBUSTE ---
                 # Si la table est vide, je pose mon item (même si ma recette vient de changer)
                 # Cela évite de garder un item inutile en main.
                 if not stock:
-                     stock.append(p.item); p.item = None
+                     self.game.inventaire.poser_sur_table(stock, p.item); p.item = None
                      self._mark_progress(); return True
                      
                 return False 
@@ -660,17 +822,17 @@ class Agent:
             # Cas D : Je récupère un plat fini
             if p.item is None and stock:
                 if len(stock) == 1 and any(r.nom == stock[0].nom for r in self.game.recettes):
-                    p.item = stock.pop(0)
+                    p.item = self.game.inventaire.prendre_sur_table(stock, 0)
                     self._mark_progress(); self._aller_adjacent("SERVICE")
                     return True
 
         # 5. SERVICE
         if p.item:
-            est_adj_service = any(abs(p.x - sx) + abs(p.y - sy) == 1 for (sx, sy) in self.carte.pos_services)
-            if est_adj_service:
+            if adjacente(p.x, p.y, SERVICE):
                 for idx, r in enumerate(self.game.recettes):
                     if p.item.nom == r.nom:
                         self.game.deliver_recipe(idx, r)
+                        self.game.inventaire.livraison(p.item)
                         p.item = None
                         if self.bot_recette is r or self.bot_recette not in self.game.recettes:
                             self.bot_recette = self.choisir_recette()
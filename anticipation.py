@@ -0,0 +1,132 @@
+# anticipation.py
+"""
+Stratégie « anticipation » : la recette est choisie en jouant la suite du match.
+
+Pour chaque recette candidate, on fixe la décision de l'agent puis on simule quelques secondes
+(toute l'équipe jouant ses propres stratégies), avant de revenir à l'état de départ par
+`Simulation.instantane` / `restaurer`. Les horizons croissent (2 s, 4 s, 8 s...) tant qu'il reste
+du temps : la recherche est interruptible et rend la meilleure décision du dernier horizon
+évalué en entier, ou l'ordre statique « complexe » si aucun ne l'a été.
+
+Le budget est un temps réel par tick de jeu, partagé par tous les agents qui décident pendant
+ce tick : un pas joué par l'interface Tk (main.Game._avancer) reste donc court, quel que soit le
+nombre d'agents. Seul un pas de simulation déjà commencé peut dépasser l'échéance (compté dans les stats).
+"""
+import time
+from typing import Dict, List, Optional, Sequence
+
+from recette import Recette
+
+STRATEGIE = "anticipation"
+STRATEGIE_ROLLOUT = "complexe"   # ordre des décisions prises pendant les simulations
+BUDGET_TICK_S = 0.02             # temps de calcul par tick de jeu
+HORIZONS_S = (2.0, 4.0, 8.0, 16.0)
+DT_ROLLOUT = 0.1
+POIDS_PROGRESSION = 0.5          # valeur d'une recette à moitié prête, en part de ses points
+ZONES_PRETES = ("mains", "tables", "cuisson")
+MARGE_PAS = 2.0                  # on garde de quoi finir un pas et restaurer l'état
+
+
+def progression(jeu, recette: Recette) -> float:
+    """Part des ingrédients de `recette` déjà dans leur état final (1.0 si le plat est prêt)."""
+    if recette not in jeu.recettes: return 0.0
+    if any(p.item is not None and p.item.nom == recette.nom for p in jeu.players): return 1.0
+    if any(len(s) == 1 and s[0].nom == recette.nom for s in jeu.carte.assemblage_stock.values()): return 1.0
+    zones = [jeu.inventaire.zones[z] for z in ZONES_PRETES]
+    pris: Dict[int, int] = {}
+    for c in recette.codes:
+        deja = pris.get(c, 0)
+        if sum(z.get(c, 0) for z in zones) > deja: pris[c] = deja + 1
+    return sum(pris.values()) / len(recette.codes)
+
+
+class RechercheAnticipation:
+    def __init__(self, jeu, budget_tick_s: float = BUDGET_TICK_S) -> None:
+        self.jeu = jeu
+        self.budget_tick_s = budget_tick_s
+        self.en_cours = False  # vrai pendant une simulation : les agents « anticipation » jouent l'ordre statique
+        self._tick = -1
+        self._echeance = 0.0
+        self._cout_pas_s = 0.0  # coût récent d'un pas (maximum à oubli progressif)
+        # Statistiques
+        self.decisions = 0
+        self.decisions_sans_budget = 0
+        self.noeuds = 0          # pas simulés
+        self.rollouts = 0
+        self.depassements = 0    # décisions rendues après l'échéance du tick
+        self.profondeur_totale = 0
+        self.duree_max_s = 0.0
+        self.depassement_max_s = 0.0
+
+    def choisir(self, agent, candidates: Sequence[Recette]) -> Recette:
+        """Meilleure candidate trouvée dans le budget (`candidates` est dans l'ordre de repli)."""
+        jeu = self.jeu
+        t0 = time.perf_counter()
+        if self._tick != jeu.tick_courant:
+            self._tick = jeu.tick_courant
+            self._echeance = t0 + self.budget_tick_s
+        echeance = self._echeance
+        self.decisions += 1
+        meilleure = candidates[0]
+        if t0 >= echeance:
+            self.decisions_sans_budget += 1
+            return meilleure
+
+        inst = jeu.instantane()
+        animations = [(p.anim_x, p.anim_y, p.moving) for p in jeu.players]
+        self.en_cours = True
+        try:
+            for horizon in HORIZONS_S:
+                valeurs: List[float] = []
+                for r in candidates:
+                    v = self._rollout(agent, r, horizon, echeance)
+                    jeu.restaurer(inst)
+                    if v is None: break
+                    valeurs.append(v)
+                if len(valeurs) < len(candidates): break  # horizon inachevé : on garde le précédent
+                # max() garde la première ex aequo, donc l'ordre de repli départage
+                meilleure = candidates[max(range(len(valeurs)), key=valeurs.__getitem__)]
+                self.profondeur_totale += 1
+                if jeu.current_sim_time + horizon >= jeu.duration_s: break
+        finally:
+            self.en_cours = False
+            for p, (ax, ay, mv) in zip(jeu.players, animations):
+                p.anim_x, p.anim_y, p.moving = ax, ay, mv
+
+        fin = time.perf_counter()
+        if fin > echeance:
+            self.depassements += 1
+            self.depassement_max_s = max(self.depassement_max_s, fin - echeance)
+        self.duree_max_s = max(self.duree_max_s, fin - t0)
+        return meilleure
+
+    def _rollout(self, agent, recette: Recette, horizon: float, echeance: float) -> Optional[float]:
+        """Valeur de `recette` pour `agent` à `horizon` secondes, ou None si le budget est épuisé."""
+        jeu = self.jeu
+        self.rollouts += 1
+        agent.bot_recette = recette
+        agent.next_req_idx = 0
+        agent.current_assembly = None
+        score0 = jeu.score
+        fin = min(jeu.current_sim_time + horizon, jeu.duration_s)
+        t = time.perf_counter()
+        while jeu.current_sim_time < fin:
+            # On s'arrête si le prochain pas (et la restauration) risque de finir après l'échéance
+            if t + MARGE_PAS * self._cout_pas_s >= echeance: return None
+            self.noeuds += 1
+            jeu.pas(DT_ROLLOUT)
+            t_avant, t = t, time.perf_counter()
+            self._cout_pas_s = max(0.9 * self._cout_pas_s, t - t_avant)
+        return (jeu.score - score0) + POIDS_PROGRESSION * progression(jeu, recette) * recette.difficulte_reelle
+
+    def stats(self) -> dict:
+        return {
+            "decisions": self.decisions,
+            "decisions_sans_budget": self.decisions_sans_budget,
+            "noeuds": self.noeuds,
+            "rollouts": self.rollouts,
+            "depassements": self.depassements,
+            "profondeur_moyenne": self.profondeur_totale / self.decisions if self.decisions else 0.0,
+            "duree_max_ms": self.duree_max_s * 1000,
+            "depassement_max_ms": self.depassement_max_s * 1000,
+        }
@@ -0,0 +1,122 @@
+# arret_sequentiel.py
+"""
+Arrêt séquentiel d'un balayage de benchmark : on s'arrête de générer des cartes dès que le
+classement des scénarios est établi.
+
+Les scores arrivent carte par carte (chaque carte est jouée par tous les scénarios). Pour chaque
+scénario, moyenne et variance sont tenues en flux (Welford) ; les intervalles de confiance sont
+obtenus par bootstrap sur les cartes déjà jouées. Comme tous les scénarios jouent les mêmes cartes,
+les comparaisons deux à deux portent sur les différences appariées (mêmes tirages de cartes), ce
+qui les tranche bien plus tôt que deux intervalles indépendants.
+
+Une comparaison est réglée quand l'intervalle de la différence ne contient pas 0 (tranchée), ou
+quand il tient entier dans ± `marge_equivalence` x le score moyen de la paire (équivalents : deux
+scénarios quasi à égalité ne seraient jamais départagés). Le balayage s'arrête quand tous les
+intervalles sont plus étroits que `largeur_cible`, ou quand toutes les comparaisons sont réglées.
+"""
+import math
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+LARGEUR_CIBLE = 60.0   # largeur d'intervalle visée, en points de score
+MARGE_EQUIVALENCE = 0.10  # écart négligeable, en part du score moyen de la paire
+NIVEAU = 0.95
+MIN_CARTES = 10        # en dessous, le bootstrap est trop instable pour décider
+NB_BOOTSTRAP = 2000
+
+
+class Welford:
+    """Moyenne et variance en flux (algorithme de Welford)."""
+    def __init__(self) -> None:
+        self.n = 0
+        self.moyenne = 0.0
+        self._m2 = 0.0
+
+    def ajouter(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.moyenne
+        self.moyenne += delta / self.n
+        self._m2 += delta * (x - self.moyenne)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def ecart_type(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class SuiviSequentiel:
+    def __init__(self, scenarios: Sequence[str], largeur_cible: float = LARGEUR_CIBLE, niveau: float = NIVEAU,
+                 min_cartes: int = MIN_CARTES, nb_bootstrap: int = NB_BOOTSTRAP, graine: int = 0,
+                 marge_equivalence: float = MARGE_EQUIVALENCE) -> None:
+        self.scenarios = list(scenarios)
+        self.largeur_cible = largeur_cible
+        self.marge_equivalence = marge_equivalence
+        self.niveau = niveau
+        self.min_cartes = min_cartes
+        self.nb_bootstrap = nb_bootstrap
+        self.rng = np.random.default_rng(graine)  # bootstrap reproductible
+        self.flux = {s: Welford() for s in self.scenarios}
+        self._scores: List[List[float]] = []  # une ligne par carte, une colonne par scénario
+        self._intervalles: Dict[str, Tuple[float, float]] = {}
+        self._differences: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+    @property
+    def nb_cartes(self) -> int:
+        return len(self._scores)
+
+    def ajouter_carte(self, scores: Dict[str, float]) -> None:
+        """Scores d'une carte, un par scénario ; les intervalles sont recalculés."""
+        ligne = [float(scores[s]) for s in self.scenarios]
+        for s, x in zip(self.scenarios, ligne):
+            self.flux[s].ajouter(x)
+        self._scores.append(ligne)
+        self._bootstrap()
+
+    def _bootstrap(self) -> None:
+        x = np.asarray(self._scores)
+        n = len(x)
+        # Mêmes tirages de cartes pour tous les scénarios : les différences restent appariées
+        moyennes = x[self.rng.integers(n, size=(self.nb_bootstrap, n))].mean(axis=1)
+        q = [(1 - self.niveau) / 2 * 100, (1 + self.niveau) / 2 * 100]
+        bas, haut = np.percentile(moyennes, q, axis=0)
+        self._intervalles = {s: (bas[i], haut[i]) for i, s in enumerate(self.scenarios)}
+        self._differences = {}
+        for i, j in combinations(range(len(self.scenarios)), 2):
+            b, h = np.percentile(moyennes[:, i] - moyennes[:, j], q)
+            self._differences[(self.scenarios[i], self.scenarios[j])] = (b, h)
+
+    def intervalle(self, scenario: str) -> Tuple[float, float]:
+        return self._intervalles[scenario]
+
+    def difference(self, a: str, b: str) -> Tuple[float, float]:
+        """Intervalle de moyenne(a) - moyenne(b)."""
+        if (a, b) in self._differences: return self._differences[(a, b)]
+        bas, haut = self._differences[(b, a)]
+        return -haut, -bas
+
+    def comparaisons_tranchees(self) -> int:
+        return sum(1 for b, h in self._differences.values() if b > 0 or h < 0)
+
+    def comparaisons_equivalentes(self) -> int:
+        n = 0
+        for (a, c), (b, h) in self._differences.items():
+            marge = self.marge_equivalence * (self.flux[a].moyenne + self.flux[c].moyenne) / 2
+            if b <= 0 <= h and -marge <= b and h <= marge: n += 1
+        return n
+
+    @property
+    def nb_comparaisons(self) -> int:
+        return len(self._differences)
+
+    def largeur_max(self) -> float:
+        return max(h - b for b, h in self._intervalles.values())
+
+    def arreter(self) -> bool:
+        if self.nb_cartes < self.min_cartes: return False
+        if self.largeur_max() <= self.largeur_cible: return True
+        return self.comparaisons_tranchees() + self.comparaisons_equivalentes() == self.nb_comparaisons
@@ -0,0 +1,62 @@
+# benchmark_anticipation.py
+"""
+Stratégie « anticipation » face à l'ordre statique « complexe », selon le budget de calcul
+par tick : score moyen, nœuds (pas simulés) et rollouts par match, profondeur atteinte,
+décisions rendues hors budget (et de combien au pire) et pire temps de décision.
+
+Le budget est un temps réel : les résultats de l'anticipation varient d'une machine à l'autre.
+"""
+import time
+
+from benchmark_viz import HeadlessGame
+from graines import GrainesMatch
+from map_generator import generate_map
+
+BUDGETS_S = [0.005, 0.02, 0.05]
+EQUIPES = [1, 2]
+DUREE_S = 60
+
+
+def jouer(cartes, strategies, budget_s: float = 0.0):
+    scores, stats = [], []
+    t0 = time.perf_counter()
+    for g, (grille, s1, s2) in cartes:
+        game = HeadlessGame(grille, [s1, s2], strategies, DUREE_S, graine=g.graine)
+        game.anticipation.budget_tick_s = budget_s
+        res = game.run()
+        scores.append(res["score"])
+        stats.append(res["anticipation"])
+    return sum(scores) / len(scores), stats, time.perf_counter() - t0
+
+
+def mesurer(nb_cartes: int = 20, graine: int = 0):
+    graines = [GrainesMatch(graine + i) for i in range(nb_cartes)]
+    cartes = [(g, generate_map(rng=g.carte())) for g in graines]
+
+    resultats = []
+    for n in EQUIPES:
+        score, _, duree = jouer(cartes, ["complexe"] * n)
+        resultats.append((f"complexe x{n}", score, None, duree))
+        for budget in BUDGETS_S:
+            score, stats, duree = jouer(cartes, ["anticipation"] * n, budget)
+            resultats.append((f"anticipation x{n} {budget * 1000:.0f} ms", score, stats, duree))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Scénario':>24} | {'Score':>6} | {'Nœuds/match':>11} | {'Rollouts':>8} | {'Prof.':>5} | "
+          f"{'Hors budget':>11} | {'+ms':>5} | {'Max ms':>6} | {'Durée s':>7}")
+    for nom, score, stats, duree in mesurer():
+        if stats is None:
+            print(f"{nom:>24} | {score:6.1f} | {'-':>11} | {'-':>8} | {'-':>5} | {'-':>11} | {'-':>5} | {'-':>6} | {duree:7.1f}")
+            continue
+        n = len(stats)
+        noeuds = sum(s["noeuds"] for s in stats) / n
+        rollouts = sum(s["rollouts"] for s in stats) / n
+        prof = sum(s["profondeur_moyenne"] for s in stats) / n
+        decisions = sum(s["decisions"] for s in stats)
+        hors = sum(s["depassements"] for s in stats)
+        pire = max(s["duree_max_ms"] for s in stats)
+        exces = max(s["depassement_max_ms"] for s in stats)
+        print(f"{nom:>24} | {score:6.1f} | {noeuds:11.0f} | {rollouts:8.1f} | {prof:5.2f} | "
+              f"{hors:>5}/{decisions:<5} | {exces:5.1f} | {pire:6.1f} | {duree:7.1f}")
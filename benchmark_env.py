@@ -0,0 +1,42 @@
+# benchmark_env.py
+"""
+Débit de l'environnement d'apprentissage (`EnvsCuisine`) : pas d'environnement par seconde
+selon le nombre de cuisines par processus, pilote seul ou accompagné d'un partenaire scripté.
+
+Les actions sont tirées d'avance (politique aléatoire) pour ne mesurer que reset/step. Les
+relances automatiques des cuisines terminées (génération de la carte comprise) sont chronométrées
+à part : le débit des pas les exclut, leur coût est donné à côté. Sans cela, le débit à 1 cuisine
+mesurerait surtout les relances (un match de 60 s fait 600 pas), et presque aucune à 64 cuisines.
+"""
+import time
+
+import numpy as np
+
+from environnement import EnvsCuisine, NB_ACTIONS
+
+NB_ENVS = [1, 16, 64]
+SCENARIOS = [[], ["complexe"]]
+PAS_TOTAL = 8000  # pas d'environnement par mesure (toutes cuisines confondues)
+
+
+def mesurer(graine: int = 0):
+    resultats = []
+    for partenaires in SCENARIOS:
+        for n in NB_ENVS:
+            envs = EnvsCuisine(n, partenaires=partenaires)
+            envs.reset(graine)
+            actions = np.random.default_rng(graine).integers(NB_ACTIONS, size=(max(1, PAS_TOTAL // n), n))
+            t0 = time.perf_counter()
+            for a in actions:
+                envs.step(a)
+            duree_pas = time.perf_counter() - t0 - envs.duree_resets_s
+            ms_reset = envs.duree_resets_s / envs.nb_resets * 1000 if envs.nb_resets else None
+            resultats.append(("+".join(["pilote"] + partenaires), n, actions.size / duree_pas, envs.nb_resets, ms_reset))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Équipe':>16} | {'Envs':>4} | {'Pas/s':>8} | {'Resets':>6} | {'ms/reset':>8}")
+    for nom, n, debit, resets, ms_reset in mesurer():
+        ms = "-" if ms_reset is None else f"{ms_reset:.1f}"
+        print(f"{nom:>16} | {n:>4} | {debit:8.0f} | {resets:>6} | {ms:>8}")
@@ -0,0 +1,47 @@
+# benchmark_equipes.py
+"""
+Passage à l'échelle des équipes : ticks simulés par seconde selon le nombre d'agents.
+
+Les équipes de 4, 8 ou 16 agents ne tiennent pas dans la carte 8x12 par défaut : on génère
+des cartes plus grandes (avec plus de stations) et on complète les spawns avec `extra_spawns`.
+"""
+import time
+
+from benchmark_viz import HeadlessGame
+from graines import GrainesMatch
+from map_generator import generate_map, extra_spawns
+
+TAILLES_EQUIPE = [1, 2, 4, 8, 16]
+DUREE_S = 60
+DT = 0.1  # pas de temps de HeadlessGame.run
+
+
+def generer_grande_carte(rng=None):
+    return generate_map(rows=14, cols=20, nb_bacs=7, nb_fours=4, nb_decoupes=4,
+                        nb_services=4, nb_assemblages=4, nb_poeles=4, rng=rng)
+
+
+def mesurer(nb_cartes: int = 3, strategie: str = "complexe", graine: int = 0):
+    graines = [GrainesMatch(graine + i) for i in range(nb_cartes)]
+    cartes = [generer_grande_carte(g.carte()) for g in graines]
+    ticks_par_match = int(round(DUREE_S / DT))
+
+    resultats = []
+    for n in TAILLES_EQUIPE:
+        duree = 0.0
+        score = 0
+        for g, (grille, s1, s2) in zip(graines, cartes):
+            spawns = extra_spawns(grille, [s1, s2], n, rng=g.spawns())
+            game = HeadlessGame(grille, spawns, [strategie] * n, DUREE_S, graine=g.graine)
+            t0 = time.perf_counter()
+            res = game.run()
+            duree += time.perf_counter() - t0
+            score += res["score"]
+        resultats.append((n, ticks_par_match * nb_cartes / duree, score / nb_cartes))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Agents':>6} | {'Ticks/s':>9} | {'Agent-ticks/s':>13} | {'Score moyen':>11}")
+    for n, tps, score in mesurer():
+        print(f"{n:>6} | {tps:9.0f} | {tps * n:13.0f} | {score:11.1f}")
@@ -0,0 +1,46 @@
+# benchmark_lot.py
+"""
+Débit du moteur par lots (`SimulationLot`) face à la boucle `HeadlessGame.run` :
+secondes simulées par seconde réelle, et score moyen de chaque moteur sur les mêmes cartes.
+
+Chaque copie d'une carte rejoue la graine de son match : en solo, le lot donne les scores de la
+boucle ; en équipe, ses agents ne se gênent pas. La colonne « Écart » donne l'écart des scores moyens.
+"""
+import time
+
+from benchmark_viz import HeadlessGame
+from graines import GrainesMatch
+from map_generator import generate_map
+from simulation_lot import SimulationLot
+
+SCENARIOS = [["naive"], ["simple"], ["complexe"], ["simple", "simple"], ["complexe", "complexe"]]
+DUREE_S = 60
+
+
+def mesurer(nb_cartes: int = 20, copies: int = 50, graine: int = 0):
+    graines = [GrainesMatch(graine + i) for i in range(nb_cartes)]
+    cartes = [generate_map(rng=g.carte()) for g in graines]
+
+    resultats = []
+    for strats in SCENARIOS:
+        t0 = time.perf_counter()
+        scores = [HeadlessGame(grille, [s1, s2], strats, DUREE_S, graine=g.graine).run()["score"]
+                  for g, (grille, s1, s2) in zip(graines, cartes)]
+        debit_boucle = nb_cartes * DUREE_S / (time.perf_counter() - t0)
+
+        lot = SimulationLot([(g, [s1, s2]) for g, s1, s2 in cartes] * copies, strats, DUREE_S,
+                            graines=[g.graine for g in graines] * copies)
+        t0 = time.perf_counter()
+        res = lot.run()
+        debit_lot = lot.nb_cuisines * DUREE_S / (time.perf_counter() - t0)
+
+        resultats.append(("/".join(strats), debit_boucle, debit_lot,
+                          sum(scores) / len(scores), sum(r["score"] for r in res) / len(res)))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Scénario':>18} | {'Boucle s/s':>10} | {'Lot s/s':>9} | {'Gain':>5} | {'Score boucle':>12} | {'Score lot':>9} | {'Écart':>6}")
+    for nom, boucle, lot, s_boucle, s_lot in mesurer():
+        print(f"{nom:>18} | {boucle:10.0f} | {lot:9.0f} | {lot / boucle:4.1f}x | {s_boucle:12.1f} | {s_lot:9.1f} | "
+              f"{s_lot / s_boucle - 1:+6.0%}")
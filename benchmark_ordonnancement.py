@@ -0,0 +1,37 @@
+# benchmark_ordonnancement.py
+"""
+Ordonnanceur central (stratégie « ordonnance ») face aux stratégies individuelles :
+score par minute, recettes livrées par minute et temps d'inactivité, selon la taille de l'équipe.
+"""
+from benchmark_viz import HeadlessGame
+from graines import GrainesMatch
+from map_generator import generate_map, extra_spawns
+
+STRATEGIES = ["naive", "simple", "complexe", "ordonnance"]
+TAILLES_EQUIPE = [1, 2, 3, 4]
+DUREE_S = 60
+
+
+def mesurer(nb_cartes: int = 30, graine: int = 0):
+    graines = [GrainesMatch(graine + i) for i in range(nb_cartes)]
+    cartes = [generate_map(rng=g.carte()) for g in graines]
+
+    resultats = []
+    for n in TAILLES_EQUIPE:
+        for strategie in STRATEGIES:
+            score = recettes = idle = 0.0
+            for g, (grille, s1, s2) in zip(graines, cartes):
+                spawns = extra_spawns(grille, [s1, s2], n, rng=g.spawns())
+                res = HeadlessGame(grille, spawns, [strategie] * n, DUREE_S, graine=g.graine).run()
+                score += res["score"]
+                recettes += res["recettes_count"]
+                idle += res["idle_pct"]
+            minutes = nb_cartes * DUREE_S / 60
+            resultats.append((n, strategie, score / minutes, recettes / minutes, idle / nb_cartes))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Agents':>6} | {'Stratégie':>10} | {'Score/min':>9} | {'Recettes/min':>12} | {'Idle %':>6}")
+    for n, strategie, score, recettes, idle in mesurer():
+        print(f"{n:>6} | {strategie:>10} | {score:9.1f} | {recettes:12.2f} | {idle:6.1f}")
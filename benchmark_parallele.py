@@ -0,0 +1,30 @@
+# benchmark_parallele.py
+"""
+Balayage `benchmark_viz` réparti sur plusieurs processus (`jouer_matchs`) : durée, matchs par
+seconde et gain face au mode séquentiel, en vérifiant que les résultats sont identiques.
+"""
+import os
+import time
+
+from benchmark_viz import SCENARIOS, DUREE_S, jouer_matchs
+
+PROCESSUS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def mesurer(nb_cartes: int = 20, graine: int = 0):
+    jobs = [(graine + i, k, DUREE_S) for i in range(nb_cartes) for k in range(len(SCENARIOS))]
+
+    resultats, reference, duree_ref = [], None, None
+    for n in PROCESSUS:
+        t0 = time.perf_counter()
+        res = list(jouer_matchs(jobs, processus=n))
+        duree = time.perf_counter() - t0
+        if reference is None: reference, duree_ref = res, duree
+        resultats.append((n, duree, len(jobs) / duree, duree_ref / duree, res == reference))
+    return resultats
+
+
+if __name__ == "__main__":
+    print(f"{'Processus':>9} | {'Durée s':>7} | {'Matchs/s':>8} | {'Gain':>5} | {'Identique':>9}")
+    for n, duree, debit, gain, identique in mesurer():
+        print(f"{n:>9} | {duree:7.1f} | {debit:8.1f} | {gain:4.1f}x | {'oui' if identique else 'NON':>9}")
@@ -0,0 +1,46 @@
+# benchmark_pathfinding.py
+"""
+Micro-benchmark du BFS de l'agent : nœuds explorés par seconde.
+
+Pour chaque carte générée et chaque case de sol, on lance `bfs_path` vers un but inatteignable
+avec un obstacle dynamique (ce qui désactive le raccourci par la table toutes-paires) :
+le BFS parcourt alors toute la composante connexe, dont la taille est connue à l'avance.
+"""
+import random
+import time
+
+from agent import bfs_path
+from carte import Carte
+from map_generator import generate_map
+from recette import ALIMENTS_BAC
+
+HORS_CARTE = (-1, -1)
+
+
+def mesurer_bfs(nb_cartes: int = 20, repetitions: int = 5, graine: int = 0) -> float:
+    """Retourne le débit du BFS en nœuds/seconde (meilleure des `repetitions` passes)."""
+    rng = random.Random(graine)
+    cas = []
+    for _ in range(nb_cartes):
+        grille, _, _ = generate_map(rng=rng)
+        carte = Carte(grille, largeur=600, hauteur=600, textures=False)
+        carte.assigner_bacs(ALIMENTS_BAC)
+        table = carte.table_chemins
+        for i, start in enumerate(table.cases):
+            noeuds = int((table.dist[i] >= 0).sum())
+            cas.append((carte, start, noeuds))
+
+    # Meilleure des répétitions (moins sensible au bruit de la machine)
+    total_noeuds = sum(noeuds for _, _, noeuds in cas)
+    meilleure = float("inf")
+    for _ in range(repetitions):
+        t0 = time.perf_counter()
+        for carte, start, _ in cas:
+            bfs_path(carte, start, [HORS_CARTE], {HORS_CARTE})
+        meilleure = min(meilleure, time.perf_counter() - t0)
+    return total_noeuds / meilleure
+
+
+if __name__ == "__main__":
+    debit = mesurer_bfs()
+    print(f"BFS : {debit / 1e6:.2f} M nœuds/s")
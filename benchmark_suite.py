@@ -0,0 +1,313 @@
+# benchmark_suite.py
+"""
+Suite de benchmarks des chemins chauds, comparée à une référence enregistrée.
+
+Micro : `bfs_path` (table toutes-paires, puis BFS avec obstacle), `generate_map`, les aides de
+recettes d'`agent.py`, `Agent._planifier` et `Carte.dessiner` (canevas factice, carte sans
+textures). Macro : matchs complets `HeadlessGame.run`.
+
+Chaque benchmark est mesuré en plusieurs passes, entrelacées d'un benchmark à l'autre (une passe
+de chacun, puis on recommence) : une variation de vitesse de la machine pendant la mesure se
+retrouve dans le bruit de tous au lieu de fausser un seul benchmark. On garde la médiane du temps
+par opération.
+
+Chaque passe est précédée d'un étalon (boucle Python fixe) : les comparaisons portent sur le
+temps relatif à l'étalon mesuré juste avant, ce qui retire l'essentiel des variations de vitesse
+de la machine d'un lancement à l'autre (fréquence, charge). Le bruit retenu est l'incertitude de
+cette médiane relative ; face à la référence, un écart n'est jugé significatif que s'il dépasse à
+la fois SEUIL_MIN et FACTEUR_BRUIT fois le bruit cumulé des deux mesures. La référence reste
+propre à une machine.
+
+    python benchmark_suite.py            # mesure et compare à la référence, si elle existe
+    python benchmark_suite.py --sauver   # mesure et enregistre la référence
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from agent import bfs_path, items_completent_recette, matched_flags_for_recipe, recettes_possibles_pour_items
+from benchmark_viz import HeadlessGame
+from carte import Carte
+from graines import GrainesMatch
+from map_generator import generate_map
+from recette import ALIMENTS_BAC, RECETTES_POOL, Aliment, EtatAliment
+
+REFERENCE_DEFAUT = os.path.join("cache", "benchmarks", "reference.json")
+SEUIL_MIN = 0.05      # écart relatif en dessous duquel on ne conclut jamais
+FACTEUR_BRUIT = 3.0   # l'écart doit dépasser ce multiple du bruit cumulé
+GRAINE = 0
+PASSES = 9
+
+
+class Benchmark(NamedTuple):
+    nom: str
+    genre: str         # "micro" ou "macro"
+    preparer: Callable[[], Callable[[], float]]  # rend une passe, qui rend sa durée mesurée (s)
+    operations: int    # opérations par passe
+
+
+# ---------------------------------------------------
+# PRÉPARATIONS (hors mesure)
+# ---------------------------------------------------
+def _etalon():
+    def passe() -> float:
+        t0 = time.perf_counter()
+        d: Dict[int, int] = {}
+        for i in range(100_000):
+            d[i & 1023] = d.get(i & 1023, 0) + i
+        return time.perf_counter() - t0
+    return passe
+
+
+def _cartes(nb: int) -> List[Carte]:
+    rng = random.Random(GRAINE)
+    cartes = []
+    for _ in range(nb):
+        grille, _, _ = generate_map(rng=rng)
+        carte = Carte(grille, largeur=600, hauteur=600, textures=False)
+        carte.assigner_bacs(ALIMENTS_BAC)
+        cartes.append(carte)
+    return cartes
+
+
+def _bfs(avec_obstacle: bool, nb_requetes: int):
+    rng = random.Random(GRAINE)
+    requetes = []
+    for carte in _cartes(5):
+        cases = carte.table_chemins.cases
+        for _ in range(nb_requetes // 5):
+            start, but = rng.sample(cases, 2)
+            # Un obstacle dynamique hors chemin suffit à désactiver le raccourci de la table
+            requetes.append((carte, start, [but], {(-1, -1)} if avec_obstacle else None))
+
+    def passe() -> float:
+        t0 = time.perf_counter()
+        for carte, start, buts, obstacles in requetes:
+            bfs_path(carte, start, buts, set(obstacles) if obstacles else None)
+        return time.perf_counter() - t0
+    return passe
+
+
+def _generation():
+    graines = [GrainesMatch(GRAINE + i) for i in range(2)]
+
+    def passe() -> float:
+        t0 = time.perf_counter()
+        for g in graines: generate_map(rng=g.carte())
+        return time.perf_counter() - t0
+    return passe
+
+
+def _recettes(tours: int):
+    # Mains / tables partiellement remplies pour chaque recette, plus un intrus
+    commandes = RECETTES_POOL[:4]
+    cas = []
+    for r in RECETTES_POOL:
+        for k in range(len(r.requis) + 1):
+            items = [Aliment(req.nom, req.etat_final) for req in r.requis[:k]]
+            cas.append((items, r))
+            cas.append((items + [Aliment("pain", EtatAliment.SORTI_DU_BAC)], r))
+
+    def passe() -> float:
+        t0 = time.perf_counter()
+        for _ in range(tours):
+            for items, r in cas:
+                recettes_possibles_pour_items(items, commandes)
+                items_completent_recette(items, r)
+                matched_flags_for_recipe(items, r)
+        return time.perf_counter() - t0
+    return passe
+
+
+def _etats_match(strategies, nb: int):
+    """`nb` instantanés répartis sur un match, pour rejouer des décisions dans des états variés."""
+    g = GrainesMatch(GRAINE)
+    grille, s1, s2 = generate_map(rng=g.carte())
+    jeu = HeadlessGame(grille, [s1, s2], strategies, 60, graine=g.graine)
+    etats = []
+    while len(etats) < nb and not jeu.termine:
+        for _ in range(20): jeu.pas()
+        etats.append(jeu.instantane())
+    return jeu, etats
+
+
+def _planifier(tours: int):
+    jeu, etats = _etats_match(["complexe", "complexe"], 25)
+
+    def passe() -> float:
+        total = 0.0
+        for inst in etats * tours:
+            jeu.restaurer(inst)
+            for agent in jeu.agents:
+                t0 = time.perf_counter()
+                agent._planifier()
+                total += time.perf_counter() - t0
+        return total
+    return passe
+
+
+class _CanevasFactice:
+    """Avale les appels de dessin : on ne mesure que le parcours de la carte côté Python."""
+    def __getattr__(self, nom):
+        return lambda *a, **k: None
+
+
+def _dessin(tours: int):
+    cartes = _cartes(5)
+    canevas = _CanevasFactice()
+
+    def passe() -> float:
+        t0 = time.perf_counter()
+        for carte in cartes * tours: carte.dessiner(canevas)
+        return time.perf_counter() - t0
+    return passe
+
+
+def _match(strategies, evenementiel: bool = False):
+    graines = [GrainesMatch(GRAINE + i) for i in range(2)]
+    cartes = [generate_map(rng=g.carte()) for g in graines]
+
+    def passe() -> float:
+        t0 = time.perf_counter()
+        for g, (grille, s1, s2) in zip(graines, cartes):
+            HeadlessGame(grille, [s1, s2], strategies, 60, graine=g.graine).run(evenementiel=evenementiel)
+        return time.perf_counter() - t0
+    return passe
+
+
+ETALON = Benchmark("étalon", "étalon", _etalon, 100_000)
+
+BENCHMARKS = [
+    Benchmark("bfs_path (table)", "micro", lambda: _bfs(False, 2000), 2000),
+    Benchmark("bfs_path (obstacle)", "micro", lambda: _bfs(True, 2000), 2000),
+    Benchmark("generate_map", "micro", _generation, 2),
+    Benchmark("aides recettes", "micro", lambda: _recettes(100), 100 * 2 * sum(len(r.requis) + 1 for r in RECETTES_POOL)),
+    Benchmark("Agent._planifier", "micro", lambda: _planifier(4), 4 * 50),
+    Benchmark("Carte.dessiner", "micro", lambda: _dessin(20), 20 * 5),
+    Benchmark("match complexe x2", "macro", lambda: _match(["complexe", "complexe"]), 2),
+    Benchmark("match simple", "macro", lambda: _match(["simple"]), 2),
+    Benchmark("match simple évén.", "macro", lambda: _match(["simple"], True), 2),
+]
+
+
+# ---------------------------------------------------
+# MESURE ET COMPARAISON
+# ---------------------------------------------------
+def mesurer(benchmarks: List[Benchmark] = BENCHMARKS, filtre: Optional[str] = None,
+            passes: int = PASSES) -> Dict[str, dict]:
+    benchmarks = [ETALON] + [b for b in benchmarks if not filtre or filtre in b.nom]
+    fonctions = [b.preparer() for b in benchmarks]
+    for f in fonctions: f()  # échauffement (caches, tables de chemins)
+    etalon = fonctions[0]
+    temps: List[List[float]] = [[] for _ in benchmarks]
+    relatifs: List[List[float]] = [[] for _ in benchmarks]
+    for _ in range(passes):
+        for b, f, t, r in zip(benchmarks, fonctions, temps, relatifs):
+            e = etalon() / ETALON.operations
+            t.append(f() / b.operations)
+            r.append(t[-1] / e)
+
+    resultats = {}
+    for b, t, r in zip(benchmarks, temps, relatifs):
+        relatif = statistics.median(r)
+        # Incertitude de la médiane : écart-type estimé par l'écart absolu médian (x 1.4826),
+        # divisé par racine(n) et multiplié par 1.2533 (efficacité de la médiane)
+        ecart = statistics.median(abs(x - relatif) for x in r)
+        bruit = 1.4826 * 1.2533 * ecart / math.sqrt(passes)
+        resultats[b.nom] = {
+            "genre": b.genre,
+            "mediane_s": statistics.median(t),
+            "min_s": min(t),
+            "relatif": relatif,
+            "bruit": bruit / relatif if relatif > 0 else 0.0,
+            "passes": passes,
+            "operations": b.operations,
+        }
+    return resultats
+
+
+def comparer(reference: Dict[str, dict], actuel: Dict[str, dict]):
+    """
+    (nom, référence s, actuel s, écart, seuil, verdict) pour chaque benchmark mesuré. L'écart porte
+    sur les temps relatifs à l'étalon ; les durées brutes ne sont données qu'à titre indicatif.
+    """
+    lignes = []
+    for nom, r in actuel.items():
+        if r["genre"] == "étalon": continue
+        ref = reference.get(nom)
+        if ref is None:
+            lignes.append((nom, None, r["mediane_s"], None, None, "nouveau"))
+            continue
+        ecart = r["relatif"] / ref["relatif"] - 1
+        seuil = max(SEUIL_MIN, FACTEUR_BRUIT * math.hypot(ref["bruit"], r["bruit"]))
+        if ecart > seuil: verdict = "PLUS LENT"
+        elif ecart < -seuil: verdict = "plus rapide"
+        else: verdict = "="
+        lignes.append((nom, ref["mediane_s"], r["mediane_s"], ecart, seuil, verdict))
+    return lignes
+
+
+def _duree(s: Optional[float]) -> str:
+    if s is None: return "-"
+    if s >= 1: return f"{s:.2f} s"
+    if s >= 1e-3: return f"{s * 1e3:.2f} ms"
+    return f"{s * 1e6:.1f} µs"
+
+
+def sauver(resultats: Dict[str, dict], chemin: str = REFERENCE_DEFAUT) -> None:
+    os.makedirs(os.path.dirname(chemin) or ".", exist_ok=True)
+    contenu = {
+        "machine": platform.platform(),
+        "processeur": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "resultats": resultats,
+    }
+    with open(chemin, "w", encoding="utf-8") as f:
+        json.dump(contenu, f, indent=2, ensure_ascii=False)
+
+
+def charger(chemin: str = REFERENCE_DEFAUT) -> Optional[dict]:
+    if not os.path.exists(chemin): return None
+    with open(chemin, encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reference", default=REFERENCE_DEFAUT, help="fichier JSON de référence")
+    parser.add_argument("--sauver", action="store_true", help="enregistrer cette mesure comme référence")
+    parser.add_argument("--filtre", help="ne mesurer que les benchmarks dont le nom contient ce texte")
+    args = parser.parse_args()
+
+    actuel = mesurer(filtre=args.filtre)
+    reference = charger(args.reference)
+    if reference is None or args.sauver:
+        print(f"{'Benchmark':>24} | {'Genre':>6} | {'Médiane/op':>11} | {'Bruit':>6}")
+        for nom, r in actuel.items():
+            print(f"{nom:>24} | {r['genre']:>6} | {_duree(r['mediane_s']):>11} | {r['bruit']:6.1%}")
+        # Avec --filtre, seuls les benchmarks mesurés remplacent les leurs dans la référence
+        anciens = reference["resultats"] if reference is not None and args.filtre else {}
+        sauver({**anciens, **actuel}, args.reference)
+        print(f"Référence enregistrée dans {args.reference}.")
+        sys.exit(0)
+
+    if reference["machine"] != platform.platform():
+        print(f"Attention : référence mesurée sur une autre machine ({reference['machine']}).")
+    vitesse = reference["resultats"][ETALON.nom]["mediane_s"] / actuel[ETALON.nom]["mediane_s"]
+    print(f"Référence du {reference['date']} ; machine {vitesse:.2f}x aussi rapide qu'alors (étalon)")
+    print(f"{'Benchmark':>24} | {'Référence':>11} | {'Actuel':>11} | {'Écart':>7} | {'Seuil':>6} | Verdict")
+    regressions = 0
+    for nom, ref, act, ecart, seuil, verdict in comparer(reference["resultats"], actuel):
+        e = "-" if ecart is None else f"{ecart:+.1%}"
+        s = "-" if seuil is None else f"{seuil:.1%}"
+        print(f"{nom:>24} | {_duree(ref):>11} | {_duree(act):>11} | {e:>7} | {s:>6} | {verdict}")
+        regressions += verdict == "PLUS LENT"
+    sys.exit(1 if regressions else 0)
@@ -1,184 +1,191 @@
+import os
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby, islice
+from typing import Optional
+
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
 # Imports du jeu
-from recette import (
-    Aliment, EtatAliment, Recette, ALIMENTS_BAC, 
-    nouvelle_recette
-)
-from carte import Carte
-from player import Player
-from agent import Agent
 from map_generator import generate_map
+from simulation import Simulation
+from graines import GrainesMatch
+from stockage_resultats import CHEMIN_DEFAUT, StockResultats
+from arret_sequentiel import LARGEUR_CIBLE, SuiviSequentiel
+from table_chemins import DOSSIER_CACHE, hash_grille
 
 # =============================================================================
 # MOTEUR DE SIMULATION HEADLESS
 # =============================================================================
 
-class HeadlessCarte(Carte):
-    def _charger_textures(self, w, h): pass
-    def dessiner(self, canvas): pass
-
-class HeadlessPlayer(Player):
-    def _load_sprite_sheet(self, path): pass
-    def dessiner(self, canvas, carte): pass
-
-class HeadlessGame:
-    def __init__(self, grille_data, spawn_positions, strategies: list, duration_s: int):
-        self.duration_s = duration_s
-        self.current_sim_time = 0.0
-        
-        # Initialisation Carte
-        self.carte = HeadlessCarte(grille_data, largeur=600, hauteur=600)
-        self.carte.assigner_bacs(ALIMENTS_BAC)
-        
-        self.score = 0
-        self.recettes = [nouvelle_recette() for _ in range(3)]
-        self.recettes_livrees = []
-        self.cuissons = {} 
-        self.score_history = [(0.0, 0)]
-        
-        self.stats_steps = 0
-        self.time_working_total = 0.0
-        self.time_walking_total = 0.0
-        self.time_idle_total = 0.0
-
-        self.actions_en_cours = {} 
-
-        self.players = []
-        self.agents = []
-
-        # --- CRÉATION AGENTS SELON LA LISTE DE STRATÉGIES ---
-        nb_agents = len(strategies)
-        # On limite au nombre de spawns disponibles (généralement 2)
-        limit_agents = min(nb_agents, len(spawn_positions))
-
-        for i in range(limit_agents):
-            sx, sy = spawn_positions[i]
-            p = HeadlessPlayer(sx, sy)
-            self.players.append(p)
-            
-            strat = strategies[i]
-            a = Agent(self, p, strat, agent_id=i)
-            # Pour la simulation, on accélère un peu la prise de décision
-            a.move_every_ticks = 1.0 
-            self.agents.append(a)
-
-        # Liaison partenaires
-        if limit_agents == 2:
-            self.agents[0].partner = self.agents[1]
-            self.agents[1].partner = self.agents[0]
-        elif limit_agents == 1:
-            self.agents[0].partner = None
-
-    def get_time(self) -> float:
-        return self.current_sim_time
-
-    def trigger_action_bloquante(self, agent, type_action, pos, aliment, duree):
-        start = self.current_sim_time
-        self.actions_en_cours[agent] = (type_action, pos, aliment, start, start + duree)
-
-    def start_cooking(self, pos, aliment, duree):
-        self.cuissons[pos] = (aliment, self.current_sim_time, self.current_sim_time + duree)
-
-    def deliver_recipe(self, index, recette):
-        self.score += recette.difficulte_reelle
-        self.recettes_livrees.append((recette.nom, recette.complexite))
-        self.score_history.append((self.current_sim_time, self.score))
-        self.recettes.pop(index)
-        self.recettes.append(nouvelle_recette())
-
-    def run(self):
-        dt = 0.1
-        while self.current_sim_time < self.duration_s:
-            
-            # Physique
-            for pos, (alim, t0, tfin) in list(self.cuissons.items()):
-                if self.current_sim_time >= tfin and alim.etat != EtatAliment.CUIT:
-                    alim.transformer(EtatAliment.CUIT)
-
-            prev_positions = [(p.x, p.y) for p in self.players]
-            agents_occupes = set()
-            
-            # Actions bloquantes
-            for agent in list(self.actions_en_cours.keys()):
-                type_act, _, aliment, _, t_fin = self.actions_en_cours[agent]
-                if self.current_sim_time >= t_fin:
-                    if type_act == "DECOUPE": aliment.transformer(EtatAliment.COUPE)
-                    del self.actions_en_cours[agent]
-                    agent._mark_progress()
-                else:
-                    agents_occupes.add(agent)
-                    self.time_working_total += dt
-
-            # Tick Agents
-            for agent in self.agents:
-                if agent not in agents_occupes:
-                    agent.tick()
-
-            # Stats Mouvement
-            for i, p in enumerate(self.players):
-                if (p.x, p.y) != prev_positions[i]:
-                    self.stats_steps += 1
-                    self.time_walking_total += dt
-                elif self.agents[i] not in agents_occupes:
-                    self.time_idle_total += dt
-
-            self.current_sim_time += dt
-        
-        # Résultats
-        efficiency = (self.stats_steps / self.score) if self.score > 0 else 0
-        avg_comp = 0
-        if self.recettes_livrees:
-            avg_comp = sum(c for _, c in self.recettes_livrees) / len(self.recettes_livrees)
-
-        nb = len(self.agents)
-        total_pool = self.duration_s * nb if nb > 0 else 1
-
-        return {
-            "score": self.score,
-            "nb_agents": nb,
-            "recettes_count": len(self.recettes_livrees),
-            "avg_complexity": avg_comp,
-            "history": self.score_history,
-            "efficiency_cost": efficiency,
-            "walking_pct": (self.time_walking_total / total_pool) * 100,
-            "working_pct": (self.time_working_total / total_pool) * 100,
-            "idle_pct": (self.time_idle_total / total_pool) * 100
-        }
+class HeadlessGame(Simulation):
+    """
+    Simulation sans rendu, agents accélérés (un pas de déplacement par tick). Les benchmarks
+    rejouent les mêmes cartes : les tables de chemins sont sauvegardées dans DOSSIER_CACHE.
+    """
+    def __init__(self, grille_data, spawn_positions, strategies: list, duration_s: int, graine=None):
+        super().__init__(grille_data, spawn_positions, strategies, duration_s, move_every_ticks=1.0, graine=graine,
+                         dossier_chemins=DOSSIER_CACHE)
+
+# =============================================================================
+# MATCHS DU BENCHMARK (exécutables dans n'importe quel processus)
+# =============================================================================
+
+# Ici, on mappe les noms techniques (naive, simple...) vers des noms d'affichage propres.
+# On teste les SOLOS (1 agent) et les DUOS (2 agents) pour chaque niveau.
+SCENARIOS = [
+    # --- MODE 1 JOUEUR (SOLO) ---
+    {"id": "solo_naif", "label": "Solo - Naif",    "strats": ["naive"],    "cat": "1 Agent"},
+    {"id": "solo_simp", "label": "Solo - Simple",     "strats": ["simple"],   "cat": "1 Agent"},
+    {"id": "solo_comp", "label": "Solo - Complexe",      "strats": ["complexe"], "cat": "1 Agent"},
+
+    # --- MODE 2 JOUEURS (DUO) ---
+    {"id": "duo_naif",  "label": "Duo - Naifs",    "strats": ["naive", "naive"],       "cat": "2 Agents"},
+    {"id": "duo_simp",  "label": "Duo - Simple",      "strats": ["simple", "simple"],     "cat": "2 Agents"},
+    {"id": "duo_comp",  "label": "Duo - Complexes",      "strats": ["complexe", "complexe"], "cat": "2 Agents"},
+]
+DUREE_S = 90
+ITERATIONS = 100
+
+
+@lru_cache(maxsize=8)
+def carte_du_match(graine_match: int):
+    """Carte d'un match, régénérée depuis sa graine : seul l'entier circule entre processus."""
+    return generate_map(rng=GrainesMatch(graine_match).carte())
+
+
+def jouer_match(graine_match: int, idx_scenario: int, duration: int = DUREE_S):
+    """Joue le scénario `idx_scenario` sur la carte de `graine_match` : (ligne de résultats, historique du score)."""
+    scen = SCENARIOS[idx_scenario]
+    grille, s1, s2 = carte_du_match(graine_match)
+    res = HeadlessGame(grille, [s1, s2], scen["strats"], duration, graine=graine_match).run(evenementiel=True)
+    ligne = {
+        "Label": scen["label"],      # Nom affiché (ex: Solo - Complexe)
+        "Category": scen["cat"],     # Pour les couleurs (1 Agent vs 2 Agents)
+        "Nb_Agents": res["nb_agents"],
+        "Score": res["score"],
+        "Recettes": res["recettes_count"],
+        "Efficacite": res["efficiency_cost"],
+        "Idle": res["idle_pct"],
+        "Reparations": res["replan_reparations"],
+        "Expansions_Evitees": res["replan_expansions_evitees"],
+        "Reflexions": res["reflexions_executees"],
+        "Reflexions_Evitees": res["reflexions_evitees"],
+        "Score_Par_Agent": res["score"] / max(1, res["nb_agents"]) # Rentabilité
+    }
+    return ligne, res["history"]
+
+
+def cle_du_match(graine_match: int, idx_scenario: int, duration: int = DUREE_S):
+    """Clé du match dans le stock de résultats : (hash de la carte, scénario, graine, durée)."""
+    grille, _, _ = carte_du_match(graine_match)
+    return (hash_grille(grille), SCENARIOS[idx_scenario]["id"], graine_match, duration)
+
+
+def _jouer_job(job):
+    # La clé est calculée ici : la carte est déjà générée dans ce processus. Un match stocké n'est
+    # pas rejoué si sa clé est toujours la bonne, hash de la carte compris.
+    graine_match, idx_scenario, duration, *stockee = job
+    cle = cle_du_match(graine_match, idx_scenario, duration)
+    if stockee and stockee[0] == cle: return cle, None, None
+    return (cle,) + jouer_match(graine_match, idx_scenario, duration)
+
+
+def _jouer_carte(jobs):
+    return [_jouer_job(job) for job in jobs]
+
+
+def jouer_matchs(jobs, processus: Optional[int] = None, progression=None, arreter=None):
+    """
+    Joue les `jobs` (graine_match, idx_scenario, durée[, clé stockée]) et rend leurs résultats dans
+    l'ordre des jobs : (clé du match, ligne de résultats, historique du score). Un job dont la clé
+    stockée est toujours celle du match (même carte) n'est pas rejoué et rend (clé, None, None).
+
+    Les jobs consécutifs de même graine forment une carte, jouée d'un bloc par un seul processus
+    qui ne la génère qu'une fois. Avec plus d'un processus, les cartes sont soumises au fil de
+    l'eau à un `ProcessPoolExecutor`, `processus` au plus en cours. Dès que `arreter()` est vrai,
+    aucune nouvelle carte n'est lancée : seules celles déjà en cours sont encore rendues. Chaque
+    match ne dépend que de sa graine : les chiffres sont identiques au mode séquentiel.
+    """
+    jobs = list(jobs)
+    cartes = [list(paquet) for _, paquet in groupby(jobs, key=lambda job: job[0])]
+    processus = processus or os.cpu_count() or 1
+    arreter = arreter or (lambda: False)
+    k = 0
+    if processus == 1:
+        for paquet in cartes:
+            if arreter(): return
+            for r in _jouer_carte(paquet):
+                k += 1
+                if progression: progression(k, len(jobs))
+                yield r
+        return
+    pool = ProcessPoolExecutor(max_workers=processus)
+    try:
+        a_lancer = iter(cartes)
+        en_cours = deque(pool.submit(_jouer_carte, paquet) for paquet in islice(a_lancer, processus))
+        while en_cours:
+            for r in en_cours.popleft().result():
+                k += 1
+                if progression: progression(k, len(jobs))
+                yield r
+            paquet = None if arreter() else next(a_lancer, None)
+            if paquet is not None: en_cours.append(pool.submit(_jouer_carte, paquet))
+    finally:
+        # Générateur abandonné avant la fin (interruption) : on attend les cartes en cours
+        pool.shutdown(wait=True, cancel_futures=True)
 
 # =============================================================================
 # LOGIQUE DE BENCHMARK ET VISUALISATION
 # =============================================================================
 
 def process_smoothed_curves(df_history, max_duration):
-    """Lisse les courbes de score pour l'affichage."""
-    common_time = pd.Index(np.arange(0, max_duration + 1, 1.0), name="Temps")
-    smoothed_data = []
-
-    for sim_id in df_history["Sim_ID"].unique():
-        subset = df_history[df_history["Sim_ID"] == sim_id]
-        if subset.empty: continue
-        
-        # On récupère les infos pour grouper
-        label = subset["Label"].iloc[0]
-        category = subset["Category"].iloc[0]
-        
-        s = subset.set_index("Temps")["Score"]
-        s = s[~s.index.duplicated(keep='last')]
-        s_resampled = s.reindex(s.index.union(common_time)).sort_index().ffill().reindex(common_time).fillna(0)
-        
-        for t, val in s_resampled.items():
-            smoothed_data.append({"Temps": t, "Score": val, "Label": label, "Category": category})
-
-    df_dense = pd.DataFrame(smoothed_data)
-    if df_dense.empty: return pd.DataFrame()
-
-    # Moyenne par Label (Scenario)
-    df_mean = df_dense.groupby(["Label", "Temps", "Category"])["Score"].mean().reset_index()
+    """
+    Lisse les courbes de score pour l'affichage.
+
+    Chaque simulation est rééchantillonnée à la seconde (dernier score connu, 0 avant le premier)
+    en une seule recherche : les historiques de toutes les simulations sont triés ensemble par
+    (simulation, rang du temps), et chaque point de la grille y cherche son dernier prédécesseur.
+    """
+    common_time = np.arange(0, max_duration + 1, 1.0)
+    if df_history.empty: return pd.DataFrame()
+
+    codes = pd.factorize(df_history["Sim_ID"])[0]
+    sims, premieres = np.unique(codes, return_index=True)  # première ligne de chaque simulation
+    temps = df_history["Temps"].to_numpy(dtype=float)
+    scores = df_history["Score"].to_numpy(dtype=float)
+
+    # Rangs entiers des temps (historiques et grille mêlés) : clés exactes, sans arrondi flottant
+    valeurs = np.unique(np.concatenate([temps, common_time]))
+    nb_rangs = len(valeurs)
+    cles = codes * nb_rangs + np.searchsorted(valeurs, temps)
+    ordre = np.argsort(cles, kind="stable")  # à temps égal, l'ordre d'origine : on garde le dernier
+    cles, scores = cles[ordre], scores[ordre]
+
+    requetes = sims[:, None] * nb_rangs + np.searchsorted(valeurs, common_time)[None, :]
+    pos = np.searchsorted(cles, requetes, side="right") - 1
+    connu = (pos >= 0) & (cles[np.maximum(pos, 0)] >= sims[:, None] * nb_rangs)
+    dense = np.where(connu, scores[np.maximum(pos, 0)], 0.0)  # (simulations, secondes)
+
+    # Moyenne par Label (Scenario) : somme des courbes de chaque groupe (Label, Category)
+    groupes = pd.MultiIndex.from_arrays([df_history["Label"].to_numpy()[premieres],
+                                         df_history["Category"].to_numpy()[premieres]])
+    idx_groupe, uniques = pd.factorize(groupes)
+    sommes = np.zeros((len(uniques), len(common_time)))
+    np.add.at(sommes, idx_groupe, dense)
+    moyennes = sommes / np.bincount(idx_groupe)[:, None]
+
+    df_mean = pd.DataFrame({
+        "Label": np.repeat(uniques.get_level_values(0), len(common_time)),
+        "Temps": np.tile(common_time, len(uniques)),
+        "Category": np.repeat(uniques.get_level_values(1), len(common_time)),
+        "Score": moyennes.ravel(),
+    }).sort_values(["Label", "Temps", "Category"], kind="stable").reset_index(drop=True)
     
     # Moyenne glissante pour faire joli
     df_mean["Score_Lisse"] = df_mean.groupby("Label")["Score"].transform(
@@ -186,74 +193,113 @@ def process_smoothed_curves(df_history, max_duration):
     )
     return df_mean
 
-def run_viz_benchmark():
+def balayer(graine: int = 0, processus: Optional[int] = None, chemin_stock: str = CHEMIN_DEFAUT,
+            iterations: int = ITERATIONS, duration: int = DUREE_S, suivi: Optional[SuiviSequentiel] = None,
+            progression=None):
+    """
+    Matchs des cartes `graine` à `graine + iterations - 1`, relus dans le stock ou joués (et ajoutés
+    au stock dès qu'ils se terminent). Un match stocké n'est relu que si sa carte, régénérée depuis
+    la graine, a toujours le même hash : après une modification du générateur, il est rejoué.
+
+    Avec `suivi`, chaque carte complète lui est transmise et plus aucune carte n'est lancée dès que
+    `suivi.arreter()`. Les cartes déjà en cours à ce moment sont stockées (une reprise les relira)
+    mais ne sont pas retenues. Rend les clés des matchs retenus, dans l'ordre, et le bilan
+    {"joues", "relus", "evites"} (évités : jamais lancés).
+    """
+    # Une carte UNIQUE par itération, jouée par tous les scénarios pour qu'ils soient comparables
+    # (graine du match = graine + i : chaque carte et ses 6 matchs sont rejouables à l'identique)
+    stock = StockResultats(chemin_stock)
+    jobs = [(graine + i, k, duration, stock.retrouver(SCENARIOS[k]["id"], graine + i, duration))
+            for i in range(iterations) for k in range(len(SCENARIOS))]
+    nb_stockes = sum(job[3] is not None for job in jobs)
+    print(f"{nb_stockes} matchs déjà dans {chemin_stock} (relus si leur carte n'a pas changé), "
+          f"{len(jobs) - nb_stockes} à jouer.")
+    deja = stock.scores() if suivi is not None else {}
+
+    bilan = {"joues": 0, "relus": 0, "evites": 0}
+    retenues, carte, arret = [], {}, False
+    resultats = jouer_matchs(jobs, processus, progression, arreter=lambda: arret)
+    try:
+        for (_, k, _, _), (cle, ligne, history) in zip(jobs, resultats):
+            if ligne is None:
+                bilan["relus"] += 1
+                score = deja.get(cle)
+            else:
+                bilan["joues"] += 1
+                stock.ajouter(cle, ligne, history)
+                score = ligne["Score"]
+            if arret: continue  # carte lancée avant l'arrêt : stockée, hors du balayage retenu
+            retenues.append(cle)
+            if suivi is None: continue
+            carte[SCENARIOS[k]["id"]] = score
+            if len(carte) == len(SCENARIOS):
+                suivi.ajouter_carte(carte)
+                carte = {}
+                arret = suivi.arreter()
+    finally:
+        resultats.close()
+    bilan["evites"] = len(jobs) - bilan["joues"] - bilan["relus"]
+    return retenues, bilan
+
+
+def afficher_suivi(suivi: SuiviSequentiel, bilan: dict, iterations: int = ITERATIONS):
+    print(f"Arrêt séquentiel : {suivi.nb_cartes} cartes retenues sur {iterations} ; matchs : "
+          f"{bilan['joues']} joués, {bilan['relus']} relus du stock, "
+          f"{bilan['evites']} évités sur {iterations * len(SCENARIOS)}.")
+    print(f"{'Scénario':>16} | {'Moyenne':>7} | {'Écart-type':>10} | {'IC ' + format(suivi.niveau, '.0%'):>17} | {'Largeur':>7}")
+    for scen in SCENARIOS:
+        w = suivi.flux[scen["id"]]
+        bas, haut = suivi.intervalle(scen["id"])
+        print(f"{scen['label']:>16} | {w.moyenne:7.1f} | {w.ecart_type:10.1f} | [{bas:6.1f}, {haut:6.1f}] | {haut - bas:7.1f}")
+    print(f"Comparaisons : {suivi.comparaisons_tranchees()} tranchées, {suivi.comparaisons_equivalentes()} "
+          f"équivalentes sur {suivi.nb_comparaisons} (largeur max {suivi.largeur_max():.1f}, cible {suivi.largeur_cible:g})")
+
+
+def run_viz_benchmark(graine: int = 0, processus: Optional[int] = None, chemin_stock: str = CHEMIN_DEFAUT,
+                      adaptatif: bool = False, largeur_cible: float = LARGEUR_CIBLE):
+    """
+    Joue les matchs du balayage absents du stock `chemin_stock` (chacun y est enregistré dès qu'il
+    se termine : un balayage interrompu reprend là où il s'était arrêté), puis trace le tout.
+    En mode `adaptatif`, les cartes s'arrêtent dès que le classement des scénarios est établi
+    (voir `arret_sequentiel`) au lieu d'en jouer toujours ITERATIONS.
+    """
     print("Démarrage du Benchmark Comparatif...")
     print("Analyse des stratégies : Naif (Naïf), Simple (Simple), Complexe (Complexe)")
 
-    # --- DÉFINITION DES SCÉNARIOS ---
-    # Ici, on mappe les noms techniques (naive, simple...) vers des noms d'affichage propres.
-    # On teste les SOLOS (1 agent) et les DUOS (2 agents) pour chaque niveau.
-    
-    scenarios = [
-        # --- MODE 1 JOUEUR (SOLO) ---
-        {"id": "solo_naif", "label": "Solo - Naif",    "strats": ["naive"],    "cat": "1 Agent"},
-        {"id": "solo_simp", "label": "Solo - Simple",     "strats": ["simple"],   "cat": "1 Agent"},
-        {"id": "solo_comp", "label": "Solo - Complexe",      "strats": ["complexe"], "cat": "1 Agent"},
-
-        # --- MODE 2 JOUEURS (DUO) ---
-        {"id": "duo_naif",  "label": "Duo - Naifs",    "strats": ["naive", "naive"],       "cat": "2 Agents"},
-        {"id": "duo_simp",  "label": "Duo - Simple",      "strats": ["simple", "simple"],     "cat": "2 Agents"},
-        {"id": "duo_comp",  "label": "Duo - Complexes",      "strats": ["complexe", "complexe"], "cat": "2 Agents"},
-    ]
-
-    duration = 90
-    iterations = 100 
-    
-    results = []
-    histories = []
-    sim_counter = 0
-
+    duration = DUREE_S
     start_global = time.time()
 
-    for i in range(iterations):
-        # Générer une carte UNIQUE pour cette itération
-        # Tous les scénarios vont jouer sur cette même carte pour être comparables
-        grille, s1, s2 = generate_map()
-        spawns = [s1, s2]
-        
-        print(f"\r[Carte {i+1}/{iterations}] Simulation des 6 scénarios...", end="")
-
-        for scen in scenarios:
-            sim_counter += 1
-            
-            # Lancer la simulation
-            game = HeadlessGame(grille, spawns, scen["strats"], duration)
-            res = game.run()
-
-            # Stocker les résultats
-            results.append({
-                "Label": scen["label"],      # Nom affiché (ex: Solo - Complexe)
-                "Category": scen["cat"],     # Pour les couleurs (1 Agent vs 2 Agents)
-                "Nb_Agents": res["nb_agents"],
-                "Score": res["score"],
-                "Recettes": res["recettes_count"],
-                "Efficacite": res["efficiency_cost"],
-                "Idle": res["idle_pct"],
-                "Score_Par_Agent": res["score"] / max(1, res["nb_agents"]) # Rentabilité
-            })
-
-            # Historique pour la courbe
-            df_hist = pd.DataFrame(res["history"], columns=["Temps", "Score"])
-            df_hist["Label"] = scen["label"]
-            df_hist["Category"] = scen["cat"]
-            df_hist["Sim_ID"] = sim_counter
-            histories.append(df_hist)
+    suivi = None
+    if adaptatif:
+        suivi = SuiviSequentiel([s["id"] for s in SCENARIOS], largeur_cible, graine=graine)
 
-    print(f"\nBenchmark terminé en {time.time() - start_global:.2f} s.")
+    def progression(k, n):
+        print(f"\r[Match {k}/{n}] Simulation des scénarios...", end="")
 
-    # --- GÉNÉRATION DES GRAPHIQUES ---
-    df = pd.DataFrame(results)
-    df_hist_raw = pd.concat(histories, ignore_index=True)
+    cles, bilan = balayer(graine, processus, chemin_stock, ITERATIONS, duration, suivi, progression)
+
+    print(f"\nBenchmark terminé en {time.time() - start_global:.2f} s.")
+    if suivi is not None: afficher_suivi(suivi, bilan, ITERATIONS)
+    df, df_hist_raw = StockResultats(chemin_stock).charger(cles)
+    tracer_resultats(df, df_hist_raw, duration)
+
+
+def tracer_stock(chemin_stock: str = CHEMIN_DEFAUT):
+    """Trace tous les matchs du stock, sans rien simuler."""
+    df, df_hist_raw = StockResultats(chemin_stock).charger()
+    if df.empty:
+        print(f"Aucun match dans {chemin_stock}.")
+        return
+    tracer_resultats(df, df_hist_raw, int(df["Duree"].max()))
+
+
+def tracer_resultats(df, df_hist_raw, duration):
+    # Bilan de la replanification incrémentale (moyenne par match)
+    print("Replanification incrémentale (moyenne par match) :")
+    print(df.groupby("Label")[["Reparations", "Expansions_Evitees"]].mean().round(1).to_string())
+    # Réflexions sautées grâce à la version du monde (rien n'avait changé depuis le dernier échec)
+    print("Planification (moyenne par match) :")
+    print(df.groupby("Label")[["Reflexions", "Reflexions_Evitees"]].mean().round(1).to_string())
     df_curves = process_smoothed_curves(df_hist_raw, duration)
 
     # Configuration du style
@@ -1,16 +1,20 @@
 # carte.py
-from typing import List, Sequence, Tuple, Dict
-import tkinter as tk
-from PIL import Image, ImageTk
+from typing import List, Sequence, Tuple, Dict, Optional
+from collections import deque
+from table_chemins import TableChemins
+
+# tkinter / PIL ne sont importés que pour le rendu (textures, dessin) : le cœur de simulation s'en passe
 
 # Codes tuiles
 SOL, BAC, FOUR, DECOUPE, SERVICE, JOUEUR, MUR, POELE, ASSEMBLAGE = 0, 1, 2, 3, 4, 5, 6, 7, 8
 BLOQUANTS = {MUR, BAC, FOUR, DECOUPE, SERVICE, POELE, ASSEMBLAGE}
 DIR_N, DIR_E, DIR_S, DIR_W = "N", "E", "S", "W"
+LEGUMES_BAC = ["tomate", "salade", "aubergine", "courgette", "poivron"]
 
 class Carte:
     """Carte grille : dessine, expose les positions des stations et gère libellés/assignations de bacs/assemblage."""
-    def __init__(self, grille: Sequence[Sequence[int]], largeur: int = 600, hauteur: int = 600) -> None:
+    def __init__(self, grille: Sequence[Sequence[int]], largeur: int = 600, hauteur: int = 600,
+                 textures: bool = True, dossier_chemins: Optional[str] = None) -> None:
         if not grille or not all(isinstance(row, (list, tuple)) for row in grille):
             raise ValueError("grille doit être une liste de listes.")
         w = len(grille[0])
@@ -32,6 +36,18 @@ class Carte:
         self.bacs_config: Dict[Tuple[int, int], Tuple[str, float]] = {}
         # stock assemblage: (x,y) -> liste d'objets (Aliment ou plat final)
         self.assemblage_stock: Dict[Tuple[int, int], List[object]] = {}
+        # champs de distance multi-sources : tuple(stations triées) -> {case: distance}
+        self._champs: Dict[Tuple[Tuple[int, int], ...], Dict[Tuple[int, int], int]] = {}
+        # table toutes-paires (construite à la demande, invalidée si la grille change)
+        self._table_chemins: Optional[TableChemins] = None
+        self._dossier_chemins = dossier_chemins  # sauvegarde disque de la table (None : mémoire seule)
+        # grille compacte (ligne par ligne) : codes tuiles, masque praticable et voisins praticables par case
+        self._largeur = w
+        self.codes = bytearray()
+        self.praticable = bytearray()
+        self._voisins: List[Tuple[Tuple[int, int], ...]] = []
+        # code station -> {case: 1re station voisine de ce type, dans l'ordre des listes pos_*}
+        self._adjacentes: Dict[int, Dict[Tuple[int, int], Tuple[int, int]]] = {}
 
         self._indexer_stations()
 
@@ -82,18 +98,23 @@ class Carte:
         }
 
         # textures (clé = (code_tuile, direction))
-        self.textures: Dict[Tuple[int, str], ImageTk.PhotoImage] = {}
-        self.crate_textures: Dict[Tuple[str, str], ImageTk.PhotoImage] = {} # (nom_aliment, orientation)
+        self.textures: Dict[Tuple[int, str], "ImageTk.PhotoImage"] = {}
+        self.crate_textures: Dict[Tuple[str, str], "ImageTk.PhotoImage"] = {} # (nom_aliment, orientation)
 
-        # calcul des textures en fonction de la taille
-        self._charger_textures(self.largeur_px, self.hauteur_px)
+        # calcul des textures en fonction de la taille (sinon : à la demande, via charger_textures)
+        if textures:
+            self.charger_textures()
 
         # orientation des stations (four, poêle, etc.)
         self.orientations: Dict[Tuple[int, int], str] = {}
         self._calculer_orientations()
 
+        self._precalculer_champs()
+
 
     def _indexer_stations(self) -> None:
+        self._champs.clear()  # la grille a pu changer : les champs sont à recalculer
+        self._table_chemins = None
         self.pos_bacs.clear(); self.pos_decoupes.clear(); self.pos_services.clear()
         self.pos_poeles.clear(); self.pos_fours.clear(); self.pos_assemblages.clear()
         for y, row in enumerate(self.grille):
@@ -106,6 +127,43 @@ class Carte:
                 elif code == ASSEMBLAGE:
                     self.pos_assemblages.append((x, y))
                     self.assemblage_stock.setdefault((x, y), [])
+        self._indexer_grille()
+        self._indexer_adjacences()
+
+    def _indexer_grille(self) -> None:
+        """Recopie la grille dans des tableaux plats (index y * cols + x) et précalcule les voisins."""
+        rows, cols = len(self.grille), self._largeur
+        self.codes = bytearray(code for row in self.grille for code in row)
+        self.praticable = bytearray(code not in BLOQUANTS for code in self.codes)
+        voisins = []
+        for y in range(rows):
+            for x in range(cols):
+                voisins.append(tuple(
+                    (nx, ny) for nx, ny in ((x+1, y), (x-1, y), (x, y+1), (x, y-1))
+                    if 0 <= nx < cols and 0 <= ny < rows and self.praticable[ny * cols + nx]
+                ))
+        self._voisins = voisins
+
+    def voisins_praticables(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        """Cases praticables voisines de (x, y), dans l'ordre E, O, S, N (précalculé)."""
+        return self._voisins[y * self._largeur + x]
+
+    def est_praticable(self, x: int, y: int) -> bool:
+        return 0 <= x < self._largeur and 0 <= y < len(self.grille) and self.praticable[y * self._largeur + x] == 1
+
+    def _indexer_adjacences(self) -> None:
+        """Pour chaque case, la station voisine de chaque type (même résultat que Player.est_adjacent_a)."""
+        self._adjacentes = {}
+        for code, positions in ((BAC, self.pos_bacs), (DECOUPE, self.pos_decoupes), (SERVICE, self.pos_services),
+                                (POELE, self.pos_poeles), (FOUR, self.pos_fours), (ASSEMBLAGE, self.pos_assemblages)):
+            table = self._adjacentes[code] = {}
+            for (sx, sy) in positions:
+                for case in ((sx+1, sy), (sx-1, sy), (sx, sy+1), (sx, sy-1)):
+                    table.setdefault(case, (sx, sy))
+
+    def station_adjacente(self, x: int, y: int, code: int) -> Optional[Tuple[int, int]]:
+        """Station de type `code` voisine de (x, y), ou None. O(1)."""
+        return self._adjacentes[code].get((x, y))
 
     def _calculer_orientations(self) -> None:
         """Calcule l'orientation 'logique' des stations (four, poêle, etc.)."""
@@ -139,6 +197,10 @@ class Carte:
         if w: return DIR_W
         return DIR_S
 
+    def charger_textures(self) -> None:
+        """Charge les textures (nécessite PIL et une fenêtre Tk) ; le dessin s'en passe sinon."""
+        self._charger_textures(self.largeur_px, self.hauteur_px)
+
     def _charger_textures(self, largeur_px, hauteur_px):
         """Charge les textures de toutes les tuiles + service 1x1 et 2x1."""
         # tuile carrée
@@ -224,7 +286,7 @@ class Carte:
     @property
     def rows(self) -> int: return len(self.grille)
     @property
-    def cols(self) -> int: return len(self.grille[0])
+    def cols(self) -> int: return self._largeur
 
     def assigner_bacs(self, items: List[Tuple[str, float]]) -> None:
         """
@@ -252,6 +314,103 @@ class Carte:
         for i, pos in enumerate(self.pos_bacs):
             nom, v = items[i % len(items)]
             self.bacs_config[pos] = (nom, v)
+        self._precalculer_champs()
+
+    # ------------------------------------------------------------------
+    # CHAMPS DE DISTANCE PAR TYPE DE STATION
+    # ------------------------------------------------------------------
+    def bacs_pour(self, aliment: Optional[str]) -> List[Tuple[int, int]]:
+        """Bacs où l'on peut prendre `aliment` (les légumes sortent du bac 'legume')."""
+        res = []
+        for pos, (nom_bac, _) in self.bacs_config.items():
+            if nom_bac == (aliment or ""): res.append(pos)
+            if nom_bac == "legume" and aliment in LEGUMES_BAC:
+                res.append(pos)
+        return res
+
+    def stations_par_type(self, type_cible: str, aliment: Optional[str] = None) -> List[Tuple[int, int]]:
+        """Positions des stations d'un type logique (BAC, DECOUPE, FOUR_OU_POELE, ASSEMBLAGE, SERVICE)."""
+        if type_cible == "BAC": return self.bacs_pour(aliment)
+        if type_cible == "DECOUPE": return self.pos_decoupes
+        if type_cible == "FOUR_OU_POELE": return self.pos_fours + self.pos_poeles
+        if type_cible == "ASSEMBLAGE": return self.pos_assemblages
+        if type_cible == "SERVICE": return self.pos_services
+        return []
+
+    def _precalculer_champs(self) -> None:
+        """Construit une fois par carte les champs de chaque type de station (et de chaque bac par aliment)."""
+        noms = {nom for (nom, _) in self.bacs_config.values()}
+        if "legume" in noms: noms.update(LEGUMES_BAC)
+        for nom in noms:
+            self.champ_distance(self.bacs_pour(nom))
+        for type_cible in ("DECOUPE", "FOUR_OU_POELE", "ASSEMBLAGE", "SERVICE"):
+            self.champ_distance(self.stations_par_type(type_cible))
+
+    def champ_distance(self, stations: Sequence[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        """
+        Champ de distance multi-sources vers les cases libres adjacentes à `stations`
+        (0 = case depuis laquelle on peut utiliser une station). Mis en cache par ensemble de stations.
+        """
+        cle = tuple(sorted(set(stations)))
+        champ = self._champs.get(cle)
+        if champ is None:
+            champ = self._calculer_champ(cle)
+            self._champs[cle] = champ
+        return champ
+
+    def descendre_champ(self, champ: Dict[Tuple[int, int], int], start: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Suit le gradient de `champ` depuis `start` (inclus) jusqu'à une case de distance 0."""
+        d = champ.get(start)
+        if d is None: return None
+        path = [start]
+        x, y = start
+        while d > 0:
+            for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
+                if champ.get((x+dx, y+dy)) == d - 1:
+                    x, y = x+dx, y+dy
+                    break
+            path.append((x, y))
+            d -= 1
+        return path
+
+    @property
+    def table_chemins(self) -> TableChemins:
+        """Table distance / premier pas toutes-paires, partagée par hash de grille (et persistée si demandé)."""
+        if self._table_chemins is None:
+            self._table_chemins = TableChemins.pour_grille(self.grille, BLOQUANTS, self._dossier_chemins)
+        return self._table_chemins
+
+    def distance_station(self, pos: Tuple[int, int], station: Tuple[int, int]) -> int:
+        """Pas nécessaires pour être à côté de `station` (+1 pour l'atteindre), Manhattan en secours."""
+        table = self.table_chemins
+        sx, sy = station
+        best = None
+        for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
+            d = table.distance(pos, (sx+dx, sy+dy))
+            if d is not None and (best is None or d < best):
+                best = d
+        if best is None:
+            return abs(pos[0] - sx) + abs(pos[1] - sy)
+        return best + 1
+
+    def _calculer_champ(self, stations: Sequence[Tuple[int, int]]) -> Dict[Tuple[int, int], int]:
+        champ: Dict[Tuple[int, int], int] = {}
+        q = deque()
+        for (sx, sy) in stations:
+            for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
+                nx, ny = sx+dx, sy+dy
+                if (nx, ny) not in champ and self.est_praticable(nx, ny):
+                    champ[(nx, ny)] = 0
+                    q.append((nx, ny))
+        voisins, cols = self._voisins, self._largeur
+        while q:
+            cur = q.popleft()
+            d = champ[cur] + 1
+            for nxt in voisins[cur[1] * cols + cur[0]]:
+                if nxt not in champ:
+                    champ[nxt] = d
+                    q.append(nxt)
+        return champ
 
     def est_mur(self, x: int, y: int) -> bool:
         if 0 <= y < self.rows and 0 <= x < self.cols:
@@ -260,11 +419,10 @@ class Carte:
 
     def est_bloquant(self, x: int, y: int) -> bool:
         """Tout atelier + murs sont bloquants pour le déplacement."""
-        if 0 <= y < self.rows and 0 <= x < self.cols:
-            return self.grille[y][x] in BLOQUANTS
-        return True
+        return not self.est_praticable(x, y)
 
-    def dessiner(self, canvas: tk.Canvas) -> None:
+    def dessiner(self, canvas: "tk.Canvas") -> None:
+        from PIL import Image, ImageTk
         canvas.config(width=self.largeur_px, height=self.hauteur_px)
         canvas.delete("all")
 
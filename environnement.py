@@ -0,0 +1,209 @@
+# environnement.py
+"""
+Environnement d'apprentissage façon Gym au-dessus de la simulation sans rendu.
+
+Un agent « pilote » (le joueur 0) reçoit une action par pas parmi un espace fixe (attendre,
+4 déplacements, interagir) ; ses éventuels partenaires sont des agents scriptés. Un pas
+d'environnement est un tick de `Simulation`. La récompense est le score gagné pendant le pas
+(somme des `Recette.difficulte_reelle` livrées), `done` indique la fin du match.
+
+Les observations sont écrites en place dans des tableaux NumPy alloués une fois pour toutes :
+- grille (CANAUX, rows, cols) uint8 : tuiles, agents, objets tenus, objets sur les stations,
+  progression des cuissons/découpes ;
+- vecteur (TAILLE_VECTEUR,) float32 : temps restant, commandes en attente (one-hot), pilote occupé.
+`EnvsCuisine` fait tourner plusieurs environnements dans un seul processus, sur un même tampon.
+"""
+import time
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from agent import Agent
+from graines import GrainesMatch
+from map_generator import generate_map, extra_spawns
+from recette import RECETTES_POOL, code_de
+from simulation import Simulation, DT_DEFAUT
+
+# Espace d'actions
+ATTENDRE, HAUT, BAS, GAUCHE, DROITE, INTERAGIR = range(6)
+NB_ACTIONS = 6
+DEPLACEMENTS = {HAUT: "haut", BAS: "bas", GAUCHE: "gauche", DROITE: "droite"}
+
+# Canaux de la grille observée
+C_TUILE, C_AGENTS, C_OBJET_TENU, C_OBJET_STATION, C_PROGRESSION = range(5)
+CANAUX = 5
+PILOTE, PARTENAIRE = 1, 2  # valeurs du canal C_AGENTS
+
+NB_COMMANDES = 3
+INDEX_RECETTE = {r.uid: i for i, r in enumerate(RECETTES_POOL)}
+TAILLE_VECTEUR = 2 + NB_COMMANDES * len(RECETTES_POOL)
+
+Observation = Tuple[np.ndarray, np.ndarray]
+
+
+class AgentPilote(Agent):
+    """Agent dont chaque tick exécute l'action posée dans `action` (puis revient à ATTENDRE)."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.action = ATTENDRE
+
+    def tick(self):
+        action, self.action = self.action, ATTENDRE
+        if action == INTERAGIR:
+            self._interagir()
+        elif action in DEPLACEMENTS:
+            self._deplacer(action)
+
+    def _deplacer(self, action: int) -> None:
+        p = self.player
+        avant = (p.x, p.y)
+        dx, dy = {HAUT: (0, -1), BAS: (0, 1), GAUCHE: (-1, 0), DROITE: (1, 0)}[action]
+        if self.occupation.occupee_par_autre((p.x + dx, p.y + dy), self.agent_id): return
+        getattr(p, DEPLACEMENTS[action])(self.carte)
+        if (p.x, p.y) != avant:
+            self.occupation.placer(self.agent_id, (p.x, p.y))
+            self.game.monde_modifie()
+            self._mark_progress()
+            self._stationner()
+
+    def _interagir(self) -> None:
+        """Action contextuelle de `Agent.try_action` avec les stations adjacentes, au service de sa commande."""
+        self._ensure_bot_recette_valide()
+        if self.bot_recette is None: self.bot_recette = self.choisir_recette()
+        if self.player.item is None and self.bot_recette:
+            idx = self._next_req_index_disponible(self.bot_recette)
+            if idx is not None: self.next_req_idx = idx
+        self.try_action()
+        # try_action peut lancer un déplacement automatique (vers le service) : le pilote décide seul
+        self.current_path = []
+        self.target_station = None
+        self._stationner()
+
+
+def _fabrique(jeu, joueur, strategie, agent_id, rng):
+    classe = AgentPilote if agent_id == 0 else Agent
+    return classe(jeu, joueur, strategie, agent_id=agent_id, rng=rng)
+
+
+class EnvCuisine:
+    """
+    Une cuisine, un pilote. `partenaires` : stratégies des coéquipiers scriptés ; `strategie_pilote`
+    fixe la commande au service de laquelle « interagir » agit. Les tampons d'observation peuvent
+    être fournis (vues d'un tampon commun, voir `EnvsCuisine`).
+    """
+
+    def __init__(self, partenaires: Sequence[str] = (), duree_s: float = 60, rows: int = 8, cols: int = 12,
+                 strategie_pilote: str = "complexe", dt: float = DT_DEFAUT,
+                 grille: Optional[np.ndarray] = None, vecteur: Optional[np.ndarray] = None) -> None:
+        self.strategies = [strategie_pilote] + list(partenaires)
+        self.duree_s = duree_s
+        self.rows, self.cols = rows, cols
+        self.dt = dt
+        self.grille = grille if grille is not None else np.zeros((CANAUX, rows, cols), dtype=np.uint8)
+        self.vecteur = vecteur if vecteur is not None else np.zeros(TAILLE_VECTEUR, dtype=np.float32)
+        self.info = {"score": 0, "graine": None}
+        self.sim: Optional[Simulation] = None
+        self.pilote: Optional[AgentPilote] = None
+
+    def reset(self, seed: int) -> Observation:
+        """Nouveau match (carte, spawns, commandes et partenaires tirés de la graine `seed`)."""
+        graines = GrainesMatch(seed)
+        grille, s1, s2 = generate_map(rows=self.rows, cols=self.cols, rng=graines.carte())
+        spawns = extra_spawns(grille, [s1, s2], len(self.strategies), rng=graines.spawns())
+        self.sim = Simulation(grille, spawns, self.strategies, self.duree_s, move_every_ticks=1.0,
+                              graine=seed, fabrique_agent=_fabrique)
+        self.pilote = self.sim.agents[0]
+        # Canal statique : les tuiles (la carte ne change plus pendant le match)
+        self.grille[C_TUILE] = np.frombuffer(self.sim.carte.codes, dtype=np.uint8).reshape(self.rows, self.cols)
+        self.info["graine"] = seed
+        self.info["score"] = 0
+        self._observer()
+        return self.grille, self.vecteur
+
+    def step(self, action: int) -> Tuple[Observation, float, bool, dict]:
+        sim = self.sim
+        score_avant = sim.score
+        self.pilote.action = int(action)
+        sim.pas(self.dt)
+        self._observer()
+        self.info["score"] = sim.score
+        return (self.grille, self.vecteur), float(sim.score - score_avant), sim.termine, self.info
+
+    # ------------------------------------------------------------------
+    # OBSERVATION (écriture en place)
+    # ------------------------------------------------------------------
+    def _observer(self) -> None:
+        sim = self.sim
+        g = self.grille
+        g[C_AGENTS:] = 0
+        for i, p in enumerate(sim.players):
+            g[C_AGENTS, p.y, p.x] = PILOTE if i == 0 else PARTENAIRE
+            if p.item is not None: g[C_OBJET_TENU, p.y, p.x] = code_de(p.item) + 1
+
+        now = sim.current_sim_time
+        for (sx, sy), stock in sim.carte.assemblage_stock.items():
+            if stock: g[C_OBJET_STATION, sy, sx] = code_de(stock[-1]) + 1
+        for (sx, sy), (alim, t0, tfin) in sim.cuissons.items():
+            g[C_OBJET_STATION, sy, sx] = code_de(alim) + 1
+            g[C_PROGRESSION, sy, sx] = _progression(now, t0, tfin)
+        for (type_act, pos, alim, t0, tfin) in sim.actions_en_cours.values():
+            if pos:
+                g[C_OBJET_STATION, pos[1], pos[0]] = code_de(alim) + 1
+                g[C_PROGRESSION, pos[1], pos[0]] = _progression(now, t0, tfin)
+
+        v = self.vecteur
+        v[:] = 0.0
+        v[0] = max(0.0, 1.0 - now / sim.duration_s)
+        v[1] = self.pilote in sim.actions_en_cours
+        nb = len(RECETTES_POOL)
+        for i, r in enumerate(sim.recettes[:NB_COMMANDES]):
+            v[2 + i * nb + INDEX_RECETTE[r.uid]] = 1.0
+
+
+def _progression(now: float, t0: float, tfin: float) -> int:
+    if tfin <= t0: return 255
+    return int(255 * min(1.0, max(0.0, (now - t0) / (tfin - t0))))
+
+
+class EnvsCuisine:
+    """
+    `nb_envs` cuisines pas à pas dans un même processus. Les observations de l'environnement i
+    sont `grilles[i]` / `vecteurs[i]` ; un environnement terminé est relancé aussitôt (graine suivante)
+    et son score final est noté dans `scores_finaux[i]`. Le temps passé dans ces relances (génération
+    de carte comprise) est cumulé dans `duree_resets_s`, à part de celui des pas.
+    """
+
+    def __init__(self, nb_envs: int, partenaires: Sequence[str] = (), duree_s: float = 60,
+                 rows: int = 8, cols: int = 12, strategie_pilote: str = "complexe") -> None:
+        self.nb_envs = nb_envs
+        self.grilles = np.zeros((nb_envs, CANAUX, rows, cols), dtype=np.uint8)
+        self.vecteurs = np.zeros((nb_envs, TAILLE_VECTEUR), dtype=np.float32)
+        self.recompenses = np.zeros(nb_envs, dtype=np.float32)
+        self.dones = np.zeros(nb_envs, dtype=bool)
+        self.scores_finaux = np.zeros(nb_envs, dtype=np.float32)
+        self.envs = [EnvCuisine(partenaires, duree_s, rows, cols, strategie_pilote,
+                                grille=self.grilles[i], vecteur=self.vecteurs[i]) for i in range(nb_envs)]
+        self._prochaine_graine = 0
+        self.nb_resets = 0
+        self.duree_resets_s = 0.0
+
+    def reset(self, seed: int) -> Observation:
+        for i, env in enumerate(self.envs):
+            env.reset(seed + i)
+        self._prochaine_graine = seed + self.nb_envs
+        return self.grilles, self.vecteurs
+
+    def step(self, actions: Sequence[int]) -> Tuple[Observation, np.ndarray, np.ndarray]:
+        for i, env in enumerate(self.envs):
+            _, r, done, _ = env.step(actions[i])
+            self.recompenses[i] = r
+            self.dones[i] = done
+            if done:
+                self.scores_finaux[i] = env.sim.score
+                t0 = time.perf_counter()
+                env.reset(self._prochaine_graine)
+                self.duree_resets_s += time.perf_counter() - t0
+                self.nb_resets += 1
+                self._prochaine_graine += 1
+        return (self.grilles, self.vecteurs), self.recompenses, self.dones
@@ -0,0 +1,100 @@
+# equipe.py
+"""
+État partagé par les agents d'une même équipe (une cuisine), quel que soit leur nombre.
+
+- `GrilleOccupation` : quel agent se trouve sur quelle case (tableau plat, requête O(1)).
+- `RegistreRevendications` : quelles stations et quelles recettes chaque agent vise,
+  pour que les coéquipiers se répartissent le travail sans se parcourir les uns les autres.
+"""
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+Coord = Tuple[int, int]
+LIBRE = 0  # valeur stockée = agent_id + 1
+
+
+class GrilleOccupation:
+    def __init__(self, cols: int, rows: int) -> None:
+        self.cols = cols
+        self.rows = rows
+        self._cases = bytearray(cols * rows)
+        self.positions: Dict[int, Coord] = {}
+
+    def placer(self, agent_id: int, case: Coord) -> None:
+        ancienne = self.positions.get(agent_id)
+        if ancienne is not None:
+            i = ancienne[1] * self.cols + ancienne[0]
+            if self._cases[i] == agent_id + 1: self._cases[i] = LIBRE
+        self._cases[case[1] * self.cols + case[0]] = agent_id + 1
+        self.positions[agent_id] = case
+
+    def occupant(self, case: Coord) -> Optional[int]:
+        x, y = case
+        if not (0 <= x < self.cols and 0 <= y < self.rows): return None
+        v = self._cases[y * self.cols + x]
+        return v - 1 if v != LIBRE else None
+
+    def occupee_par_autre(self, case: Coord, agent_id: int) -> bool:
+        a = self.occupant(case)
+        return a is not None and a != agent_id
+
+    def instantane(self) -> tuple:
+        return bytes(self._cases), dict(self.positions)
+
+    def restaurer(self, inst: tuple) -> None:
+        cases, positions = inst
+        self._cases = bytearray(cases)
+        self.positions = dict(positions)
+
+
+class RegistreRevendications:
+    """Station visée et recette choisie par chaque agent ; `version` change à chaque modification."""
+
+    def __init__(self) -> None:
+        self._stations: Dict[Coord, Dict[int, None]] = {}  # station -> agents (ordre d'arrivée)
+        self._station_agent: Dict[int, Coord] = {}
+        self._recettes: Dict[int, object] = {}
+        self.version = 0
+
+    # --- Stations ---
+    def viser_station(self, agent_id: int, station: Optional[Coord]) -> None:
+        ancienne = self._station_agent.get(agent_id)
+        if ancienne == station: return
+        if ancienne is not None:
+            agents = self._stations[ancienne]
+            del agents[agent_id]
+            if not agents: del self._stations[ancienne]
+            del self._station_agent[agent_id]
+        if station is not None:
+            self._stations.setdefault(station, {})[agent_id] = None
+            self._station_agent[agent_id] = station
+        self.version += 1
+
+    def agents_sur_station(self, station: Coord) -> Iterable[int]:
+        return self._stations.get(station, ())
+
+    # --- Recettes ---
+    def choisir_recette(self, agent_id: int, recette) -> None:
+        if self._recettes.get(agent_id) is recette: return
+        if recette is None: self._recettes.pop(agent_id, None)
+        else: self._recettes[agent_id] = recette
+        self.version += 1
+
+    def recettes_des_autres(self, agent_id: int) -> Set[int]:
+        """id() des recettes choisies par les coéquipiers."""
+        return {id(r) for a, r in self._recettes.items() if a != agent_id}
+
+    # --- Chemins ---
+    def nouveau_chemin(self) -> None:
+        """Un agent a changé d'itinéraire : ses obstacles dynamiques ont changé pour les autres."""
+        self.version += 1
+
+    # --- Instantané ---
+    def instantane(self) -> tuple:
+        return ({s: dict(a) for s, a in self._stations.items()}, dict(self._station_agent),
+                dict(self._recettes), self.version)
+
+    def restaurer(self, inst: tuple) -> None:
+        stations, station_agent, recettes, self.version = inst
+        self._stations = {s: dict(a) for s, a in stations.items()}
+        self._station_agent = dict(station_agent)
+        self._recettes = dict(recettes)
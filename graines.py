@@ -0,0 +1,32 @@
+# graines.py
+"""
+Graine de match et flux pseudo-aléatoires indépendants.
+
+Un match est entièrement décrit par une seule graine : la carte, les spawns, les commandes et
+chaque agent tirent dans leur propre `random.Random`, dérivé de la graine par un nom de flux.
+Les tirages d'un flux n'en décalent aucun autre (ajouter un agent ne change ni la carte ni les
+commandes), et un match rejoué dans un autre processus donne exactement le même résultat.
+"""
+import random
+
+
+class GrainesMatch:
+    def __init__(self, graine: int) -> None:
+        self.graine = graine
+
+    def flux(self, nom: str) -> random.Random:
+        # Graine textuelle : hachée en SHA-512 par `random`, donc stable d'un processus à l'autre
+        # (contrairement à hash(), randomisé par PYTHONHASHSEED)
+        return random.Random(f"{self.graine}/{nom}")
+
+    def carte(self) -> random.Random:
+        return self.flux("carte")
+
+    def spawns(self) -> random.Random:
+        return self.flux("spawns")
+
+    def commandes(self) -> random.Random:
+        return self.flux("commandes")
+
+    def agent(self, agent_id: int) -> random.Random:
+        return self.flux(f"agent/{agent_id}")
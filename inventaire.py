@@ -0,0 +1,131 @@
+# inventaire.py
+"""
+Index incrémental de l'inventaire de la cuisine.
+
+Le jeu tient à jour, pour chaque zone (mains, tables, cuisson, découpe), le nombre d'aliments
+par code (ingrédient, état). Toutes les prises, découpes, cuissons, poses et livraisons passent
+par ces méthodes, si bien que « que manque-t-il pour la recette R ? » se répond en
+O(taille de la recette), quelle que soit la taille de la cuisine.
+"""
+from typing import Dict, List, Optional
+
+from recette import Aliment, EtatAliment, Recette, code_de
+
+ZONES = ("mains", "tables", "cuisson", "decoupe")
+
+
+class InventaireCuisine:
+    def __init__(self) -> None:
+        self.zones: Dict[str, Dict[int, int]] = {z: {} for z in ZONES}
+        self.noms_en_cuisson: Dict[str, int] = {}
+        self.version = 0  # incrémentée à chaque changement d'inventaire
+
+    # ------------------------------------------------------------------
+    # COMPTEURS
+    # ------------------------------------------------------------------
+    def _ajouter(self, zone: str, aliment: Aliment) -> None:
+        compteurs = self.zones[zone]
+        c = code_de(aliment)
+        compteurs[c] = compteurs.get(c, 0) + 1
+        if zone == "cuisson":
+            self.noms_en_cuisson[aliment.nom] = self.noms_en_cuisson.get(aliment.nom, 0) + 1
+        self.version += 1
+
+    def _retirer(self, zone: str, aliment: Aliment) -> None:
+        compteurs = self.zones[zone]
+        c = code_de(aliment)
+        n = compteurs.get(c, 0) - 1
+        if n > 0: compteurs[c] = n
+        else: compteurs.pop(c, None)
+        if zone == "cuisson":
+            n = self.noms_en_cuisson.get(aliment.nom, 0) - 1
+            if n > 0: self.noms_en_cuisson[aliment.nom] = n
+            else: self.noms_en_cuisson.pop(aliment.nom, None)
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # ÉVÉNEMENTS DE JEU
+    # ------------------------------------------------------------------
+    def prise(self, aliment: Aliment) -> None:
+        """Un aliment sort d'un bac (ou d'ailleurs) dans les mains d'un joueur."""
+        self._ajouter("mains", aliment)
+
+    def livraison(self, aliment: Aliment) -> None:
+        self._retirer("mains", aliment)
+
+    def debut_decoupe(self, aliment: Aliment) -> None:
+        self._retirer("mains", aliment)
+        self._ajouter("decoupe", aliment)
+
+    def fin_decoupe(self, aliment: Aliment) -> None:
+        self._retirer("decoupe", aliment)
+        aliment.transformer(EtatAliment.COUPE)
+        self._ajouter("mains", aliment)
+
+    def debut_cuisson(self, aliment: Aliment) -> None:
+        self._retirer("mains", aliment)
+        self._ajouter("cuisson", aliment)
+
+    def fin_cuisson(self, aliment: Aliment) -> None:
+        self._retirer("cuisson", aliment)
+        aliment.transformer(EtatAliment.CUIT)
+        self._ajouter("cuisson", aliment)
+
+    def sortie_cuisson(self, aliment: Aliment) -> None:
+        self._retirer("cuisson", aliment)
+        self._ajouter("mains", aliment)
+
+    def poser_sur_table(self, stock: List[Aliment], aliment: Aliment) -> None:
+        self._retirer("mains", aliment)
+        stock.append(aliment)
+        self._ajouter("tables", aliment)
+
+    def prendre_sur_table(self, stock: List[Aliment], index: int = 0) -> Aliment:
+        aliment = stock.pop(index)
+        self._retirer("tables", aliment)
+        self._ajouter("mains", aliment)
+        return aliment
+
+    def vider_table(self, stock: List[Aliment]) -> None:
+        for a in stock:
+            self._retirer("tables", a)
+        stock.clear()
+
+    def assembler(self, stock: List[Aliment], plat: Aliment, depuis_main: Optional[Aliment] = None) -> None:
+        """Le contenu de la table (plus l'aliment tenu en main, s'il y en a un) devient `plat`."""
+        if depuis_main is not None: self._retirer("mains", depuis_main)
+        self.vider_table(stock)
+        stock.append(plat)
+        self._ajouter("tables", plat)
+
+    # ------------------------------------------------------------------
+    # REQUÊTES
+    # ------------------------------------------------------------------
+    def prochain_requis_manquant(self, recette: Recette, main: Optional[Aliment] = None) -> Optional[int]:
+        """
+        Index du premier ingrédient de `recette` qui n'est ni sur une table, ni en cuisson,
+        ni dans `main`, et dont aucun exemplaire n'est en train de cuire. O(taille de la recette).
+        """
+        tables = self.zones["tables"]
+        cuisson = self.zones["cuisson"]
+        code_main = code_de(main) if main is not None else -1
+        pris: Dict[int, int] = {}
+        for i, c in enumerate(recette.codes):
+            deja = pris.get(c, 0)
+            if tables.get(c, 0) + cuisson.get(c, 0) + (c == code_main) > deja:
+                pris[c] = deja + 1
+                continue
+            if recette.requis[i].nom in self.noms_en_cuisson: continue
+            return i
+        return None
+
+    # ------------------------------------------------------------------
+    # INSTANTANÉ
+    # ------------------------------------------------------------------
+    def instantane(self) -> tuple:
+        return ({z: dict(c) for z, c in self.zones.items()}, dict(self.noms_en_cuisson), self.version)
+
+    def restaurer(self, inst: tuple) -> None:
+        zones, noms, self.version = inst
+        self.zones = {z: dict(c) for z, c in zones.items()}
+        self.noms_en_cuisson = dict(noms)
@@ -1,21 +1,20 @@
 import tkinter as tk
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple
 import time
+import random
 
 from end_screen import EndScreen
-from carte import Carte
-from player import Player
-from recette import (
-    Aliment, EtatAliment, Recette,
-    ALIMENTS_BAC, nouvelle_recette
-)
-from agent import Agent
-from map_generator import generate_map
+from map_generator import generate_map, extra_spawns
+from simulation import Simulation, DT_DEFAUT
+from graines import GrainesMatch
 
 # Constantes globales
 W, H = 600, 600
 GAME_DURATION_S = 90
-TICK_MS = 100
+IMAGE_S = 0.04         # période d'affichage (25 images/s), indépendante du pas de simulation
+VITESSES = {"x1": 1.0, "x2": 2.0, "x8": 8.0, "max": None}  # None : autant de pas que le budget le permet
+BUDGET_IMAGE_S = 0.03  # temps de calcul par image, pour que la fenêtre reste réactive
+RETARD_MAX_S = 0.5     # retard de simulation rattrapable ; au-delà il est abandonné
 sprites_game1 = [
         "texture/boss.png",  # Agent 1
         "texture/paul.png",  # Agent 2 (si présent)
@@ -27,122 +26,88 @@ sprites_game2 = [
 ]
 
 class Game:
+    """
+    Vue Tk d'une `Simulation`. La simulation avance par pas fixes de `DT_DEFAUT` sur une horloge
+    virtuelle (temps réel x `vitesse`) : plusieurs pas par rappel en accéléré, mais une seule image.
+
+    Les images sont planifiées sur des échéances fixes (pas de dérive quand le dessin est lent) ;
+    les pas manqués sont rattrapés aux images suivantes et les joueurs sont dessinés entre leurs
+    positions des deux derniers pas.
+    """
     def __init__(self, root: tk.Tk, grille_data: List[List[int]], spawn_positions: List[Tuple[int, int]], 
-                 strategie_1="naive", strategie_2="naive", nb_agents=2, sprite_paths=None) -> None:
+                 strategie_1="naive", strategie_2="naive", nb_agents=2, sprite_paths=None, graine=None,
+                 vitesse: Optional[float] = 1.0) -> None:
         self.root = root
+        self.vitesse = vitesse
         self.canvas = tk.Canvas(root, width=W, height=H)
         self.canvas.pack()
 
-        # Initialisation de la carte avec la grille générée
-        self.carte = Carte(grille_data, largeur=W, hauteur=H)
-        self.carte.assigner_bacs(ALIMENTS_BAC)
-        
-        self.score = 0
-        self.start_time = time.time()
-        self.deadline = self.start_time + GAME_DURATION_S
-        
-        self.recettes: List[Recette] = [nouvelle_recette() for _ in range(3)]
-        self.recettes_livrees = []
-        
-        self.cuissons: dict[Tuple[int, int], Tuple[Aliment, float, float]] = {}
-        
-        # Stockage des actions par agent
-        self.actions_en_cours: Dict[Agent, Tuple[str, Tuple[int,int], Aliment, float, float]] = {}
+        # Choix de la stratégie (J1 prend strat1, les suivants strat2)
+        strategies = [strategie_1] + [strategie_2] * (nb_agents - 1)
+        self.sim = Simulation(grille_data, spawn_positions, strategies, GAME_DURATION_S,
+                              move_every_ticks=2.0, largeur=W, hauteur=H, graine=graine)
 
-        # --- CRÉATION DYNAMIQUE DES JOUEURS/AGENTS ---
-        self.players = []
-        self.agents = []
-        
-        # On s'assure de ne pas essayer de créer plus d'agents que de points de spawn disponibles
-        # (Le générateur de map en fournit généralement 2)
-        limit_agents = min(nb_agents, len(spawn_positions))
-
-        for i in range(limit_agents):
-            sx, sy = spawn_positions[i]
-            
-            # Création joueur
+        # Rendu : textures de la carte et sprites des joueurs (la simulation s'en passe)
+        self.carte = self.sim.carte
+        self.carte.charger_textures()
+        for i, p in enumerate(self.sim.players):
             if sprite_paths is not None and i < len(sprite_paths):
                 sprite_path = sprite_paths[i]
             else:
                 # Sprite par défaut si pas de liste fournie ou pas assez d’entrées
                 sprite_path = "texture/Player.png"
-            
-            # Création joueur avec sprite spécifique
-            p = Player(sx, sy, sprite_path=sprite_path, label=f"P{i+1}")
-            self.players.append(p)
+            p.charger_sprite(sprite_path)
 
+        self.horloge = 0.0  # temps simulé visé par l'horloge virtuelle
+        self._positions_prec = [(p.x, p.y) for p in self.sim.players]  # avant le dernier pas
+        # Statistiques de la boucle
+        self.images = 0
+        self.images_sautees = 0   # échéances manquées en entier
+        self.gigue_totale_s = 0.0  # retard des rappels sur leur échéance
+        self.gigue_max_s = 0.0
+        self.retard_abandonne_s = 0.0
 
-            # Choix de la stratégie (J1 prend strat1, J2 prend strat2)
-            strat = strategie_1 if i == 0 else strategie_2
-            
-            # Création agent
-            a = Agent(self, p, strat, agent_id=i)
-            self.agents.append(a)
-
-        # Liaison des partenaires
-        if limit_agents == 2:
-            self.agents[0].partner = self.agents[1]
-            self.agents[1].partner = self.agents[0]
-        elif limit_agents == 1:
-            self.agents[0].partner = None
-
-        self.last_tick = time.time()
         self._refresh()
-        self.root.after(TICK_MS, self._tick)
+        self.last_tick = time.perf_counter()
+        self._echeance = self.last_tick + IMAGE_S
+        self._planifier()
 
-    def get_time(self) -> float:
-        return time.time()
+    # Raccourcis lus par l'écran de fin
+    @property
+    def score(self) -> int:
+        return self.sim.score
 
-    def trigger_action_bloquante(self, agent: Agent, type_action, pos, aliment, duree):
-        """L'agent signale qu'il commence une action (ex: découpe)."""
-        now = self.get_time()
-        self.actions_en_cours[agent] = (type_action, pos, aliment, now, now + duree)
+    @property
+    def recettes_livrees(self):
+        return self.sim.recettes_livrees
 
-    def start_cooking(self, pos, aliment, duree):
-        start = self.get_time()
-        self.cuissons[pos] = (aliment, start, start + duree)
+    @property
+    def termine(self) -> bool:
+        return self.sim.termine
 
-    def deliver_recipe(self, index, recette):
-        self.score += recette.difficulte_reelle
-        self.recettes_livrees.append((recette.nom, recette.complexite))
-        self.recettes.pop(index)
-        self.recettes.append(nouvelle_recette())
+    def _planifier(self) -> None:
+        attente_ms = round((self._echeance - time.perf_counter()) * 1000)
+        self.root.after(max(0, attente_ms), self._tick)
 
     def _tick(self):
         try:
-            now = self.get_time()
+            now = time.perf_counter()
             dt = now - self.last_tick
             self.last_tick = now
 
-            if now >= self.deadline: return
-
-            self._update_physics()
+            gigue = max(0.0, now - self._echeance)
+            self.gigue_totale_s += gigue
+            self.gigue_max_s = max(self.gigue_max_s, gigue)
+            self.images += 1
+            # Prochaine échéance sur la grille fixe ; les images déjà manquées sont sautées
+            sautees = int(gigue // IMAGE_S)
+            self.images_sautees += sautees
+            self._echeance += (sautees + 1) * IMAGE_S
 
-            # 1. GESTION DES ACTIONS BLOQUANTES
-            agents_occupes = set()
-            
-            for agent in list(self.actions_en_cours.keys()):
-                type_action, _, aliment, _, t_fin = self.actions_en_cours[agent]
-                
-                if now >= t_fin:
-                    # Action terminée
-                    if type_action == "DECOUPE":
-                        aliment.transformer(EtatAliment.COUPE)
-                    del self.actions_en_cours[agent]
-                    agent._mark_progress()
-                else:
-                    # Action en cours
-                    agents_occupes.add(agent)
-
-            # 2. UPDATE DES AGENTS LIBRES
-            for agent in self.agents:
-                if agent not in agents_occupes:
-                    agent.tick()
-
-            # 3. UPDATE DES JOUEURS (Animation)
-            for p in self.players:
-                p.update(dt)
+            if self.sim.termine: return
 
+            self._avancer(dt, now + BUDGET_IMAGE_S)
+            self._interpoler()
             self._refresh()
 
         except Exception as e:
@@ -150,18 +115,48 @@ class Game:
             import traceback
             traceback.print_exc()
 
-        self.root.after(TICK_MS, self._tick)
+        self._planifier()
 
-    def _update_physics(self):
-        now = self.get_time()
-        for pos, (alim, _, tfin) in list(self.cuissons.items()):
-            if now >= tfin and alim.etat != EtatAliment.CUIT:
-                alim.transformer(EtatAliment.CUIT)
+    def _avancer(self, dt_reel: float, echeance: float) -> None:
+        """Joue les pas dus par l'horloge virtuelle, sans dépasser `echeance` (temps réel)."""
+        sim = self.sim
+        if self.vitesse is None: self.horloge = float("inf")
+        else: self.horloge += dt_reel * self.vitesse
+        while not sim.termine and sim.current_sim_time + DT_DEFAUT <= self.horloge + 1e-9:
+            if time.perf_counter() >= echeance: break  # la suite sera rattrapée aux images suivantes
+            self._positions_prec = [(p.x, p.y) for p in sim.players]
+            sim.pas(DT_DEFAUT)
+
+        if self.vitesse is None:
+            self.horloge = sim.current_sim_time
+        else:
+            # Le calcul ne suit pas : au-delà de RETARD_MAX_S, on abandonne le retard plutôt que de l'accumuler
+            retard = self.horloge - sim.current_sim_time
+            if retard > RETARD_MAX_S:
+                self.retard_abandonne_s += retard - RETARD_MAX_S
+                self.horloge = sim.current_sim_time + RETARD_MAX_S
+
+    def _interpoler(self) -> None:
+        """Position affichée des joueurs : fraction du pas en cours écoulée sur l'horloge virtuelle."""
+        alpha = (self.horloge - self.sim.current_sim_time) / DT_DEFAUT
+        alpha = 1.0 if self.sim.termine else max(0.0, min(1.0, alpha))
+        for p, depart in zip(self.sim.players, self._positions_prec):
+            p.update(depart, alpha)
+
+    def stats_boucle(self) -> dict:
+        n = max(1, self.images)
+        return {
+            "images": self.images,
+            "images_sautees": self.images_sautees,
+            "gigue_moyenne_ms": self.gigue_totale_s / n * 1000,
+            "gigue_max_ms": self.gigue_max_s * 1000,
+            "retard_abandonne_s": self.retard_abandonne_s,
+        }
 
     def _refresh(self):
         self.carte.dessiner(self.canvas) 
         
-        for p in self.players:
+        for p in self.sim.players:
             p.dessiner_personnage(self.canvas, self.carte)
             
         self._dessiner_progress_stations()
@@ -169,7 +164,7 @@ class Game:
         self._dessiner_hud()
 
     def _dessiner_progress_stations(self):
-        now = self.get_time()
+        now = self.sim.current_sim_time
         def draw_bar(sx, sy, t0, tfin, kind: str):
             total = tfin - t0
             if total <= 0: return
@@ -186,11 +181,11 @@ class Game:
             fx2 = bx1 + ratio * (bx2 - bx1)
             self.canvas.create_rectangle(bx1, by1, fx2, by2, fill=color, outline="")
 
-        for agent, (type_act, pos, _, t_deb, t_fin) in self.actions_en_cours.items():
+        for agent, (type_act, pos, _, t_deb, t_fin) in self.sim.actions_en_cours.items():
             if type_act == "DECOUPE" and pos:
                 draw_bar(pos[0], pos[1], t_deb, t_fin, "DECOUPE")
         
-        for (sx, sy), (_, t0, tfin) in self.cuissons.items():
+        for (sx, sy), (_, t0, tfin) in self.sim.cuissons.items():
             draw_bar(sx, sy, t0, tfin, "CUISSON")
 
     def _dessiner_debug_path(self):
@@ -198,7 +193,7 @@ class Game:
         tile = min(self.carte.largeur_px // self.carte.cols, self.carte.hauteur_px // self.carte.rows)
         cw = ch = int(tile)
         
-        for i, agent in enumerate(self.agents):
+        for i, agent in enumerate(self.sim.agents):
             if not agent.current_path: continue
             nx, ny = agent.current_path[0]
             col = colors[i % len(colors)]
@@ -210,9 +205,10 @@ class Game:
             )
 
     def _dessiner_hud(self):
-        now = self.get_time()
-        remaining = max(0, int(self.deadline - now))
-        info = f"⏱ {remaining//60:02d}:{remaining%60:02d}    ★ Score: {self.score}"
+        remaining = max(0, int(self.sim.duration_s - self.sim.current_sim_time))
+        vitesse = "max" if self.vitesse is None else f"x{self.vitesse:g}"
+        gigue = self.gigue_totale_s / max(1, self.images) * 1000
+        info = f"⏱ {remaining//60:02d}:{remaining%60:02d}    ★ Score: {self.score}    ⏩ {vitesse}    gigue {gigue:.0f} ms"
         
         self.canvas.delete("hud") 
         
@@ -227,15 +223,15 @@ class Game:
         self.canvas.create_line(SPLIT_X, panel_y0, SPLIT_X, H, fill="#555")
 
         y = panel_y0 + 4
-        for i, r in enumerate(self.recettes):
+        for i, r in enumerate(self.sim.recettes):
             need = " + ".join(f"{req.nom}" for req in r.requis)
             self.canvas.create_text(8, y, text=f"{i+1}. {r.nom} [{need}]", fill="white", anchor="nw", font=("Arial", 10), width=SPLIT_X-16)
             y += 34
 
         dx = SPLIT_X + 8
         dy = panel_y0 + 4
-        for i, agent in enumerate(self.agents):
-            status = "Occupé" if agent in self.actions_en_cours else "Libre"
+        for i, agent in enumerate(self.sim.agents):
+            status = "Occupé" if agent in self.sim.actions_en_cours else "Libre"
             recette_nom = agent.bot_recette.nom if agent.bot_recette else '...'
             txt = f"J{i+1}: {recette_nom} ({status})"
             self.canvas.create_text(dx, dy, text=txt, fill="white", anchor="nw", font=("Arial", 9))
@@ -243,18 +239,22 @@ class Game:
 
 
 def main(nb_agents_1=2, strat_1a="naive", strat_1b="naive",
-         nb_agents_2=2, strat_2a="naive", strat_2b="naive"):
-    
+         nb_agents_2=2, strat_2a="naive", strat_2b="naive", graine=None, vitesse="x1"):
+    # Une seule graine décrit tout le match (carte, spawns, commandes, agents) : on l'affiche pour le rejouer
+    if graine is None: graine = random.randrange(1 << 32)
+    print(f"Graine du match : {graine}")
+    graines = GrainesMatch(graine)
+
     root = tk.Tk()
     root.title(f"Overcooked Mini — {nb_agents_1} vs {nb_agents_2}")
     root.resizable(False, False)
 
     # 1. GÉNÉRATION DE LA MAP (Identique pour les deux équipes pour l'équité)
     # On génère une seule fois la grille et les spawns
-    grille_generee, spawn1, spawn2 = generate_map()
+    grille_generee, spawn1, spawn2 = generate_map(rng=graines.carte())
     
-    # On met les spawns dans une liste pour les passer à la classe Game
-    spawns = [spawn1, spawn2]
+    # On met les spawns dans une liste pour les passer à la classe Game (complétée si équipes > 2)
+    spawns = extra_spawns(grille_generee, [spawn1, spawn2], max(nb_agents_1, nb_agents_2), rng=graines.spawns())
 
     
 
@@ -270,7 +270,8 @@ def main(nb_agents_1=2, strat_1a="naive", strat_1b="naive",
     
     # On passe la grille générée et les spawns
     g1 = Game(f1, grille_data=grille_generee, spawn_positions=spawns,
-              strategie_1=strat_1a, strategie_2=strat_1b, nb_agents=nb_agents_1, sprite_paths=sprites_game1)
+              strategie_1=strat_1a, strategie_2=strat_1b, nb_agents=nb_agents_1, sprite_paths=sprites_game1, graine=graine,
+              vitesse=VITESSES[vitesse])
 
 
     # --- ÉQUIPE 2 ---
@@ -281,11 +282,31 @@ def main(nb_agents_1=2, strat_1a="naive", strat_1b="naive",
     
     # On passe la MÊME grille et les MÊMES spawns (compétition sur terrain égal)
     g2 = Game(f2, grille_data=grille_generee, spawn_positions=spawns,
-              strategie_1=strat_2a, strategie_2=strat_2b, nb_agents=nb_agents_2, sprite_paths=sprites_game2)
+              strategie_1=strat_2a, strategie_2=strat_2b, nb_agents=nb_agents_2, sprite_paths=sprites_game2, graine=graine,
+              vitesse=VITESSES[vitesse])
+
+    # --- VITESSE DE LECTURE (partagée par les deux équipes, touches 1 à 4) ---
+    choix_vitesse = tk.StringVar(value=vitesse)
+    def changer_vitesse(*_):
+        for g in (g1, g2): g.vitesse = VITESSES[choix_vitesse.get()]
+    choix_vitesse.trace_add("write", changer_vitesse)
+
+    barre = tk.Frame(root)
+    barre.pack(pady=4)
+    tk.Label(barre, text="Vitesse :").pack(side="left")
+    for i, nom in enumerate(VITESSES):
+        tk.Radiobutton(barre, text=nom, value=nom, variable=choix_vitesse, indicatoron=False,
+                       width=4).pack(side="left", padx=2)
+        root.bind(str(i + 1), lambda _e, nom=nom: choix_vitesse.set(nom))
 
     def check_end():
-        now = time.time()
-        if now >= g1.deadline:
+        # En accéléré, une équipe peut finir avant l'autre : on attend les deux
+        if g1.termine and g2.termine:
+            for nom, g in (("Équipe 1", g1), ("Équipe 2", g2)):
+                st = g.stats_boucle()
+                print(f"{nom} : {st['images']} images ({st['images_sautees']} sautées), "
+                      f"gigue moyenne {st['gigue_moyenne_ms']:.1f} ms (max {st['gigue_max_ms']:.1f} ms), "
+                      f"retard abandonné {st['retard_abandonne_s']:.1f} s")
             EndScreen(root, {"score": g1.score, "recettes": g1.recettes_livrees},
                             {"score": g2.score, "recettes": g2.recettes_livrees})
         else:
@@ -204,16 +204,16 @@ def can_place_square2(grid, x, y):
 # -------------------------------------------------------------------
 # Placement d’un groupe (lignes + carrés 2×2)
 # -------------------------------------------------------------------
-def place_group(grid, block_type):
+def place_group(grid, block_type, rng=random):
     rows, cols = len(grid), len(grid[0])
 
     for _ in range(300):
 
-        shape = random.choice(["lineH", "lineV", "square"])
-        length = random.choice([1, 2, 3, 4])  # mix équilibré
+        shape = rng.choice(["lineH", "lineV", "square"])
+        length = rng.choice([1, 2, 3, 4])  # mix équilibré
 
-        x = random.randint(1, cols-2)
-        y = random.randint(1, rows-2)
+        x = rng.randint(1, cols-2)
+        y = rng.randint(1, rows-2)
 
         if shape == "square":
             coords = can_place_square2(grid, x, y)
@@ -246,7 +246,7 @@ def place_group(grid, block_type):
 
     return False
 
-def place_two_adjacent_services(grid):
+def place_two_adjacent_services(grid, rng=random):
     """
     Place 2 blocs SERVICE adjacents (horizontal OU vertical)
     et collés à un mur.
@@ -276,7 +276,7 @@ def place_two_adjacent_services(grid):
     if not candidates:
         return False
 
-    (x1, y1), (x2, y2) = random.choice(candidates)
+    (x1, y1), (x2, y2) = rng.choice(candidates)
     grid[y1][x1] = SERVICE
     grid[y2][x2] = SERVICE
     return True
@@ -299,12 +299,16 @@ def generate_map(
         nb_decoupes=2,
         nb_services=2,
         nb_assemblages=2,
-        nb_poeles=2):
+        nb_poeles=2,
+        rng=None):
 
     # Par sécurité, on impose qu'il y ait au moins 2 services
     if nb_services < 2:
         raise ValueError("nb_services doit être >= 2 pour placer 2 blocs adjacents")
 
+    # Flux aléatoire de la carte (voir graines.GrainesMatch) ; à défaut, le module `random`
+    rng = rng or random
+
     while True:
 
         # -----------------------
@@ -319,7 +323,7 @@ def generate_map(
         # -----------------------
         # 2) Placer les 2 services adjacents
         # -----------------------
-        if not place_two_adjacent_services(grid):
+        if not place_two_adjacent_services(grid, rng):
             # Si on n'y arrive pas, on recommence une map
             continue
 
@@ -337,11 +341,11 @@ def generate_map(
             [DECOUPE]      * nb_decoupes +
             [POELE]        * nb_poeles
         )
-        random.shuffle(blocks)
+        rng.shuffle(blocks)
 
         ok = True
         for block in blocks:
-            if not place_group(grid, block):
+            if not place_group(grid, block, rng):
                 ok = False
                 break
 
@@ -356,8 +360,23 @@ def generate_map(
         if len(free) < 2:
             continue
 
-        p1 = random.choice(free)
+        p1 = rng.choice(free)
         free.remove(p1)
-        p2 = random.choice(free)
+        p2 = rng.choice(free)
 
         return grid, p1, p2
+
+
+def extra_spawns(grid, spawns, n, rng=None):
+    """
+    Complète la liste `spawns` jusqu'à `n` positions de départ distinctes,
+    tirées au hasard parmi les cases SOL libres (équipes de plus de 2 agents).
+    """
+    spawns = list(spawns)
+    if len(spawns) >= n:
+        return spawns
+    rows, cols = len(grid), len(grid[0])
+    free = [(x, y) for y in range(rows) for x in range(cols)
+            if grid[y][x] == SOL and (x, y) not in spawns]
+    spawns.extend((rng or random).sample(free, min(n - len(spawns), len(free))))
+    return spawns
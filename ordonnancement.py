@@ -0,0 +1,263 @@
+# ordonnancement.py
+"""
+Ordonnanceur central de la cuisine (stratégie « ordonnance »).
+
+Au lieu de choisir chacun sa recette, les agents « ordonnance » reçoivent leurs tâches d'un
+ordonnanceur d'équipe qui découpe les commandes actives en tâches :
+- « ingredient » : aller au bac, découper / cuire si besoin, porter à une table d'assemblage ;
+- « sortir »     : récupérer un aliment au four ou à la poêle (cuit ou bientôt cuit) ;
+- « servir »     : prendre un plat prêt sur une table et le porter au service.
+
+Chaque tâche est estimée en secondes : trajets (table des distances de la carte), découpe et
+cuisson (`TEMPS_COUPE` / `TEMPS_CUISSON`) et disponibilité des planches et des feux (occupés
+jusqu'à la fin des actions en cours, puis réservés par les tâches déjà distribuées). Les tâches
+sont distribuées gloutonnement aux agents libres, par points par seconde décroissants
+(`difficulte_reelle` / durée estimée) : une liste d'ordonnancement de type job-shop.
+
+Une table d'assemblage compose le plat dès qu'un ingrédient compatible y est posé (cas C de
+`Agent.try_action`) : une seule chaîne d'ingrédient suffit par commande, l'ordonnanceur choisit
+donc l'ingrédient le moins coûteux de chaque commande et n'en lance qu'une à la fois.
+"""
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from recette import EtatAliment, Recette, TEMPS_COUPE, TEMPS_CUISSON, code_aliment, signature_aliments, masque_compatibles
+
+STRATEGIE = "ordonnance"
+DT_PAS = 0.1  # secondes par tick (DT_DEFAUT de la simulation)
+DELAI_ABANDON_S = 4.0  # une tâche qui dépasse son estimation d'autant est abandonnée (chaîne bloquée)
+MISE_A_L_ECART_S = 10.0  # durée pendant laquelle une chaîne abandonnée n'est plus proposée
+
+Coord = Tuple[int, int]
+
+
+class Tache(NamedTuple):
+    genre: str                 # "ingredient", "sortir" ou "servir"
+    recette: Recette
+    idx: int                   # requis visé (tâches « ingredient »), -1 sinon
+    station: Optional[Coord]   # table d'assemblage de destination, ou four/poêle/table à vider
+    fin_estimee: float         # instant de livraison estimé
+
+
+class OrdonnanceurCuisine:
+    def __init__(self, jeu) -> None:
+        self.jeu = jeu
+        self.taches: Dict[int, Tache] = {}  # agent_id -> tâche en cours
+        # (id(recette), idx) des chaînes d'ingrédient abandonnées -> instant où elles redeviennent proposables.
+        # Les recettes étant partagées (RECETTES_POOL), l'entrée tombe aussi à la livraison de la commande.
+        self.abandons: Dict[Tuple[int, int], float] = {}
+        self._trajets: Dict[Tuple[Coord, Coord], int] = {}
+        # Statistiques
+        self.distributions = 0
+        self.taches_distribuees = 0
+        self.abandons_total = 0
+
+    # ------------------------------------------------------------------
+    # INTERFACE AGENT
+    # ------------------------------------------------------------------
+    def tache(self, agent) -> Optional[Tache]:
+        """Tâche de `agent` (mains vides) : la sienne si elle tient toujours, sinon une nouvelle distribution."""
+        t = self.taches.get(agent.agent_id)
+        if t is not None and self._valide(t):
+            if self.jeu.current_sim_time <= t.fin_estimee + DELAI_ABANDON_S: return t
+            # Estimation largement dépassée (bac inaccessible, station prise...) : on passe à autre chose
+            if t.genre == "ingredient":
+                self.abandons[(id(t.recette), t.idx)] = self.jeu.current_sim_time + MISE_A_L_ECART_S
+            self.abandons_total += 1
+        self.taches.pop(agent.agent_id, None)
+        self._distribuer(agent)
+        return self.taches.get(agent.agent_id)
+
+    def table_pour(self, agent) -> Optional[Coord]:
+        """
+        Table où poser l'aliment tenu : celle de la tâche si elle peut le recevoir, sinon la plus
+        proche qui le peut (vide, ou dont le contenu complété reste compatible), sinon aucune préférence.
+        """
+        jeu = self.jeu
+        item = agent.player.item
+        pos = (agent.player.x, agent.player.y)
+        t = self.taches.get(agent.agent_id)
+
+        def accueille(table: Coord) -> bool:
+            stock = jeu.carte.assemblage_stock.get(table)
+            if not stock: return True
+            m = masque_compatibles(signature_aliments(stock) + signature_aliments([item]))
+            return any((m >> r.uid) & 1 for r in jeu.recettes)
+
+        if t is not None and t.genre == "ingredient" and accueille(t.station): return t.station
+        tables = [s for s in jeu.carte.pos_assemblages if accueille(s)]
+        if not tables: return None
+        return min(tables, key=lambda s: jeu.carte.distance_station(pos, s))
+
+    def commande_livree(self, recette: Recette) -> None:
+        """La commande sort de la file : ses chaînes abandonnées redeviennent proposables."""
+        for cle in [c for c in self.abandons if c[0] == id(recette)]:
+            del self.abandons[cle]
+
+    def instantane(self) -> tuple:
+        return (dict(self.taches), dict(self.abandons),
+                (self.distributions, self.taches_distribuees, self.abandons_total))
+
+    def restaurer(self, inst: tuple) -> None:
+        taches, abandons, stats = inst
+        self.taches = dict(taches)
+        self.abandons = dict(abandons)
+        self.distributions, self.taches_distribuees, self.abandons_total = stats
+
+    def stats(self) -> dict:
+        return {"distributions": self.distributions, "taches": self.taches_distribuees,
+                "abandons": self.abandons_total}
+
+    # ------------------------------------------------------------------
+    # VALIDITÉ
+    # ------------------------------------------------------------------
+    def _plat_pret(self, recette: Recette) -> bool:
+        if any(p.item is not None and p.item.nom == recette.nom for p in self.jeu.players): return True
+        return any(len(s) == 1 and s[0].nom == recette.nom for s in self.jeu.carte.assemblage_stock.values())
+
+    def _valide(self, t: Tache) -> bool:
+        jeu = self.jeu
+        if t.recette not in jeu.recettes: return False
+        if t.genre == "servir":
+            stock = jeu.carte.assemblage_stock.get(t.station)
+            return bool(stock) and len(stock) == 1 and stock[0].nom == t.recette.nom
+        if t.genre == "sortir":
+            return t.station in jeu.cuissons
+        # Ingrédient : terminé dès qu'il cuit, qu'il est posé dans son état final ou que le plat existe
+        req = t.recette.requis[t.idx]
+        if req.nom in jeu.inventaire.noms_en_cuisson: return False
+        if jeu.inventaire.zones["tables"].get(code_aliment(req.nom, req.etat_final), 0): return False
+        return not self._plat_pret(t.recette)
+
+    # ------------------------------------------------------------------
+    # ESTIMATIONS
+    # ------------------------------------------------------------------
+    def _trajet(self, depuis: Coord, vers: Coord) -> int:
+        """Pas entre deux stations (depuis la meilleure case adjacente à `depuis`)."""
+        cle = (depuis, vers)
+        d = self._trajets.get(cle)
+        if d is None:
+            carte = self.jeu.carte
+            sx, sy = depuis
+            cases = [(sx + dx, sy + dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                     if carte.est_praticable(sx + dx, sy + dy)]
+            d = min((carte.distance_station(c, vers) - 1 for c in cases),
+                    default=abs(sx - vers[0]) + abs(sy - vers[1]))
+            self._trajets[cle] = d
+        return d
+
+    def _au_plus_pres(self, depuis: Coord, stations: List[Coord], s_pas: float) -> Tuple[Optional[Coord], float]:
+        if not stations: return None, float("inf")
+        best = min(stations, key=lambda s: self._trajet(depuis, s))
+        return best, self._trajet(depuis, best) * s_pas
+
+    def _servir_depuis(self, station: Coord, s_pas: float) -> Tuple[Optional[Coord], float]:
+        """Table d'assemblage la plus proche de `station`, et durée station -> table -> service."""
+        carte = self.jeu.carte
+        table, t_table = self._au_plus_pres(station, carte.pos_assemblages, s_pas)
+        if table is None: return None, float("inf")
+        _, t_service = self._au_plus_pres(table, carte.pos_services, s_pas)
+        return table, t_table + t_service
+
+    def _chaine_ingredient(self, pos: Coord, s_pas: float, recette: Recette, idx: int,
+                           libre: Dict[Coord, float], now: float):
+        """(fin estimée, table, [(station, fin d'occupation)]) de la chaîne bac -> ... -> service."""
+        carte = self.jeu.carte
+        req = recette.requis[idx]
+        bacs = carte.bacs_pour(req.nom)
+        if not bacs: return None
+        bac = min(bacs, key=lambda b: carte.distance_station(pos, b))
+        t = now + carte.distance_station(pos, bac) * s_pas
+        ici = bac
+        occupations = []
+        etat = EtatAliment.SORTI_DU_BAC
+        while etat != req.etat_final:
+            etat = req.etape_suivante(etat)
+            if etat == EtatAliment.COUPE:
+                stations, duree = carte.pos_decoupes, TEMPS_COUPE.get(req.nom, 1.0)
+            else:
+                stations, duree = carte.pos_fours + carte.pos_poeles, TEMPS_CUISSON.get(req.nom, 2.0)
+            if not stations: return None
+            # Station qui finit le plus tôt : trajet, attente qu'elle se libère, puis l'opération
+            fin, station = min((max(t + self._trajet(ici, s) * s_pas, libre.get(s, now)) + duree, s) for s in stations)
+            occupations.append((station, fin))
+            t, ici = fin, station
+        table, t_fin = self._servir_depuis(ici, s_pas)
+        if table is None: return None
+        return t + t_fin, table, occupations
+
+    # ------------------------------------------------------------------
+    # DISTRIBUTION (liste d'ordonnancement gloutonne)
+    # ------------------------------------------------------------------
+    def _distribuer(self, demandeur) -> None:
+        jeu = self.jeu
+        now = jeu.current_sim_time
+        self.distributions += 1
+        for cle in [c for c, fin in self.abandons.items() if fin <= now]:
+            del self.abandons[cle]
+
+        # Agents libres : ceux de la stratégie sans tâche valide, mains vides et pas en pleine découpe
+        libres = [a for a in jeu.agents
+                  if a.strategie == STRATEGIE and a.agent_id not in self.taches
+                  and a.player.item is None and a not in jeu.actions_en_cours]
+        if demandeur not in libres: libres.append(demandeur)
+
+        # Occupation des planches et des feux : actions en cours, puis tâches déjà distribuées
+        libre: Dict[Coord, float] = {}
+        for pos, (_, _, tfin) in jeu.cuissons.items(): libre[pos] = tfin
+        for (_, pos, _, _, tfin) in jeu.actions_en_cours.values():
+            if pos: libre[pos] = max(libre.get(pos, now), tfin)
+
+        prises = {id(t.recette) for t in self.taches.values() if t.genre == "ingredient"}
+        prises_stations = {t.station for t in self.taches.values() if t.genre != "ingredient"}
+        taches_fixes = self._taches_fixes(now, prises_stations)
+
+        while libres:
+            meilleur = None  # (points par seconde, agent, tâche, occupations)
+            for a in libres:
+                pos = (a.player.x, a.player.y)
+                s_pas = a.pas_ticks * DT_PAS
+                for genre, recette, station, pret, pas_apres in taches_fixes:
+                    fin = max(now + jeu.carte.distance_station(pos, station) * s_pas, pret) + pas_apres * s_pas
+                    cand = (recette.difficulte_reelle / max(DT_PAS, fin - now), a,
+                            Tache(genre, recette, -1, station, fin), [])
+                    if meilleur is None or cand[0] > meilleur[0]: meilleur = cand
+                for recette in jeu.recettes:
+                    if id(recette) in prises or self._plat_pret(recette): continue
+                    for idx in range(len(recette.requis)):
+                        if (id(recette), idx) in self.abandons: continue
+                        chaine = self._chaine_ingredient(pos, s_pas, recette, idx, libre, now)
+                        if chaine is None: continue
+                        fin, table, occupations = chaine
+                        cand = (recette.difficulte_reelle / max(DT_PAS, fin - now), a,
+                                Tache("ingredient", recette, idx, table, fin), occupations)
+                        if meilleur is None or cand[0] > meilleur[0]: meilleur = cand
+            if meilleur is None: break
+
+            _, a, t, occupations = meilleur
+            self.taches[a.agent_id] = t
+            self.taches_distribuees += 1
+            libres.remove(a)
+            if t.genre == "ingredient":
+                prises.add(id(t.recette))
+                for station, fin in occupations: libre[station] = fin
+            else:
+                taches_fixes = [f for f in taches_fixes if f[2] != t.station]
+
+    def _taches_fixes(self, now: float, exclues) -> list:
+        """Plats à servir et cuissons à sortir : (genre, recette, station, prêt à, pas ensuite)."""
+        jeu = self.jeu
+        carte = jeu.carte
+        fixes = []
+        for pos, stock in carte.assemblage_stock.items():
+            if pos in exclues or len(stock) != 1: continue
+            recette = next((r for r in jeu.recettes if r.nom == stock[0].nom), None)
+            if recette is None: continue
+            _, pas_service = self._au_plus_pres(pos, carte.pos_services, 1)
+            fixes.append(("servir", recette, pos, now, pas_service))
+        for pos, (alim, _, tfin) in jeu.cuissons.items():
+            if pos in exclues: continue
+            recette = next((r for r in jeu.recettes if any(req.nom == alim.nom for req in r.requis)), None)
+            if recette is None: continue
+            _, pas_apres = self._servir_depuis(pos, 1)
+            fixes.append(("sortir", recette, pos, tfin, pas_apres))
+        return fixes
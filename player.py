@@ -1,8 +1,8 @@
-import tkinter as tk
 from typing import Optional, Iterable, Tuple
-from PIL import Image, ImageTk
 from recette import Aliment
 
+# tkinter / PIL ne servent qu'au rendu : importés à la demande (sprites, dessin)
+
 TILE_SIZE = 32
 SPRITE_SCALE = 1.7  # 1.0 = taille de la tuile, 1.3 = un peu plus grand
 
@@ -17,7 +17,6 @@ class Player:
 
         self.anim_x = float(x)
         self.anim_y = float(y)
-        self.anim_speed = 0.1
         self.moving = False
         self.direction = "down"
         self.frame_index = 0
@@ -28,7 +27,13 @@ class Player:
         else:
             self.frames = None
 
+    def charger_sprite(self, path: str) -> None:
+        """Attache une planche de sprites au joueur (rendu Tk uniquement)."""
+        self.has_sprite = True
+        self._load_sprite_sheet(path)
+
     def _load_sprite_sheet(self, path: str):
+        from PIL import Image, ImageTk
         img = Image.open(path)
         directions = ["down", "left", "right", "up"]
         self.frames = {d: [] for d in directions}
@@ -52,7 +57,7 @@ class Player:
 
     def _try_move(self, dx: int, dy: int, carte) -> None:
         nx, ny = self.x + dx, self.y + dy
-        if 0 <= nx < carte.cols and 0 <= ny < carte.rows and not carte.est_bloquant(nx, ny):
+        if carte.est_praticable(nx, ny):
             self.x, self.y = nx, ny
             self.target_x = nx
             self.target_y = ny
@@ -63,16 +68,12 @@ class Player:
             elif dy == -1: self.direction = "up"
             self._next_frame()
 
-    def update(self, dt: float):
-        if self.moving:
-            diff_x = self.x - self.anim_x
-            diff_y = self.y - self.anim_y
-            self.anim_x += diff_x * self.anim_speed * (dt * 60)
-            self.anim_y += diff_y * self.anim_speed * (dt * 60)
-            if abs(diff_x) < 0.05 and abs(diff_y) < 0.05:
-                self.anim_x = self.x
-                self.anim_y = self.y
-                self.moving = False
+    def update(self, depart: Tuple[int, int], alpha: float) -> None:
+        """Position affichée : `alpha` (0 à 1) du chemin entre `depart` (case au pas précédent) et la case actuelle."""
+        px, py = depart
+        self.anim_x = px + (self.x - px) * alpha
+        self.anim_y = py + (self.y - py) * alpha
+        self.moving = alpha < 1.0 and (px, py) != (self.x, self.y)
 
     def gauche(self, carte): self._try_move(-1, 0, carte)
     def droite(self, carte): self._try_move(1, 0, carte)
@@ -85,7 +86,8 @@ class Player:
                 return (px, py)
         return None
 
-    def dessiner_personnage(self, canvas: tk.Canvas, carte) -> None:
+    def dessiner_personnage(self, canvas: "tk.Canvas", carte) -> None:
+        from PIL import Image, ImageTk
         # Note: on ne dessine plus la carte ici pour ne pas la redessiner 4 fois
         tile = min(carte.largeur_px // carte.cols, carte.hauteur_px // carte.rows)
         cw = ch = int(tile)
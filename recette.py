@@ -141,6 +141,63 @@ class IngredientRequis:
         except ValueError:
             return self.etats[0]
 
+# ---------------------------------------------------
+# CODAGE ENTIER DES ALIMENTS (matching par masques)
+# ---------------------------------------------------
+# Chaque couple (nom, état) reçoit un code entier. Un multiensemble d'aliments est un entier
+# où le code c occupe le champ de BITS_PAR_CODE bits à la position c * BITS_PAR_CODE :
+# 7 bits de compteur + 1 bit de garde pour tester l'inclusion sans boucle.
+BITS_PAR_CODE = 8
+_CODES: Dict[Tuple[str, EtatAliment], int] = {}
+# nom -> unité packée / code, indexés par la valeur de l'état (évite de hacher l'Enum dans la boucle chaude)
+_UNITES: Dict[str, List[int]] = {}
+_CODES_PAR_NOM: Dict[str, List[int]] = {}
+_GARDE = 0
+# Toutes les recettes compilées (index = uid) et cache signature -> masque des recettes compatibles
+_RECETTES: List["Recette"] = []
+_CACHE_COMPATIBLES: Dict[int, Tuple[int, int]] = {}
+
+def code_aliment(nom: str, etat: EtatAliment) -> int:
+    global _GARDE
+    code = _CODES.get((nom, etat))
+    if code is None:
+        code = len(_CODES)
+        _CODES[(nom, etat)] = code
+        _GARDE |= 0x80 << (BITS_PAR_CODE * code)
+        _UNITES.setdefault(nom, [0] * (len(EtatAliment) + 1))[etat.value] = 1 << (BITS_PAR_CODE * code)
+        _CODES_PAR_NOM.setdefault(nom, [-1] * (len(EtatAliment) + 1))[etat.value] = code
+    return code
+
+def code_de(a: "Aliment") -> int:
+    """Code entier de l'état courant d'un aliment."""
+    codes = _CODES_PAR_NOM.get(a.nom)
+    c = codes[a.etat._value_] if codes else -1
+    return c if c >= 0 else code_aliment(a.nom, a.etat)
+
+def signature_aliments(items: List["Aliment"]) -> int:
+    """Multiensemble packé des (nom, état) de `items`."""
+    sig = 0
+    for a in items:
+        unites = _UNITES.get(a.nom)
+        u = unites[a.etat._value_] if unites else 0
+        sig += u or 1 << (BITS_PAR_CODE * code_aliment(a.nom, a.etat))
+    return sig
+
+def inclus_dans(sig_items: int, sig_ref: int) -> bool:
+    """Vrai si chaque compteur de `sig_items` est <= celui de `sig_ref` (compteurs < 128)."""
+    return ((sig_ref | _GARDE) - sig_items) & _GARDE == _GARDE
+
+def masque_compatibles(sig_items: int) -> int:
+    """Bit `uid` levé pour chaque recette pouvant accueillir tout `sig_items` (cache par stock)."""
+    ent = _CACHE_COMPATIBLES.get(sig_items)
+    if ent is None or ent[1] != len(_RECETTES):
+        m = 0
+        for r in _RECETTES:
+            if inclus_dans(sig_items, r.signature): m |= 1 << r.uid
+        ent = (m, len(_RECETTES))
+        _CACHE_COMPATIBLES[sig_items] = ent
+    return ent[0]
+
 # ---------------------------------------------------
 # RECETTE
 # ---------------------------------------------------
@@ -148,6 +205,20 @@ class IngredientRequis:
 class Recette:
     nom: str
     requis: List[IngredientRequis]
+    # Forme compilée : codes (ingrédient, état final) dans l'ordre des requis + multiensemble packé
+    codes: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    signature: int = field(init=False, repr=False, compare=False)
+    uid: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.codes = tuple(code_aliment(req.nom, req.etat_final) for req in self.requis)
+        self.signature = sum(1 << (BITS_PAR_CODE * c) for c in self.codes)
+        self.uid = len(_RECETTES)
+        _RECETTES.append(self)
+
+    def accepte(self, sig_items: int) -> bool:
+        """Tous les aliments de `sig_items` trouvent un requis distinct dans la recette."""
+        return (masque_compatibles(sig_items) >> self.uid) & 1 == 1
 
     @property
     def complexite(self) -> int:
@@ -284,5 +355,13 @@ RECETTES_POOL: List[Recette] = [
 ]
 
 
-def nouvelle_recette() -> Recette:
-    return random.choice(RECETTES_POOL)
+# Codes connus dès l'import : tous les (aliment, état) ont une unité précalculée. Noms triés : les
+# codes (et les observations de l'environnement qui les exposent) ne dépendent pas de PYTHONHASHSEED
+for _nom in sorted({n for (n, _) in TEXTURES_ALIMENTS} | {req.nom for r in RECETTES_POOL for req in r.requis}):
+    for _etat in EtatAliment:
+        code_aliment(_nom, _etat)
+
+
+def nouvelle_recette(rng: Optional[random.Random] = None) -> Recette:
+    """Nouvelle commande, tirée dans `rng` (flux des commandes du match) ou le module `random`."""
+    return (rng or random).choice(RECETTES_POOL)
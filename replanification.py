@@ -0,0 +1,200 @@
+# replanification.py
+"""
+Replanification incrémentale (D* Lite multi-buts) pour un agent.
+
+Quand le partenaire se place sur le chemin, on ne jette plus le chemin pour refaire un BFS
+complet après une pause : la recherche (faite des buts vers l'agent) est conservée et seules
+les cases dont le coût a changé sont remises à jour.
+"""
+import heapq
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+Coord = Tuple[int, int]
+INF = float("inf")
+
+
+class ReplanificateurIncremental:
+    """D* Lite sur la grille de la carte ; les obstacles dynamiques sont des cases bloquées."""
+
+    def __init__(self, carte) -> None:
+        self.carte = carte
+        self.buts: FrozenSet[Coord] = frozenset()
+        self.cle_stations: Optional[Tuple[Coord, ...]] = None
+        self.bloques: Set[Coord] = set()
+        self.depart: Optional[Coord] = None
+        self.km = 0
+        self.g: Dict[Coord, float] = {}
+        self.rhs: Dict[Coord, float] = {}
+        self._file: List[Tuple[Tuple[float, float], Coord]] = []
+        self._dans_file: Dict[Coord, Tuple[float, float]] = {}
+
+        # Statistiques (cumulées sur le match)
+        self.nb_recherches_completes = 0
+        self.nb_reparations = 0
+        self.expansions_completes = 0
+        self.expansions_reparations = 0
+        self.expansions_evitees = 0
+        self._cout_reference = 0  # coût de la dernière recherche complète sur ces buts
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def chemin(self, depart: Coord, stations: Sequence[Coord], bloques: Set[Coord]) -> Optional[List[Coord]]:
+        """Chemin (départ inclus) vers une case adjacente à `stations` en évitant `bloques`."""
+        bloques = set(bloques)
+        bloques.discard(depart)
+        cle = tuple(sorted(set(stations)))
+
+        if cle != self.cle_stations or self.depart is None:
+            self._initialiser(cle, depart, bloques)
+            n = self._calculer()
+            self.nb_recherches_completes += 1
+            self.expansions_completes += n
+            self._cout_reference = n
+        else:
+            if depart != self.depart:
+                self.km += self._h(self.depart, depart)
+                self.depart = depart
+            changees = self.bloques ^ bloques
+            self.bloques = bloques
+            for c in changees:
+                self._maj_case(c)
+                for v in self._voisins(c):
+                    self._maj_case(v)
+            n = self._calculer()
+            self.nb_reparations += 1
+            self.expansions_reparations += n
+            self.expansions_evitees += max(0, self._cout_reference - n)
+        return self._extraire()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "recherches_completes": self.nb_recherches_completes,
+            "reparations": self.nb_reparations,
+            "expansions_completes": self.expansions_completes,
+            "expansions_reparations": self.expansions_reparations,
+            "expansions_evitees": self.expansions_evitees,
+        }
+
+    def instantane(self) -> tuple:
+        """État de la recherche (copies des tables g/rhs et de la file) et statistiques."""
+        # buts et bloques sont remplacés, jamais modifiés en place : partagés tels quels
+        return (self.buts, self.cle_stations, self.bloques, self.depart, self.km,
+                dict(self.g), dict(self.rhs), list(self._file), dict(self._dans_file),
+                (self.nb_recherches_completes, self.nb_reparations, self.expansions_completes,
+                 self.expansions_reparations, self.expansions_evitees, self._cout_reference))
+
+    def restaurer(self, inst: tuple) -> None:
+        (self.buts, self.cle_stations, self.bloques, self.depart, self.km,
+         g, rhs, file, dans_file, stats) = inst
+        self.g, self.rhs, self._file, self._dans_file = dict(g), dict(rhs), list(file), dict(dans_file)
+        (self.nb_recherches_completes, self.nb_reparations, self.expansions_completes,
+         self.expansions_reparations, self.expansions_evitees, self._cout_reference) = stats
+
+    # ------------------------------------------------------------------
+    # D* LITE
+    # ------------------------------------------------------------------
+    def _initialiser(self, cle: Tuple[Coord, ...], depart: Coord, bloques: Set[Coord]) -> None:
+        champ = self.carte.champ_distance(cle)
+        self.cle_stations = cle
+        self.buts = frozenset(c for c, d in champ.items() if d == 0)
+        self.depart = depart
+        self.bloques = bloques
+        self.km = 0
+        self.g = {}
+        self.rhs = {}
+        self._file = []
+        self._dans_file = {}
+        for b in self.buts:
+            if b not in bloques:
+                self.rhs[b] = 0
+                self._inserer(b)
+
+    def _h(self, a: Coord, b: Coord) -> int:
+        d = self.carte.table_chemins.distance(a, b)
+        if d is None:
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        return d
+
+    def _cle(self, s: Coord) -> Tuple[float, float]:
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self._h(self.depart, s) + self.km, m)
+
+    def _inserer(self, s: Coord) -> None:
+        k = self._cle(s)
+        self._dans_file[s] = k
+        heapq.heappush(self._file, (k, s))
+
+    def _sommet(self) -> Tuple[Tuple[float, float], Optional[Coord]]:
+        while self._file:
+            k, s = self._file[0]
+            if self._dans_file.get(s) == k:
+                return k, s
+            heapq.heappop(self._file)  # entrée périmée
+        return (INF, INF), None
+
+    def _voisins(self, c: Coord) -> Sequence[Coord]:
+        return self.carte.voisins_praticables(*c)
+
+    def _libre(self, c: Coord) -> bool:
+        return c not in self.bloques and self.carte.est_praticable(*c)
+
+    def _maj_case(self, u: Coord) -> None:
+        if not self._libre(u):
+            self.rhs[u] = INF
+        elif u in self.buts:
+            self.rhs[u] = 0
+        else:
+            best = INF
+            for v in self._voisins(u):
+                if v in self.bloques: continue
+                gv = self.g.get(v, INF) + 1
+                if gv < best: best = gv
+            self.rhs[u] = best
+        self._dans_file.pop(u, None)
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self._inserer(u)
+
+    def _calculer(self) -> int:
+        expansions = 0
+        s = self.depart
+        while True:
+            k_top, u = self._sommet()
+            if u is None: break
+            if not (k_top < self._cle(s) or self.rhs.get(s, INF) != self.g.get(s, INF)):
+                break
+            expansions += 1
+            k_new = self._cle(u)
+            if k_top < k_new:
+                self._inserer(u)
+                continue
+            del self._dans_file[u]
+            if self.g.get(u, INF) > self.rhs.get(u, INF):
+                self.g[u] = self.rhs[u]
+                for v in self._voisins(u):
+                    self._maj_case(v)
+            else:
+                self.g[u] = INF
+                self._maj_case(u)
+                for v in self._voisins(u):
+                    self._maj_case(v)
+        return expansions
+
+    def _extraire(self) -> Optional[List[Coord]]:
+        cur = self.depart
+        if self.g.get(cur, INF) == INF and cur not in self.buts:
+            return None
+        path = [cur]
+        while cur not in self.buts:
+            nxt = None
+            best = INF
+            for v in self._voisins(cur):
+                if v in self.bloques: continue
+                gv = self.g.get(v, INF)
+                if gv < best:
+                    best, nxt = gv, v
+            if nxt is None or best == INF or len(path) > len(self.g) + 1:
+                return None
+            cur = nxt
+            path.append(cur)
+        return path
@@ -0,0 +1,152 @@
+# reservations.py
+"""
+Planification multi-agents coopérative : table de réservation espace-temps partagée
+(possédée par le jeu) et A* coopératif fenêtré (WHCA*).
+
+Le temps est compté en ticks de jeu. Un agent qui se déplace tous les `pas` ticks occupe
+chaque case de son chemin pendant `pas` ticks ; il réserve ces couples (case, tick) pour que
+les autres agents planifient autour de lui au lieu de se bloquer mutuellement.
+"""
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+Coord = Tuple[int, int]
+FENETRE_PAS = 10  # horizon de coopération (en pas de déplacement)
+
+
+class TableReservations:
+    """(x, y, tick) -> agent_id, plus les agents « garés » (immobiles jusqu'à nouvel ordre)."""
+
+    def __init__(self) -> None:
+        self._cases: Dict[Tuple[int, int, int], int] = {}
+        self._par_agent: Dict[int, List[Tuple[int, int, int]]] = {}
+        # case -> (agent_id, tick à partir duquel l'agent y stationne)
+        self._garages: Dict[Coord, Tuple[int, int]] = {}
+        self._garage_agent: Dict[int, Coord] = {}
+
+    def liberer(self, agent_id: int) -> None:
+        """Annule toutes les réservations (et le stationnement) d'un agent."""
+        for cle in self._par_agent.pop(agent_id, ()):
+            if self._cases.get(cle) == agent_id:
+                del self._cases[cle]
+        case = self._garage_agent.pop(agent_id, None)
+        if case is not None and self._garages.get(case, (None,))[0] == agent_id:
+            del self._garages[case]
+
+    def garer(self, agent_id: int, case: Coord, t_debut: int) -> None:
+        ancienne = self._garage_agent.get(agent_id)
+        if ancienne is not None and self._garages.get(ancienne, (None,))[0] == agent_id:
+            del self._garages[ancienne]
+        self._garages[case] = (agent_id, t_debut)
+        self._garage_agent[agent_id] = case
+
+    def reserver(self, agent_id: int, depart: Coord, chemin: Sequence[Coord], t0: int, pas: int,
+                 fenetre: int = FENETRE_PAS) -> None:
+        """
+        Réserve `depart` puis les `fenetre` premières cases de `chemin` (départ exclu).
+        Si le chemin tient entièrement dans la fenêtre, l'agent est garé à l'arrivée.
+        """
+        self.liberer(agent_id)
+        cles = self._par_agent.setdefault(agent_id, [])
+        cases = [depart] + list(chemin[:fenetre])
+        for k, (x, y) in enumerate(cases):
+            for t in range(t0 + k * pas, t0 + (k + 1) * pas):
+                cle = (x, y, t)
+                if cle not in self._cases:
+                    self._cases[cle] = agent_id
+                    cles.append(cle)
+        if len(chemin) <= fenetre:
+            self.garer(agent_id, cases[-1], t0 + len(chemin) * pas)
+
+    def occupant(self, case: Coord, t: int) -> Optional[int]:
+        a = self._cases.get((case[0], case[1], t))
+        if a is not None: return a
+        garage = self._garages.get(case)
+        if garage is not None and t >= garage[1]:
+            return garage[0]
+        return None
+
+    def est_libre(self, case: Coord, t: int, agent_id: int) -> bool:
+        a = self.occupant(case, t)
+        return a is None or a == agent_id
+
+    def instantane(self) -> tuple:
+        # Les listes de _par_agent ne sont jamais modifiées après `reserver` : copie superficielle
+        return dict(self._cases), dict(self._par_agent), dict(self._garages), dict(self._garage_agent)
+
+    def restaurer(self, inst: tuple) -> None:
+        cases, par_agent, garages, garage_agent = inst
+        self._cases = dict(cases)
+        self._par_agent = dict(par_agent)
+        self._garages = dict(garages)
+        self._garage_agent = dict(garage_agent)
+
+
+def astar_cooperatif(carte, start: Coord, stations: Sequence[Coord], table: TableReservations,
+                     agent_id: int, t0: int, pas: int, fenetre: int = FENETRE_PAS,
+                     bloques_immediats: Iterable[Coord] = ()) -> Optional[List[Coord]]:
+    """
+    A* dans l'espace (case, pas) avec attente autorisée, borné à `fenetre` pas ; au-delà,
+    on termine par la descente du champ de distance statique (heuristique exacte).
+    Retourne les positions successives (départ exclu, attente = case répétée), ou None.
+    """
+    champ = carte.champ_distance(stations)
+    if start not in champ: return None
+    bloques_immediats = set(bloques_immediats)
+    horizon = t0 + (fenetre + 2) * pas
+
+    def libre(case: Coord, k: int) -> bool:
+        # case occupée pendant [t0 + k*pas, t0 + (k+1)*pas)
+        for t in range(t0 + k * pas, t0 + (k + 1) * pas):
+            if not table.est_libre(case, t, agent_id): return False
+        return True
+
+    def croisement(u: Coord, v: Coord, k: int) -> bool:
+        # un autre agent passe de v à u pendant que l'on passe de u à v
+        t = t0 + k * pas
+        a = table.occupant(v, t - 1)
+        return a is not None and a != agent_id and table.occupant(u, t) == a
+
+    def stationnement_sur(case: Coord, k: int) -> bool:
+        for t in range(t0 + k * pas, horizon):
+            if not table.est_libre(case, t, agent_id): return False
+        return True
+
+    # Cas fréquent : la route statique (descente du champ) ne croise personne -> on la garde
+    statique = carte.descendre_champ(champ, start)[1:]
+    if not (statique and statique[0] in bloques_immediats):
+        cur = start
+        for k, nxt in enumerate(statique[:fenetre], start=1):
+            if not libre(nxt, k) or croisement(cur, nxt, k): break
+            cur = nxt
+        else:
+            if len(statique) > fenetre or stationnement_sur(cur, len(statique)):
+                return statique
+
+    parent: Dict[Tuple[Coord, int], Optional[Tuple[Coord, int]]] = {(start, 0): None}
+    ouverts = [(champ[start], 0, start)]
+    while ouverts:
+        _, k, cur = heapq.heappop(ouverts)
+        fin = None
+        if champ[cur] == 0 and stationnement_sur(cur, k):
+            fin = []
+        elif k >= fenetre:
+            fin = carte.descendre_champ(champ, cur)[1:]
+        if fin is not None:
+            etat = (cur, k)
+            path = []
+            while parent[etat] is not None:
+                path.append(etat[0])
+                etat = parent[etat]
+            path.reverse()
+            return path + fin
+        x, y = cur
+        for nxt in ((x+1, y), (x-1, y), (x, y+1), (x, y-1), (x, y)):
+            etat = (nxt, k + 1)
+            if etat in parent or nxt not in champ: continue
+            if k == 0 and nxt in bloques_immediats: continue
+            if not libre(nxt, k + 1) or (nxt != cur and croisement(cur, nxt, k + 1)): continue
+            parent[etat] = (cur, k)
+            heapq.heappush(ouverts, (k + 1 + champ[nxt], k + 1, nxt))
+    return None
+
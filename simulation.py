@@ -0,0 +1,424 @@
+# simulation.py
+"""
+Cœur de simulation commun au jeu (main.py) et au benchmark (benchmark_viz.py).
+
+Aucune dépendance graphique : ni tkinter ni PIL ne sont importés ici (la carte et les joueurs
+ne chargent leurs textures qu'à la demande de la vue Tk). Le rendu observe une `Simulation`
+et l'avance avec `pas(dt)` ; le benchmark la joue d'une traite avec `run()`.
+
+En mode événementiel (`run(evenementiel=True)`), les pas où rien ne peut se passer sont sautés
+d'un bloc : l'horloge saute directement au prochain événement de la file de priorité (fin de
+cuisson, fin de découpe, fin de pause, prochain déplacement d'un agent, seuil de blocage), et les
+compteurs des pas sautés sont mis à jour comme en ticks. Les résultats sont identiques à ceux de
+`run()` pour une même graine.
+"""
+import heapq
+import math
+import random
+from bisect import bisect_left
+from itertools import count
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from carte import Carte
+from player import Player
+from recette import Aliment, EtatAliment, Recette, ALIMENTS_BAC, nouvelle_recette
+from agent import Agent
+from reservations import TableReservations, FENETRE_PAS
+from equipe import GrilleOccupation, RegistreRevendications
+from inventaire import InventaireCuisine
+from graines import GrainesMatch
+from anticipation import RechercheAnticipation, BUDGET_TICK_S
+from ordonnancement import OrdonnanceurCuisine
+
+Coord = Tuple[int, int]
+DT_DEFAUT = 0.1  # secondes simulées par pas
+
+
+class Instantane(NamedTuple):
+    """État complet d'une `Simulation` à un instant donné (voir `Simulation.instantane`)."""
+    scalaires: tuple
+    recettes: tuple
+    recettes_livrees: tuple
+    score_history: tuple
+    cuissons: dict
+    actions_en_cours: dict
+    stocks: dict
+    etats_aliments: tuple
+    joueurs: tuple
+    agents: tuple
+    inventaire: tuple
+    occupation: tuple
+    revendications: tuple
+    reservations: tuple
+    ordonnancement: tuple
+    rng_commandes: tuple
+
+
+class Simulation:
+    """Une cuisine : carte, commandes, cuissons, découpes et agents, avancée pas à pas."""
+
+    def __init__(self, grille_data, spawn_positions: Sequence[Coord], strategies: List[str], duration_s: float,
+                 move_every_ticks: float = 2.0, largeur: int = 600, hauteur: int = 600,
+                 graine: Optional[int] = None, fabrique_agent: Optional[Callable[..., Agent]] = None,
+                 budget_calcul_s: float = BUDGET_TICK_S, dossier_chemins: Optional[str] = None) -> None:
+        self.duration_s = duration_s
+        self.current_sim_time = 0.0
+
+        # Commandes et agents tirent dans des flux dérivés de la graine du match (sinon : module random)
+        self.graine = graine
+        self.graines = GrainesMatch(graine) if graine is not None else None
+        self.rng_commandes = self.graines.commandes() if self.graines else random
+        
+        # Initialisation Carte (sans textures : c'est la vue qui les charge si besoin ; table des
+        # chemins sauvegardée dans `dossier_chemins` si l'appelant rejoue les mêmes cartes)
+        self.carte = Carte(grille_data, largeur=largeur, hauteur=hauteur, textures=False,
+                           dossier_chemins=dossier_chemins)
+        self.carte.assigner_bacs(ALIMENTS_BAC)
+        
+        self.score = 0
+        self.recettes: List[Recette] = [nouvelle_recette(self.rng_commandes) for _ in range(3)]
+        self.recettes_livrees = []
+        self.cuissons: Dict[Coord, Tuple[Aliment, float, float]] = {}
+        self.inventaire = InventaireCuisine()
+        self.score_history = [(0.0, 0)]
+        
+        self.stats_steps = 0
+        self.time_working_total = 0.0
+        self.time_walking_total = 0.0
+        self.time_idle_total = 0.0
+
+        # Stockage des actions bloquantes par agent
+        self.actions_en_cours: Dict[Agent, Tuple[str, Coord, Aliment, float, float]] = {}
+        self.reservations = TableReservations()
+        self.tick_courant = 0
+        # Compteur d'événements du monde (cuissons, livraisons, déplacements) ; voir version_monde
+        self._evenements_monde = 0
+        # Mode événementiel (seulement pendant run) : instants des pas restants et file des échéances
+        self._temps_pas: Optional[List[float]] = None
+        self._echeances: list = []
+        self._numeros = count()
+        self._generation = 0
+
+        # Positions et intentions partagées par tous les agents de l'équipe
+        self.occupation = GrilleOccupation(self.carte.cols, self.carte.rows)
+        self.revendications = RegistreRevendications()
+        # Recherche des agents « anticipation » (budget de calcul réel par tick, partagé)
+        self.anticipation = RechercheAnticipation(self, budget_calcul_s)
+        # Tâches des agents « ordonnance » (ordonnanceur central de l'équipe)
+        self.ordonnanceur = OrdonnanceurCuisine(self)
+
+        self.players = []
+        self.agents = []
+
+        # --- CRÉATION AGENTS SELON LA LISTE DE STRATÉGIES ---
+        # `fabrique_agent(jeu, joueur, strategie, agent_id=, rng=)` permet d'y substituer des agents pilotés
+        fabrique = fabrique_agent or Agent
+        nb_agents = len(strategies)
+        # On limite au nombre de spawns disponibles (voir map_generator.extra_spawns)
+        limit_agents = min(nb_agents, len(spawn_positions))
+
+        for i in range(limit_agents):
+            sx, sy = spawn_positions[i]
+            p = Player(sx, sy, label=f"P{i+1}")
+            self.players.append(p)
+            
+            strat = strategies[i]
+            a = fabrique(self, p, strat, agent_id=i, rng=self.graines.agent(i) if self.graines else None)
+            a.move_every_ticks = move_every_ticks
+            self.agents.append(a)
+
+    def get_time(self) -> float:
+        return self.current_sim_time
+
+    @property
+    def termine(self) -> bool:
+        return self.current_sim_time >= self.duration_s
+
+    def trigger_action_bloquante(self, agent, type_action, pos, aliment, duree):
+        start = self.current_sim_time
+        action = self.actions_en_cours[agent] = (type_action, pos, aliment, start, start + duree)
+        self._echeance(start + duree, "action", agent, action)
+        if type_action == "DECOUPE": self.inventaire.debut_decoupe(aliment)
+
+    @property
+    def version_monde(self) -> int:
+        """Croît à chaque changement qui peut modifier la décision d'un agent (stocks inclus)."""
+        return self._evenements_monde + self.inventaire.version
+
+    def monde_modifie(self) -> None:
+        self._evenements_monde += 1
+
+    def start_cooking(self, pos, aliment, duree):
+        cuisson = self.cuissons[pos] = (aliment, self.current_sim_time, self.current_sim_time + duree)
+        self._echeance(cuisson[2], "cuisson", pos, cuisson)
+        self.inventaire.debut_cuisson(aliment)
+        self.monde_modifie()
+
+    def deliver_recipe(self, index, recette):
+        self.score += recette.difficulte_reelle
+        self.recettes_livrees.append((recette.nom, recette.complexite))
+        self.score_history.append((self.current_sim_time, self.score))
+        self.recettes.pop(index)
+        self.recettes.append(nouvelle_recette(self.rng_commandes))
+        self.ordonnanceur.commande_livree(recette)
+        self.monde_modifie()
+
+    # ------------------------------------------------------------------
+    # INSTANTANÉS (planification par anticipation)
+    # ------------------------------------------------------------------
+    def instantane(self) -> Instantane:
+        """
+        Sauvegarde l'état du match en O(taille de l'état). La grille, les textures, les recettes
+        et les aliments sont partagés par référence : seul l'état des aliments (leur seul champ
+        modifiable) est noté, ce qui préserve les alias (l'aliment découpé est aussi celui tenu).
+        """
+        stocks = {pos: tuple(s) for pos, s in self.carte.assemblage_stock.items()}
+        aliments = [a for s in stocks.values() for a in s]
+        aliments += [p.item for p in self.players if p.item is not None]
+        aliments += [c[0] for c in self.cuissons.values()]
+        aliments += [act[2] for act in self.actions_en_cours.values()]
+        return Instantane(
+            scalaires=(self.current_sim_time, self.tick_courant, self.score, self.stats_steps,
+                       self.time_working_total, self.time_walking_total, self.time_idle_total,
+                       self._evenements_monde),
+            recettes=tuple(self.recettes),
+            recettes_livrees=tuple(self.recettes_livrees),
+            score_history=tuple(self.score_history),
+            cuissons=dict(self.cuissons),
+            actions_en_cours=dict(self.actions_en_cours),
+            stocks=stocks,
+            etats_aliments=tuple((a, a.etat) for a in aliments),
+            joueurs=tuple((p.x, p.y, p.item) for p in self.players),
+            agents=tuple(a.instantane() for a in self.agents),
+            inventaire=self.inventaire.instantane(),
+            occupation=self.occupation.instantane(),
+            revendications=self.revendications.instantane(),
+            reservations=self.reservations.instantane(),
+            ordonnancement=self.ordonnanceur.instantane(),
+            rng_commandes=self.rng_commandes.getstate(),
+        )
+
+    def restaurer(self, inst: Instantane) -> None:
+        """Revient à l'état de `inst` (réutilisable : un même instantané peut être restauré plusieurs fois)."""
+        (self.current_sim_time, self.tick_courant, self.score, self.stats_steps,
+         self.time_working_total, self.time_walking_total, self.time_idle_total,
+         self._evenements_monde) = inst.scalaires
+        # Conteneurs restaurés en place : un agent interrompu en pleine décision (voir anticipation.py)
+        # garde des références valides vers les commandes, les cuissons et les tables
+        self.recettes[:] = inst.recettes
+        self.recettes_livrees[:] = inst.recettes_livrees
+        self.score_history[:] = inst.score_history
+        _remplacer(self.cuissons, inst.cuissons)
+        _remplacer(self.actions_en_cours, inst.actions_en_cours)
+        stocks = self.carte.assemblage_stock
+        for pos in [pos for pos in stocks if pos not in inst.stocks]: del stocks[pos]
+        for pos, s in inst.stocks.items():
+            stocks.setdefault(pos, [])[:] = s
+        for a, etat in inst.etats_aliments:
+            a.etat = etat
+        for p, (x, y, item) in zip(self.players, inst.joueurs):
+            p.x, p.y, p.item = x, y, item
+            p.anim_x, p.anim_y, p.moving = float(x), float(y), False
+        for a, etat in zip(self.agents, inst.agents):
+            a.restaurer(etat)
+        self.inventaire.restaurer(inst.inventaire)
+        self.occupation.restaurer(inst.occupation)
+        self.revendications.restaurer(inst.revendications)
+        self.reservations.restaurer(inst.reservations)
+        self.ordonnanceur.restaurer(inst.ordonnancement)
+        self.rng_commandes.setstate(inst.rng_commandes)
+
+    # ------------------------------------------------------------------
+    # BOUCLE
+    # ------------------------------------------------------------------
+    def pas(self, dt: float = DT_DEFAUT) -> None:
+        """Un tick : physique, actions bloquantes, agents, statistiques ; puis l'horloge avance de `dt`."""
+        self.tick_courant += 1
+        
+        # Physique
+        for pos, (alim, t0, tfin) in list(self.cuissons.items()):
+            if self.current_sim_time >= tfin and alim.etat != EtatAliment.CUIT:
+                self.inventaire.fin_cuisson(alim)
+
+        prev_positions = [(p.x, p.y) for p in self.players]
+        agents_occupes = set()
+        
+        # Actions bloquantes
+        for agent in list(self.actions_en_cours.keys()):
+            type_act, _, aliment, _, t_fin = self.actions_en_cours[agent]
+            if self.current_sim_time >= t_fin:
+                if type_act == "DECOUPE": self.inventaire.fin_decoupe(aliment)
+                del self.actions_en_cours[agent]
+                agent._mark_progress()
+            else:
+                agents_occupes.add(agent)
+                self.time_working_total += dt
+
+        # Tick Agents
+        for agent in self.agents:
+            if agent not in agents_occupes:
+                agent.tick()
+
+        # Stats Mouvement
+        for i, p in enumerate(self.players):
+            if (p.x, p.y) != prev_positions[i]:
+                self.stats_steps += 1
+                self.time_walking_total += dt
+            elif self.agents[i] not in agents_occupes:
+                self.time_idle_total += dt
+
+        self.current_sim_time += dt
+
+    def run(self, dt: float = DT_DEFAUT, evenementiel: bool = False) -> dict:
+        """
+        Joue le match jusqu'au bout et retourne ses statistiques. En mode `evenementiel`, les pas
+        calmes sont sautés jusqu'au prochain événement (mêmes résultats, moins de calcul).
+        """
+        if not evenementiel:
+            while self.current_sim_time < self.duration_s:
+                self.pas(dt)
+            return self.resultats()
+
+        # Instants de tous les pas restants, cumulés comme en ticks : un saut tombe pile sur l'un d'eux
+        temps = [self.current_sim_time]
+        while temps[-1] < self.duration_s:
+            temps.append(temps[-1] + dt)
+        fin = len(temps) - 1
+        self._temps_pas = temps
+        self._echeances = []
+        for pos, cuisson in self.cuissons.items():
+            self._echeance(cuisson[2], "cuisson", pos, cuisson)
+        for agent, action in self.actions_en_cours.items():
+            self._echeance(action[4], "action", agent, action)
+        try:
+            i = 0
+            while i < fin:
+                avant = (self.version_monde, self.revendications.version)
+                self.pas(dt)
+                i += 1
+                # Après un pas où le monde a changé, quelqu'un réagit presque toujours au pas suivant :
+                # on ne cherche le prochain événement qu'après un pas sans effet (jouer un pas reste exact)
+                if i < fin and (self.version_monde, self.revendications.version) == avant:
+                    j = self._prochain_evenement(i, fin)
+                    if j > i: self._sauter(i, j, dt)
+                    i = j
+        finally:
+            self._temps_pas = None
+            self._echeances = []
+        return self.resultats()
+
+    # ------------------------------------------------------------------
+    # MODE ÉVÉNEMENTIEL
+    # ------------------------------------------------------------------
+    def _echeance(self, t: float, genre: str, cle, valeur) -> None:
+        """Ajoute à la file l'échéance de la cuisson / découpe `valeur` (pendant un run événementiel)."""
+        if self._temps_pas is None: return
+        heapq.heappush(self._echeances, (bisect_left(self._temps_pas, t), next(self._numeros), genre, cle, valeur))
+
+    def _echeance_valide(self, genre: str, cle, valeur) -> bool:
+        if genre == "agent": return valeur == self._generation
+        if genre == "action": return self.actions_en_cours.get(cle) is valeur
+        return self.cuissons.get(cle) is valeur and valeur[0].etat != EtatAliment.CUIT
+
+    def _prochain_evenement(self, i: int, fin: int) -> int:
+        """
+        Indice du prochain pas où il peut se passer quelque chose, `i` étant le prochain à jouer.
+        Les échéances des agents (fin de pause, déplacement, seuil de blocage) dépendent de tout ce
+        qui vient de se passer : elles sont recalculées après chaque pas joué et remplacent les
+        précédentes dans la file (génération). Cuissons et découpes y restent jusqu'à leur fin.
+        """
+        reveils = []
+        for agent in self.agents:
+            if agent in self.actions_en_cours: continue  # réveillé par la fin de sa découpe
+            j = self._reveil(agent, i)
+            if j <= i: return i
+            reveils.append(j)
+        self._generation += 1
+        file = self._echeances
+        for j in reveils:
+            if j < fin: heapq.heappush(file, (j, next(self._numeros), "agent", None, self._generation))
+        while file and not self._echeance_valide(*file[0][2:]):
+            heapq.heappop(file)
+        return min(max(file[0][0], i), fin) if file else fin
+
+    def _reveil(self, agent: Agent, i: int) -> int:
+        """Premier pas (à partir de `i`) où `agent.tick()` fait autre chose qu'attendre ; i s'il faut jouer le pas."""
+        if type(agent).tick is not Agent.tick: return i  # agent piloté : comportement inconnu
+        temps = self._temps_pas
+        if temps[i] < agent.pause_until:
+            return bisect_left(temps, agent.pause_until, lo=i)
+        if (agent.player.x, agent.player.y) != agent.last_pos: return i
+        if agent.current_path:
+            if not agent._chemin_reserve: return i
+            # Au pas i + m, le cooldown vaut move_cooldown + m + 1 et le tick de jeu tick_courant + m + 1
+            deplacement = math.ceil(agent.move_every_ticks - agent.move_cooldown - 1)
+            reservation = (FENETRE_PAS // 2) * agent.pas_ticks + agent._tick_reservation - self.tick_courant - 1
+            prochain = i + min(deplacement, reservation)
+            if prochain <= i: return i
+        elif agent._memo_reflexion != agent._cle_reflexion():
+            return i
+        else:
+            prochain = len(temps)
+        # Tentative de dégagement : premier pas où l'agent est immobile depuis plus de retreat_threshold_s
+        depuis, seuil = agent.last_progress_time, agent.retreat_threshold_s
+        j = bisect_left(temps, depuis + seuil, lo=i, hi=prochain)
+        while j > i and temps[j - 1] - depuis > seuil: j -= 1
+        while j < prochain and not temps[j] - depuis > seuil: j += 1
+        return j
+
+    def _sauter(self, i: int, j: int, dt: float) -> None:
+        """Joue d'un bloc les pas calmes i à j - 1 : mêmes compteurs qu'en ticks, rien d'autre ne bouge."""
+        k = j - i
+        travail = repos = 0
+        for agent in self.agents:
+            if agent in self.actions_en_cours:
+                travail += k
+                continue
+            repos += k
+            if self._temps_pas[i] < agent.pause_until: continue
+            if agent.current_path: agent.move_cooldown += k
+            else: agent.reflexions_evitees += k
+        # Une addition de dt par agent et par pas, comme en ticks (arrondis identiques)
+        for _ in range(travail): self.time_working_total += dt
+        for _ in range(repos): self.time_idle_total += dt
+        self.tick_courant += k
+        self.current_sim_time = self._temps_pas[j]
+
+    def resultats(self) -> dict:
+        efficiency = (self.stats_steps / self.score) if self.score > 0 else 0
+        avg_comp = 0
+        if self.recettes_livrees:
+            avg_comp = sum(c for _, c in self.recettes_livrees) / len(self.recettes_livrees)
+
+        nb = len(self.agents)
+        total_pool = self.duration_s * nb if nb > 0 else 1
+
+        # Travail de replanification économisé par la réparation incrémentale
+        replan = {"reparations": 0, "expansions_reparations": 0, "expansions_evitees": 0}
+        for a in self.agents:
+            st = a.replanif.stats()
+            for k in replan: replan[k] += st[k]
+
+        return {
+            "score": self.score,
+            "nb_agents": nb,
+            "recettes_count": len(self.recettes_livrees),
+            "avg_complexity": avg_comp,
+            "history": self.score_history,
+            "efficiency_cost": efficiency,
+            "walking_pct": (self.time_walking_total / total_pool) * 100,
+            "working_pct": (self.time_working_total / total_pool) * 100,
+            "idle_pct": (self.time_idle_total / total_pool) * 100,
+            "replan_reparations": replan["reparations"],
+            "replan_expansions_evitees": replan["expansions_evitees"],
+            "pauses_evitees": sum(a.pauses_evitees for a in self.agents),
+            "reflexions_executees": sum(a.reflexions_executees for a in self.agents),
+            "reflexions_evitees": sum(a.reflexions_evitees for a in self.agents),
+            "anticipation": self.anticipation.stats(),
+            "ordonnancement": self.ordonnanceur.stats(),
+        }
+
+
+def _remplacer(d: dict, contenu: dict) -> None:
+    d.clear()
+    d.update(contenu)
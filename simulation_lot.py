@@ -0,0 +1,668 @@
+# simulation_lot.py
+"""
+Moteur par lots : K cuisines avancées ensemble, tick par tick, dans des tableaux NumPy.
+
+Pour les balayages de stratégies (des centaines de parties), la machine à états d'`Agent`
+(`try_action` puis `_planifier`, stratégies naive / simple / complexe) est rejouée sur des tableaux
+(K, ...) : positions, objets tenus, stocks des tables, cuissons et découpes de toutes les cuisines.
+La boucle Python ne porte que sur les agents d'une équipe ; seuls les événements rares (livraison,
+dégagement) passent cuisine par cuisine, pour tirer dans les mêmes flux que `Simulation`.
+
+Les déplacements suivent la descente du champ de distance de `Carte` (minimum des champs des
+stations visées). En solo, une cuisine du lot rejoue donc le match `HeadlessGame` de même graine :
+mêmes livraisons, aux mêmes instants. En équipe, les agents ne se gênent pas : ni collision, ni
+réservation, ni station cédée au coéquipier le plus proche.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from carte import Carte, LEGUMES_BAC, BAC, DECOUPE, FOUR, POELE, ASSEMBLAGE, SERVICE
+from graines import GrainesMatch
+from recette import (ALIMENTS_BAC, RECETTES_POOL, TEMPS_COUPE, TEMPS_CUISSON, TEXTURES_ALIMENTS,
+                     EtatAliment, code_aliment)
+
+Coord = Tuple[int, int]
+DT_DEFAUT = 0.1
+LOIN = np.iinfo(np.int16).max  # distance d'une station inaccessible (ou absente)
+
+STRATEGIES = ("naive", "simple", "complexe")
+NAIVE, SIMPLE, COMPLEXE = range(3)
+# Seuils de `Agent._check_blockage`
+SEUIL_RECUL_S = 2.0
+SEUIL_BLOCAGE_S = 5.0
+
+# ---------------------------------------------------
+# ALIMENTS ET RECETTES SOUS FORME DE TABLEAUX
+# ---------------------------------------------------
+# Un objet tenu ou posé est son code (nom, état) de recette.py, -1 = rien ; un plat est le code
+# (nom de la recette, CUIT), comme l'Aliment que crée `Agent.try_action`.
+_ETATS = list(EtatAliment)
+SORTI, COUPE, CUIT = (_ETATS.index(e) for e in (EtatAliment.SORTI_DU_BAC, EtatAliment.COUPE, EtatAliment.CUIT))
+NOMS: List[str] = sorted({n for (n, _) in TEXTURES_ALIMENTS} | {r.nom for r in RECETTES_POOL}
+                         | {req.nom for r in RECETTES_POOL for req in r.requis})
+_N = {nom: i for i, nom in enumerate(NOMS)}
+CODE = np.array([[code_aliment(nom, e) for e in _ETATS] for nom in NOMS])
+NB_CODES = int(CODE.max()) + 1
+NOM_CODE = np.zeros(NB_CODES, dtype=np.int64)
+ETAT_CODE = np.zeros(NB_CODES, dtype=np.int64)
+for _n in range(len(NOMS)):
+    NOM_CODE[CODE[_n]] = _n
+    ETAT_CODE[CODE[_n]] = np.arange(len(_ETATS))
+COUPE_DE = CODE[NOM_CODE, COUPE]
+CUIT_DE = CODE[NOM_CODE, CUIT]
+
+_R = len(RECETTES_POOL)
+_INDICES = range(_R)  # rng.choice(_INDICES) tire le même index que nouvelle_recette(rng)
+MAX_REQUIS = max(len(r.requis) for r in RECETTES_POOL)
+NB_REQUIS = np.array([len(r.requis) for r in RECETTES_POOL])
+TEMPS_ESTIME = np.array([r.temps_estime for r in RECETTES_POOL])
+DIFFICULTE = np.array([r.difficulte_reelle for r in RECETTES_POOL], dtype=np.int64)
+COMPLEXITE = np.array([r.complexite for r in RECETTES_POOL], dtype=np.int64)
+PLAT = np.array([CODE[_N[r.nom], CUIT] for r in RECETTES_POOL])
+# Recette dont un objet porte le nom (plat servable), -1 sinon
+PLAT_DE = np.full(NB_CODES, -1, dtype=np.int64)
+for _i, _r in enumerate(RECETTES_POOL):
+    PLAT_DE[CODE[_N[_r.nom]]] = _i
+# Requis : code (nom, état final) et nom (-2 au-delà du dernier) ; RC[r, c] = exemplaires de c dans r
+REQ_CODE = np.full((_R, MAX_REQUIS), -2, dtype=np.int64)
+REQ_NOM = np.zeros((_R, MAX_REQUIS), dtype=np.int64)
+RC = np.zeros((_R, NB_CODES), dtype=np.int64)
+# BESOIN[r, c] : un requis de r porte le nom de c ; ETAPE[r, c] : son etape_suivante (-1 = aucune)
+BESOIN = np.zeros((_R, NB_CODES), dtype=bool)
+ETAPE = np.full((_R, NB_CODES), -1, dtype=np.int64)
+for _i, _r in enumerate(RECETTES_POOL):
+    for _j, _req in enumerate(_r.requis):
+        REQ_CODE[_i, _j] = _r.codes[_j]
+        REQ_NOM[_i, _j] = _N[_req.nom]
+        RC[_i, _r.codes[_j]] += 1
+    for _c in range(NB_CODES):
+        _req = next((q for q in _r.requis if q.nom == NOMS[NOM_CODE[_c]]), None)
+        if _req is None: continue
+        BESOIN[_i, _c] = True
+        _e = _req.etape_suivante(_ETATS[ETAT_CODE[_c]])
+        ETAPE[_i, _c] = -1 if _e is None else _ETATS.index(_e)
+LEGUME = -2  # bac « legume »
+EST_LEGUME = np.array([nom in LEGUMES_BAC for nom in NOMS])
+# Mêmes durées par défaut que Agent.try_action
+DUREE_COUPE = np.array([TEMPS_COUPE.get(nom, 1.0) for nom in NOMS])
+DUREE_CUISSON = np.array([TEMPS_CUISSON.get(nom, 2.0) for nom in NOMS])
+
+# Voisins d'une case dans l'ordre de Carte._calculer_champ (E, W, S, N), et de _tenter_degagement (S, N, E, W)
+_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_ORDRE_DEGAGEMENT = [2, 3, 0, 1]
+
+
+def _decrire_carte(grille) -> dict:
+    """Tableaux d'une carte : champ de chaque station, voisins, stations adjacentes et masques de stations."""
+    carte = Carte(grille, textures=False)
+    carte.assigner_bacs(ALIMENTS_BAC)
+    rows, cols = carte.rows, carte.cols
+    cuiseurs = carte.pos_fours + carte.pos_poeles
+    stations = carte.pos_bacs + carte.pos_decoupes + cuiseurs + carte.pos_assemblages + carte.pos_services
+    indice = {p: s for s, p in enumerate(stations)}
+    bits = lambda positions: sum(1 << indice[p] for p in set(positions))
+
+    # Champ de chaque station : celui d'un ensemble de stations en est le minimum
+    d1 = np.full((len(stations), rows * cols), LOIN, dtype=np.int16)
+    for s, p in enumerate(stations):
+        for (x, y), d in carte.champ_distance([p]).items():
+            d1[s, y * cols + x] = d
+    voisins = np.full((rows * cols, 4), -1, dtype=np.int64)
+    for y in range(rows):
+        for x in range(cols):
+            for j, (dx, dy) in enumerate(_DIRECTIONS):
+                if carte.est_praticable(x + dx, y + dy): voisins[y * cols + x, j] = (y + dy) * cols + x + dx
+
+    def adjacentes(positions, *codes):
+        res = np.full(rows * cols, -1, dtype=np.int64)
+        for y in range(rows):
+            for x in range(cols):
+                st = next((st for st in (carte.station_adjacente(x, y, c) for c in codes) if st), None)
+                if st is not None: res[y * cols + x] = positions.index(st)
+        return res
+
+    # distance_station vers chaque table (Manhattan en secours, comme Carte.distance_station)
+    xs, ys = np.arange(rows * cols) % cols, np.arange(rows * cols) // cols
+    dist_tables = []
+    for (tx, ty) in carte.pos_assemblages:
+        d = d1[indice[(tx, ty)]].astype(np.int64)
+        dist_tables.append(np.where(d < LOIN, d + 1, np.abs(xs - tx) + np.abs(ys - ty)))
+    return {
+        "carte": carte, "cols": cols, "d1": d1, "voisins": voisins,
+        "adj_bac": adjacentes(carte.pos_bacs, BAC), "adj_decoupe": adjacentes(carte.pos_decoupes, DECOUPE),
+        "adj_cuisson": adjacentes(cuiseurs, FOUR, POELE), "adj_table": adjacentes(carte.pos_assemblages, ASSEMBLAGE),
+        "adj_service": adjacentes(carte.pos_services, SERVICE),
+        "bac_nom": [LEGUME if nom == "legume" else _N.get(nom, -1) for nom, _ in
+                    (carte.bacs_config.get(p, ("?", 0)) for p in carte.pos_bacs)],
+        "masque_bac": [bits(carte.bacs_pour(nom)) for nom in NOMS],
+        "masque_decoupe": bits(carte.pos_decoupes), "masque_service": bits(carte.pos_services),
+        "masque_tables": bits(carte.pos_assemblages),
+        "bit_cuiseur": [bits([p]) for p in cuiseurs], "bit_table": [bits([p]) for p in carte.pos_assemblages],
+        "dist_tables": dist_tables,
+    }
+
+
+class SimulationLot:
+    """
+    K cuisines jouées en parallèle. `cartes` : liste de (grille, spawns) ; `strategies` : une
+    stratégie par agent, commune à toutes les cuisines, ou une liste par cuisine ; `graines` : la
+    graine de match de chaque cuisine (commandes, dégagements), `graine + k` par défaut.
+    """
+
+    def __init__(self, cartes: Sequence[Tuple[Sequence[Sequence[int]], Sequence[Coord]]],
+                 strategies, duration_s: float, move_every_ticks: float = 1.0, graine: int = 0,
+                 graines: Optional[Sequence[int]] = None) -> None:
+        self.duration_s = duration_s
+        self.move_every_ticks = move_every_ticks
+        self.current_sim_time = 0.0
+        self.tick_courant = 0
+
+        codes = np.array([[STRATEGIES.index(s) for s in strats] for strats in
+                          (strategies if isinstance(strategies[0], (list, tuple)) else [strategies])])
+        self.nb_cuisines = K = len(cartes)
+        self.strategies = np.broadcast_to(codes, (K, codes.shape[1])).copy()
+        self.nb_agents = A = self.strategies.shape[1]
+        self._k = np.arange(K)
+
+        self._indexer_cartes(cartes)
+
+        # Flux aléatoires de chaque cuisine : ceux du match `Simulation` de même graine
+        flux = [GrainesMatch(g) for g in (graines if graines is not None else range(graine, graine + K))]
+        self._rng_commandes = [f.commandes() for f in flux]
+        self._rng_agents = [[f.agent(a) for a in range(A)] for f in flux]
+
+        # --- Cuisines (K, ...) ---
+        self.recettes = np.array([[rng.choice(_INDICES) for _ in range(3)] for rng in self._rng_commandes],
+                                 dtype=np.int64).reshape(K, 3)
+        self.stock = np.full((K, self.nb_tables), -1, dtype=np.int64)  # une table porte au plus un objet
+        self.cuisson = np.full((K, self.nb_cuiseurs), -1, dtype=np.int64)
+        self.cuisson_fin = np.full((K, self.nb_cuiseurs), np.inf)
+
+        # --- Agents (K, A) ---
+        self.main = np.full((K, A), -1, dtype=np.int64)
+        self.bot = np.full((K, A), -1, dtype=np.int64)  # recette choisie (index dans RECETTES_POOL)
+        self.next_req = np.zeros((K, A), dtype=np.int64)
+        self.assemblage = np.full((K, A), -1, dtype=np.int64)  # current_assembly (index de table)
+        self.cible = np.zeros((K, A), dtype=np.int64)  # bits des stations visées, 0 = pas de chemin
+        self.pas_force = np.full((K, A), -1, dtype=np.int64)  # case de dégagement
+        self.cooldown = np.zeros((K, A), dtype=np.int64)
+        self.pause_until = np.zeros((K, A))
+        self.derniere_pos = self.pos.copy()
+        self.derniere_progression = np.zeros((K, A))
+        self.fin_decoupe = np.full((K, A), np.inf)
+        self.decoupe = np.full((K, A), -1, dtype=np.int64)
+
+        # --- Statistiques (K,) ---
+        self.score = np.zeros(K, dtype=np.int64)
+        self.nb_livrees = np.zeros(K, dtype=np.int64)
+        self.somme_complexite = np.zeros(K, dtype=np.int64)
+        self.stats_steps = np.zeros(K, dtype=np.int64)
+        self.time_walking_total = np.zeros(K)
+        self.time_working_total = np.zeros(K)
+        self.time_idle_total = np.zeros(K)
+        self.score_history: List[List[Tuple[float, int]]] = [[(0.0, 0)] for _ in range(K)]
+
+    # ------------------------------------------------------------------
+    # PRÉCALCUL PAR CARTE
+    # ------------------------------------------------------------------
+    def _indexer_cartes(self, cartes) -> None:
+        """Tableaux de chaque carte (une fois par grille distincte), complétés à N cases / S stations."""
+        descriptions = {}
+        infos = []
+        for grille, spawns in cartes:
+            cle = tuple(map(tuple, grille))
+            if cle not in descriptions: descriptions[cle] = _decrire_carte(grille)
+            infos.append((descriptions[cle], spawns))
+
+        K, A = len(infos), self.nb_agents
+        N = max(d["voisins"].shape[0] for d, _ in infos)
+        S = max(d["d1"].shape[0] for d, _ in infos)
+        B = max(max(len(d["bac_nom"]) for d, _ in infos), 1)
+        self.nb_cuiseurs = C = max(max(len(d["bit_cuiseur"]) for d, _ in infos), 1)
+        self.nb_tables = T = max(max(len(d["bit_table"]) for d, _ in infos), 1)
+        self._s = np.arange(S)
+
+        self.d1 = np.full((K, S, N), LOIN, dtype=np.int16)
+        self.voisins = np.full((K, N, 4), -1, dtype=np.int64)
+        self.adj = {nom: np.full((K, N), -1, dtype=np.int64)
+                    for nom in ("adj_bac", "adj_decoupe", "adj_cuisson", "adj_table", "adj_service")}
+        self.bac_nom = np.full((K, B), -1, dtype=np.int64)
+        self.masque_bac = np.zeros((K, len(NOMS)), dtype=np.int64)
+        self.masque_decoupe = np.zeros(K, dtype=np.int64)
+        self.masque_service = np.zeros(K, dtype=np.int64)
+        self.masque_tables = np.zeros(K, dtype=np.int64)
+        self.bit_cuiseur = np.zeros((K, C), dtype=np.int64)
+        self.bit_table = np.zeros((K, T), dtype=np.int64)
+        self.dist_tables = np.full((K, T, N), LOIN, dtype=np.int64)
+        self.pos = np.zeros((K, A), dtype=np.int64)
+        self.cartes: List[Carte] = []
+
+        for k, (d, spawns) in enumerate(infos):
+            s, n = d["d1"].shape
+            self.d1[k, :s, :n] = d["d1"]
+            self.voisins[k, :n] = d["voisins"]
+            for nom, tab in self.adj.items(): tab[k, :n] = d[nom]
+            self.bac_nom[k, :len(d["bac_nom"])] = d["bac_nom"]
+            self.masque_bac[k] = d["masque_bac"]
+            self.masque_decoupe[k], self.masque_service[k] = d["masque_decoupe"], d["masque_service"]
+            self.masque_tables[k] = d["masque_tables"]
+            self.bit_cuiseur[k, :len(d["bit_cuiseur"])] = d["bit_cuiseur"]
+            self.bit_table[k, :len(d["bit_table"])] = d["bit_table"]
+            for t, dist in enumerate(d["dist_tables"]): self.dist_tables[k, t, :n] = dist
+            self.pos[k] = [y * d["cols"] + x for x, y in spawns[:A]]
+            self.cartes.append(d["carte"])
+
+    # ------------------------------------------------------------------
+    # CHEMINS (descente du champ de distance, comme Carte.descendre_champ)
+    # ------------------------------------------------------------------
+    def _distance(self, k: np.ndarray, masque: np.ndarray, cases: np.ndarray) -> np.ndarray:
+        """Champ des stations de `masque` en `cases` (LOIN si inaccessible)."""
+        bits = (masque[:, None] >> self._s) & 1 == 1
+        return np.where(bits, self.d1[k[:, None], self._s, cases[:, None]], LOIN).min(axis=1)
+
+    def _prochain_pas(self, k: np.ndarray, masque: np.ndarray, cases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Premier voisin (E, W, S, N) qui descend le champ de `masque`, et la distance avant le pas."""
+        d = self._distance(k, masque, cases)
+        v = self.voisins[k, cases]
+        bits = (masque[:, None] >> self._s) & 1 == 1
+        dv = self.d1[k[:, None, None], self._s, np.maximum(v, 0)[:, :, None]]
+        dv = np.where(bits[:, None, :] & (v[:, :, None] >= 0), dv, LOIN).min(axis=2)
+        j = (dv == (d - 1)[:, None]).argmax(axis=1)
+        return v[np.arange(len(k)), j], d
+
+    def _aller(self, k: np.ndarray, a: int, masque: np.ndarray) -> np.ndarray:
+        """`Agent._aller_vers` : chemin vers la station de `masque` la plus proche ; vrai s'il reste des pas."""
+        self.cooldown[k, a] = 0
+        d = self._distance(k, masque, self.pos[k, a])
+        part = (d > 0) & (d < LOIN)
+        self.cible[k[part], a] = masque[part]
+        return part
+
+    def _masque_cuisson(self, k: np.ndarray) -> np.ndarray:
+        """Fours et poêles libres, ou tous s'ils sont tous pris (FOUR_OU_POELE)."""
+        bits = self.bit_cuiseur[k]
+        libres = np.bitwise_or.reduce(np.where(self.cuisson[k] < 0, bits, 0), axis=1)
+        return np.where(libres != 0, libres, np.bitwise_or.reduce(bits, axis=1))
+
+    def _masque_assemblage(self, k: np.ndarray, a: int) -> np.ndarray:
+        t = self.assemblage[k, a]
+        return np.where(t >= 0, self.bit_table[k, np.maximum(t, 0)], self.masque_tables[k])
+
+    # ------------------------------------------------------------------
+    # RECETTES
+    # ------------------------------------------------------------------
+    def _choisir(self, k: np.ndarray, a: int) -> np.ndarray:
+        """`Agent.choisir_recette` : tri stable selon la stratégie, recettes des coéquipiers évitées."""
+        rid = self.recettes[k]
+        strat = self.strategies[k, a][:, None]
+        cle = np.where(strat == SIMPLE, TEMPS_ESTIME[rid], np.where(strat == COMPLEXE, -DIFFICULTE[rid], 0.0))
+        ordre = np.take_along_axis(rid, np.argsort(cle, axis=1, kind="stable"), axis=1)
+        autres = np.delete(self.bot[k], a, axis=1)
+        prises = (ordre[:, :, None] == autres[:, None, :]).any(axis=2)
+        return ordre[np.arange(len(k)), np.where(prises.all(axis=1), 0, (~prises).argmax(axis=1))]
+
+    def _nouvelle_recette(self, k: np.ndarray, a: int) -> None:
+        self.bot[k, a] = self._choisir(k, a)
+        self.next_req[k, a] = 0
+        self.assemblage[k, a] = -1
+
+    def _valider_recette(self, k: np.ndarray, a: int) -> None:
+        """`Agent._ensure_bot_recette_valide`."""
+        invalide = ~(self.recettes[k] == self.bot[k, a][:, None]).any(axis=1)
+        if invalide.any(): self._nouvelle_recette(k[invalide], a)
+
+    def _prochain_manquant(self, k: np.ndarray, bot: np.ndarray) -> np.ndarray:
+        """`InventaireCuisine.prochain_requis_manquant(bot, None)` ; -1 si rien ne manque."""
+        stock, cuisson = self.stock[k], self.cuisson[k]
+        noms_cuisson = np.where(cuisson >= 0, NOM_CODE[np.maximum(cuisson, 0)], -1)
+        res = np.full(len(k), -1, dtype=np.int64)
+        pris = np.zeros((len(k), MAX_REQUIS), dtype=bool)
+        for j in range(MAX_REQUIS):
+            c = REQ_CODE[bot, j]
+            deja = ((REQ_CODE[bot, :j] == c[:, None]) & pris[:, :j]).sum(axis=1)
+            dispo = (stock == c[:, None]).sum(axis=1) + (cuisson == c[:, None]).sum(axis=1)
+            pris[:, j] = (c >= 0) & (dispo > deja)
+            en_cuisson = (noms_cuisson == REQ_NOM[bot, j][:, None]).any(axis=1)
+            manque = (c >= 0) & ~pris[:, j] & ~en_cuisson & (res < 0)
+            res[manque] = j
+        return res
+
+    def _livrer(self, k: int, a: int, j: int) -> None:
+        """`Simulation.deliver_recipe` : la commande sort de la file, une nouvelle arrive à la fin."""
+        r = int(self.recettes[k, j])
+        self.score[k] += DIFFICULTE[r]
+        self.nb_livrees[k] += 1
+        self.somme_complexite[k] += COMPLEXITE[r]
+        self.score_history[k].append((self.current_sim_time, int(self.score[k])))
+        suite = self.recettes[k].tolist()
+        suite.pop(j)
+        suite.append(self._rng_commandes[k].choice(_INDICES))
+        self.recettes[k] = suite
+        self.main[k, a] = -1
+        if self.bot[k, a] == r or self.bot[k, a] not in suite:
+            self._nouvelle_recette(np.array([k]), a)
+
+    # ------------------------------------------------------------------
+    # ACTIONS (Agent.try_action)
+    # ------------------------------------------------------------------
+    def _progres(self, k: np.ndarray, a: int) -> None:
+        self.derniere_progression[k, a] = self.current_sim_time
+        self.derniere_pos[k, a] = self.pos[k, a]
+
+    def _agir(self, k: np.ndarray, a: int) -> np.ndarray:
+        """Action sur la station adjacente ; vrai pour les cuisines où l'agent a agi."""
+        now = self.current_sim_time
+        self._valider_recette(k, a)
+        n = len(k)
+        fait = np.zeros(n, dtype=bool)
+        reste = np.ones(n, dtype=bool)
+        pos, main, bot = self.pos[k, a], self.main[k, a], self.bot[k, a]
+        vide = main < 0
+        mc, bc = np.maximum(main, 0), np.maximum(bot, 0)
+
+        # 1. BAC : l'ingrédient visé, si ce bac le sert (sinon on ne fait rien)
+        b = self.adj["adj_bac"][k, pos]
+        m = vide & (b >= 0) & (bot >= 0)
+        if m.any():
+            voulu = REQ_NOM[bot[m], self.next_req[k[m], a] % NB_REQUIS[bot[m]]]
+            nom_bac = self.bac_nom[k[m], b[m]]
+            prend = np.where(nom_bac == LEGUME, EST_LEGUME[voulu], nom_bac == voulu)
+            km = k[m][prend]
+            self.main[km, a] = CODE[voulu[prend], SORTI]
+            self._progres(km, a)
+            fait[np.flatnonzero(m)[prend]] = True
+            reste &= ~m
+
+        # 2. DÉCOUPE, si la planche n'est pas occupée
+        dec = self.adj["adj_decoupe"][k, pos]
+        m = reste & ~vide & (dec >= 0) & (bot >= 0) & (ETAPE[bc, mc] == COUPE) & (ETAT_CODE[mc] == SORTI)
+        if m.any():
+            autres = np.delete(self.decoupe[k], a, axis=1)
+            m &= ~(autres == dec[:, None]).any(axis=1)
+            km = k[m]
+            self.fin_decoupe[km, a] = now + DUREE_COUPE[NOM_CODE[mc[m]]]
+            self.decoupe[km, a] = dec[m]
+            fait |= m
+            reste &= ~m
+
+        # 3. CUISSON : sortir un aliment cuit, ou enfourner (rien si le feu est pris)
+        c = self.adj["adj_cuisson"][k, pos]
+        cc = np.maximum(c, 0)
+        occupe = (c >= 0) & (self.cuisson[k, cc] >= 0)
+        m = reste & vide & occupe & (now >= self.cuisson_fin[k, cc])
+        if m.any():
+            km = k[m]
+            self.main[km, a] = self.cuisson[km, cc[m]]
+            self.cuisson[km, cc[m]] = -1
+            self.cuisson_fin[km, cc[m]] = np.inf
+            self._progres(km, a)
+            fait |= m
+            reste &= ~m
+        m = reste & ~vide & (c >= 0) & (bot >= 0) & (ETAPE[bc, mc] == CUIT) & (ETAT_CODE[mc] != CUIT)
+        reste &= ~(m & occupe)
+        m &= ~occupe
+        if m.any():
+            km = k[m]
+            self.cuisson[km, cc[m]] = main[m]
+            self.cuisson_fin[km, cc[m]] = now + DUREE_CUISSON[NOM_CODE[mc[m]]]
+            self.main[km, a] = -1
+            self._progres(km, a)
+            fait |= m
+            reste &= ~m
+
+        # 4. ASSEMBLAGE
+        t = self.adj["adj_table"][k, pos]
+        m = reste & (t >= 0)
+        if m.any():
+            fait[m] = self._assembler(k[m], a, t[m])
+            reste &= ~m
+
+        # 5. SERVICE
+        m = reste & ~vide & (self.adj["adj_service"][k, pos] >= 0)
+        if m.any():
+            servie = self.recettes[k[m]] == PLAT_DE[mc[m]][:, None]
+            for kk, j in zip(k[m][servie.any(axis=1)].tolist(), servie.argmax(axis=1)[servie.any(axis=1)].tolist()):
+                self._livrer(kk, a, j)
+                self._progres(np.array([kk]), a)
+            fait[m] = servie.any(axis=1)
+        return fait
+
+    def _assembler(self, k: np.ndarray, a: int, t: np.ndarray) -> np.ndarray:
+        """Section ASSEMBLAGE de try_action devant la table `t` ; vrai si l'agent a agi."""
+        fait = np.zeros(len(k), dtype=bool)
+        rid = self.recettes[k]
+        st = self.stock[k, t]
+        main, bot = self.main[k, a], self.bot[k, a]
+        vide = main < 0
+
+        # Nettoyage : un stock qui n'est ni un plat commandé ni accueilli par une commande est jeté
+        sc = np.maximum(st, 0)
+        plat_final = (st >= 0) & (rid == PLAT_DE[sc][:, None]).any(axis=1) & (ETAT_CODE[sc] == CUIT)
+        jeter = (st >= 0) & ~plat_final & ~(RC[rid, sc[:, None]] >= 1).any(axis=1)
+        if jeter.any():
+            self.stock[k[jeter], t[jeter]] = -1
+            st = np.where(jeter, -1, st)
+            self._progres(k[jeter], a)
+        sc = np.maximum(st, 0)
+
+        def poser(m, objet):
+            self.stock[k[m], t[m]] = objet
+            self._progres(k[m], a)
+            fait[m] = True
+
+        # Cas A : le stock (même vide) convient à ma recette
+        m_a = vide & (bot >= 0) & ((st < 0) | (RC[np.maximum(bot, 0), sc] >= 1))
+        if m_a.any(): poser(m_a, PLAT[bot[m_a]])
+        # Cas B : le stock convient à une commande
+        compat = RC[rid, sc[:, None]] >= 1
+        m_b = vide & ~m_a & (st >= 0) & compat.any(axis=1)
+        if m_b.any(): poser(m_b, PLAT[rid[m_b, compat[m_b].argmax(axis=1)]])
+        # Cas C : je pose mon objet, assemblé s'il tient avec le stock dans une commande
+        rc_main = RC[rid, np.maximum(main, 0)[:, None]]
+        compat = np.where((st < 0)[:, None], rc_main >= 1,
+                          np.where((st == main)[:, None], rc_main >= 2, (rc_main >= 1) & (RC[rid, sc[:, None]] >= 1)))
+        m_c = ~vide & compat.any(axis=1)
+        if m_c.any():
+            poser(m_c, PLAT[rid[m_c, compat[m_c].argmax(axis=1)]])
+            self.main[k[m_c], a] = -1
+        m_c = ~vide & ~m_c & (st < 0)
+        if m_c.any():
+            poser(m_c, main[m_c])
+            self.main[k[m_c], a] = -1
+        # Cas D : je prends un plat commandé et je pars au service
+        m_d = vide & ~m_a & ~m_b & (st >= 0) & (rid == PLAT_DE[sc][:, None]).any(axis=1)
+        if m_d.any():
+            kd = k[m_d]
+            self.main[kd, a] = st[m_d]
+            self.stock[kd, t[m_d]] = -1
+            self._progres(kd, a)
+            self._aller(kd, a, self.masque_service[kd])
+            fait[m_d] = True
+        return fait
+
+    # ------------------------------------------------------------------
+    # PLANIFICATION (Agent._planifier)
+    # ------------------------------------------------------------------
+    def _planifier(self, k: np.ndarray, a: int) -> None:
+        self._valider_recette(k, a)
+        now = self.current_sim_time
+        main, bot = self.main[k, a], self.bot[k, a]
+        mc, bc = np.maximum(main, 0), np.maximum(bot, 0)
+        tient = main >= 0
+
+        # 0. Plat commandé en main -> service
+        servir = tient & (self.recettes[k] == PLAT_DE[mc][:, None]).any(axis=1)
+        # 1. Ingrédient en main : découpe, cuisson, sinon table d'assemblage
+        utile = tient & ~servir & (bot >= 0)
+        etape, etat = ETAPE[bc, mc], ETAT_CODE[mc]
+        decouper = utile & BESOIN[bc, mc] & (etape == COUPE) & (etat == SORTI)
+        cuire = utile & BESOIN[bc, mc] & (etape == CUIT) & (etat != CUIT)
+        poser = utile & ~decouper & ~cuire
+        if servir.any(): self._aller(k[servir], a, self.masque_service[k[servir]])
+        if decouper.any(): self._aller(k[decouper], a, self.masque_decoupe[k[decouper]])
+        if cuire.any(): self._aller(k[cuire], a, self._masque_cuisson(k[cuire]))
+        if poser.any(): self._aller(k[poser], a, self._masque_assemblage(k[poser], a))
+
+        # 2. Mains vides. A : une cuisson est prête
+        k = k[~tient]
+        if not len(k): return
+        pretes = (self.cuisson[k] >= 0) & (now >= self.cuisson_fin[k])
+        m = pretes.any(axis=1)
+        if m.any():
+            masque = np.bitwise_or.reduce(np.where(pretes[m], self.bit_cuiseur[k[m]], 0), axis=1)
+            part = np.zeros(len(k), dtype=bool)
+            part[m] = self._aller(k[m], a, masque)
+            k = k[~part]
+            if not len(k): return
+        bot = self.bot[k, a]
+
+        # B : table la plus proche dont le stock sert ma recette
+        st = self.stock[k]
+        sert = (st >= 0) & (RC[bot[:, None], np.maximum(st, 0)] >= 1)
+        d = np.where(sert, self.dist_tables[k, :, self.pos[k, a]], np.iinfo(np.int64).max)
+        table = np.where(sert.any(axis=1), d.argmin(axis=1), -1)
+        self.assemblage[k[table >= 0], a] = table[table >= 0]
+        complet = (table >= 0) & (NB_REQUIS[bot] == 1)
+        if complet.any(): self._aller(k[complet], a, self._masque_assemblage(k[complet], a))
+
+        # B (recette incomplète) et C : bac du prochain ingrédient manquant
+        m = ~complet
+        if m.any():
+            k, bot, table = k[m], bot[m], table[m]
+            idx = self._prochain_manquant(k, bot)
+            ok = idx >= 0
+            self.assemblage[k[ok & (table < 0)], a] = -1
+            k, bot, idx = k[ok], bot[ok], idx[ok]
+            self.next_req[k, a] = idx
+            self._aller(k, a, self.masque_bac[k, REQ_NOM[bot, idx]])
+
+    # ------------------------------------------------------------------
+    # BOUCLE
+    # ------------------------------------------------------------------
+    def pas(self, dt: float = DT_DEFAUT) -> None:
+        """Un tick dans toutes les cuisines : physique, découpes, agents, statistiques ; puis l'horloge avance."""
+        self.tick_courant += 1
+        now = self.current_sim_time
+
+        # Physique
+        finies = (self.cuisson >= 0) & (now >= self.cuisson_fin)
+        self.cuisson[finies] = CUIT_DE[self.cuisson[finies]]
+
+        # Découpes : terminées (l'aliment coupé revient en main) ou en cours (agent occupé)
+        avant = self.pos.copy()
+        en_cours = self.fin_decoupe < np.inf
+        occupes = en_cours & (now < self.fin_decoupe)
+        for a in range(self.nb_agents):
+            kf = self._k[en_cours[:, a] & ~occupes[:, a]]
+            if len(kf):
+                self.main[kf, a] = COUPE_DE[self.main[kf, a]]
+                self.fin_decoupe[kf, a] = np.inf
+                self.decoupe[kf, a] = -1
+                self._progres(kf, a)
+            self.time_working_total += occupes[:, a] * dt
+
+        for a in range(self.nb_agents):
+            self._tick_agent(self._k[~occupes[:, a]], a)
+
+        for a in range(self.nb_agents):
+            bouge = self.pos[:, a] != avant[:, a]
+            self.stats_steps += bouge
+            self.time_walking_total += bouge * dt
+            self.time_idle_total += (~bouge & ~occupes[:, a]) * dt
+
+        self.current_sim_time += dt
+
+    def _tick_agent(self, k: np.ndarray, a: int) -> None:
+        """`Agent.tick` dans les cuisines `k` : blocage, puis réflexion (sans chemin) ou marche."""
+        now = self.current_sim_time
+        k = k[~(now < self.pause_until[k, a])]
+        if not len(k): return
+
+        # _check_blockage : dégagement au-delà de 2 s sans progrès, remise à zéro au-delà de 5 s
+        pos = self.pos[k, a]
+        bouge = pos != self.derniere_pos[k, a]
+        self.derniere_pos[k[bouge], a] = pos[bouge]
+        self.derniere_progression[k[bouge], a] = now
+        stagnation = now - self.derniere_progression[k, a]
+        for kk in k[~bouge & (stagnation > SEUIL_RECUL_S) & (stagnation < SEUIL_BLOCAGE_S)].tolist():
+            self._degager(kk, a)
+        reset = k[~bouge & (stagnation > SEUIL_BLOCAGE_S)]
+        if len(reset):
+            self.cible[reset, a] = 0
+            self.pas_force[reset, a] = -1
+            self.bot[reset, a] = -1
+            self.pause_until[reset, a] = now + 1.0
+            self._progres(reset, a)
+
+        chemin = (self.cible[k, a] != 0) | (self.pas_force[k, a] >= 0)
+        if (~chemin).any():
+            kr = k[~chemin]
+            agi = self._agir(kr, a)
+            if (~agi).any(): self._planifier(kr[~agi], a)
+        if chemin.any():
+            self._marcher(k[chemin], a)
+
+    def _marcher(self, k: np.ndarray, a: int) -> None:
+        """Un pas du chemin quand le cooldown le permet ; action dès l'arrivée."""
+        self.cooldown[k, a] += 1
+        k = k[self.cooldown[k, a] >= self.move_every_ticks]
+        if not len(k): return
+        force = self.pas_force[k, a] >= 0
+        suivante = self.pas_force[k, a].copy()
+        arrive = force.copy()
+        if (~force).any():
+            kc = k[~force]
+            suivante[~force], d = self._prochain_pas(kc, self.cible[kc, a], self.pos[kc, a])
+            arrive[~force] = d == 1
+        self.pos[k, a] = suivante
+        self.cooldown[k, a] = 0
+        self.pas_force[k, a] = -1
+        self._progres(k, a)
+        ka = k[arrive]
+        if len(ka):
+            self.cible[ka, a] = 0
+            self._progres(ka[self._agir(ka, a)], a)
+
+    def _degager(self, k: int, a: int) -> None:
+        """`Agent._tenter_degagement` : un pas au hasard (flux de l'agent) vers une case voisine libre."""
+        pos = int(self.pos[k, a])
+        if self.pas_force[k, a] >= 0:
+            prochaine = int(self.pas_force[k, a])
+        elif self.cible[k, a] != 0:
+            prochaine = int(self._prochain_pas(np.array([k]), self.cible[k, a:a+1], np.array([pos]))[0][0])
+        else:
+            prochaine = -1
+        autres = {int(p) for b, p in enumerate(self.pos[k]) if b != a}
+        candidates = [c for c in self.voisins[k, pos, _ORDRE_DEGAGEMENT].tolist()
+                      if c >= 0 and c not in autres and c != prochaine]
+        if not candidates: return
+        self.pas_force[k, a] = self._rng_agents[k][a].choice(candidates)
+        self.cible[k, a] = 0
+        self.pause_until[k, a] = self.current_sim_time + 1.5
+        self._progres(np.array([k]), a)
+
+    def run(self, dt: float = DT_DEFAUT) -> List[dict]:
+        """Joue toutes les cuisines jusqu'au bout ; une entrée de résultats par cuisine."""
+        while self.current_sim_time < self.duration_s:
+            self.pas(dt)
+        return self.resultats()
+
+    def resultats(self) -> List[dict]:
+        total_pool = self.duration_s * self.nb_agents
+        res = []
+        for k in range(self.nb_cuisines):
+            score = int(self.score[k])
+            nb = int(self.nb_livrees[k])
+            res.append({
+                "score": score,
+                "nb_agents": self.nb_agents,
+                "recettes_count": nb,
+                "avg_complexity": int(self.somme_complexite[k]) / nb if nb else 0,
+                "history": self.score_history[k],
+                "efficiency_cost": int(self.stats_steps[k]) / score if score > 0 else 0,
+                "walking_pct": (float(self.time_walking_total[k]) / total_pool) * 100,
+                "working_pct": (float(self.time_working_total[k]) / total_pool) * 100,
+                "idle_pct": (float(self.time_idle_total[k]) / total_pool) * 100,
+            })
+        return res
@@ -47,13 +47,13 @@ class StartMenu:
 
         # Stratégies J1
         tk.Label(self.frame_j1, text="Stratégie Agent A :", bg=FRAME_BG, fg=TEXT_COLOR).pack(pady=(10,0))
-        self.strat_j1_a = ttk.Combobox(self.frame_j1, values=["naive", "simple", "complexe"], state="readonly")
+        self.strat_j1_a = ttk.Combobox(self.frame_j1, values=["naive", "simple", "complexe", "anticipation", "ordonnance"], state="readonly")
         self.strat_j1_a.current(0)
         self.strat_j1_a.pack(pady=5)
 
         self.lbl_j1_b = tk.Label(self.frame_j1, text="Stratégie Agent B :", bg=FRAME_BG, fg=TEXT_COLOR)
         self.lbl_j1_b.pack(pady=(5,0))
-        self.strat_j1_b = ttk.Combobox(self.frame_j1, values=["naive", "simple", "complexe"], state="readonly")
+        self.strat_j1_b = ttk.Combobox(self.frame_j1, values=["naive", "simple", "complexe", "anticipation", "ordonnance"], state="readonly")
         self.strat_j1_b.current(0)
         self.strat_j1_b.pack(pady=5)
 
@@ -73,13 +73,13 @@ class StartMenu:
 
         # Stratégies J2
         tk.Label(self.frame_j2, text="Stratégie Agent A :", bg=FRAME_BG, fg=TEXT_COLOR).pack(pady=(10,0))
-        self.strat_j2_a = ttk.Combobox(self.frame_j2, values=["naive", "simple", "complexe"], state="readonly")
+        self.strat_j2_a = ttk.Combobox(self.frame_j2, values=["naive", "simple", "complexe", "anticipation", "ordonnance"], state="readonly")
         self.strat_j2_a.current(0)
         self.strat_j2_a.pack(pady=5)
 
         self.lbl_j2_b = tk.Label(self.frame_j2, text="Stratégie Agent B :", bg=FRAME_BG, fg=TEXT_COLOR)
         self.lbl_j2_b.pack(pady=(5,0))
-        self.strat_j2_b = ttk.Combobox(self.frame_j2, values=["naive", "simple", "complexe"], state="readonly")
+        self.strat_j2_b = ttk.Combobox(self.frame_j2, values=["naive", "simple", "complexe", "anticipation", "ordonnance"], state="readonly")
         self.strat_j2_b.current(0)
         self.strat_j2_b.pack(pady=5)
 
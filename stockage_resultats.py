@@ -0,0 +1,125 @@
+# stockage_resultats.py
+"""
+Stock des résultats de benchmark sur disque, alimenté match par match.
+
+Chaque match terminé ajoute une ligne à un CSV (résumé + historique du score encodé en JSON),
+écrite et synchronisée aussitôt : un balayage interrompu ne perd que les matchs en cours, et le
+relancer ne rejoue que ceux qui manquent. Une ligne est identifiée par sa clé (hash de la carte,
+scénario, graine du match, durée) ; une dernière ligne tronquée par un arrêt brutal est retirée
+à l'ouverture.
+
+La carte se déduit de la graine mais coûte cher à générer : un match déjà joué se retrouve par
+(scénario, graine, durée) avec `retrouver`. C'est à l'appelant de vérifier, en régénérant la carte
+là où il la joue, que son hash est toujours celui de la clé avant de réutiliser le match.
+"""
+import csv
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+# À côté du code (indépendant du dossier courant), comme table_chemins.DOSSIER_CACHE
+CHEMIN_DEFAUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "benchmark", "matchs.csv")
+COLONNES_CLE = ("Carte", "Scenario", "Graine", "Duree")
+COLONNE_HISTORIQUE = "Historique"
+
+Cle = Tuple[str, str, int, int]
+
+
+class StockResultats:
+    def __init__(self, chemin: str = CHEMIN_DEFAUT) -> None:
+        self.chemin = chemin
+        self.colonnes: List[str] = []
+        self._cles: Set[Cle] = set()
+        self._par_match: Dict[Tuple[str, int, int], Cle] = {}  # (scénario, graine, durée) -> clé
+        if os.path.exists(chemin):
+            self._reparer()
+            with open(chemin, newline="", encoding="utf-8") as f:
+                lecteur = csv.DictReader(f)
+                self.colonnes = list(lecteur.fieldnames or [])
+                for row in lecteur:
+                    self._indexer(self._cle_de(row))
+
+    def __len__(self) -> int:
+        return len(self._cles)
+
+    def __contains__(self, cle: Cle) -> bool:
+        return tuple(cle) in self._cles
+
+    def retrouver(self, scenario: str, graine: int, duree: int) -> Optional[Cle]:
+        """Clé stockée la plus récente pour ce scénario, cette graine et cette durée (None s'il n'y en a pas)."""
+        return self._par_match.get((scenario, graine, duree))
+
+    def _indexer(self, cle: Cle) -> None:
+        self._cles.add(cle)
+        self._par_match[cle[1:]] = cle  # la plus récente : un match rejoué sur une carte modifiée
+
+    @staticmethod
+    def _cle_de(row: Dict[str, str]) -> Cle:
+        return (row["Carte"], row["Scenario"], int(row["Graine"]), int(row["Duree"]))
+
+    def _reparer(self) -> None:
+        """Retire une dernière ligne incomplète (fichier qui ne finit pas par un saut de ligne)."""
+        with open(self.chemin, "rb+") as f:
+            contenu = f.read()
+            if not contenu or contenu.endswith(b"\n"): return
+            f.truncate(contenu.rfind(b"\n") + 1)
+
+    # ------------------------------------------------------------------
+    # ÉCRITURE
+    # ------------------------------------------------------------------
+    def ajouter(self, cle: Cle, ligne: dict, historique: Sequence[Tuple[float, int]]) -> None:
+        """Enregistre un match terminé (sans effet si sa clé est déjà stockée)."""
+        cle = tuple(cle)
+        if cle in self._cles: return
+        row = dict(zip(COLONNES_CLE, cle))
+        row.update(ligne)
+        row[COLONNE_HISTORIQUE] = json.dumps([list(p) for p in historique])
+
+        nouveau = not self.colonnes
+        if nouveau:
+            self.colonnes = list(row)
+            os.makedirs(os.path.dirname(self.chemin) or ".", exist_ok=True)
+        elif set(row) != set(self.colonnes):
+            raise ValueError(f"Colonnes incompatibles avec le stock {self.chemin} : {sorted(set(row) ^ set(self.colonnes))}")
+
+        with open(self.chemin, "a", newline="", encoding="utf-8") as f:
+            ecrivain = csv.DictWriter(f, fieldnames=self.colonnes)
+            if nouveau: ecrivain.writeheader()
+            ecrivain.writerow(row)
+            f.flush()
+            os.fsync(f.fileno())
+        self._indexer(cle)
+
+    # ------------------------------------------------------------------
+    # LECTURE
+    # ------------------------------------------------------------------
+    def scores(self) -> Dict[Cle, float]:
+        """Score final de chaque match stocké, par clé."""
+        if not self.colonnes: return {}
+        with open(self.chemin, newline="", encoding="utf-8") as f:
+            return {self._cle_de(row): float(row["Score"]) for row in csv.DictReader(f)}
+
+    def charger(self, cles: Optional[Iterable[Cle]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        (résumés, historiques) des matchs stockés, ou seulement de `cles` dans leur ordre.
+        Les historiques ont les colonnes Temps, Score, Label, Category et Sim_ID (numéro de ligne
+        du résumé, à partir de 1).
+        """
+        if not self.colonnes:
+            return pd.DataFrame(), pd.DataFrame(columns=["Temps", "Score", "Label", "Category", "Sim_ID"])
+        df = pd.read_csv(self.chemin, float_precision="round_trip", dtype={"Carte": str})
+        df = df.drop_duplicates(subset=list(COLONNES_CLE), keep="first")
+        if cles is not None:
+            df = df.set_index(list(COLONNES_CLE)).loc[[tuple(c) for c in cles]].reset_index()
+        df = df.reset_index(drop=True)
+
+        morceaux = []
+        for sim_id, (hist, label, cat) in enumerate(zip(df[COLONNE_HISTORIQUE], df["Label"], df["Category"]), 1):
+            h = pd.DataFrame(json.loads(hist), columns=["Temps", "Score"])
+            h["Label"] = label
+            h["Category"] = cat
+            h["Sim_ID"] = sim_id
+            morceaux.append(h)
+        return df.drop(columns=[COLONNE_HISTORIQUE]), pd.concat(morceaux, ignore_index=True)
@@ -0,0 +1,163 @@
+# table_chemins.py
+"""
+Table de plus courts chemins entre toutes les paires de cases de sol d'une carte.
+
+Les cartes de `map_generator.generate_map` sont petites (8x12 par défaut) : une matrice
+distance / premier pas (int16) tient en quelques Ko. Elle est identifiée par un hash de la
+grille et gardée en mémoire pour les `TAILLE_MEMOIRE` cartes les plus récentes du processus.
+
+La sauvegarde sur disque est au choix de l'appelant (`dossier`) : utile pour un benchmark rejoué
+sur les mêmes cartes, qui ne refait alors aucun BFS, elle ne ferait qu'accumuler des fichiers pour
+des cartes tirées au fil de l'eau (jeu, environnement d'apprentissage).
+"""
+import hashlib
+import os
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+Coord = Tuple[int, int]
+
+# Dossier de sauvegarde proposé aux appelants, à côté du code (indépendant du dossier courant)
+DOSSIER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "chemins")
+INACCESSIBLE = -1
+TAILLE_MEMOIRE = 128  # tables gardées en mémoire par processus (les plus récemment utilisées)
+
+# Tables déjà chargées dans ce processus (les 6 scénarios d'une carte la partagent), ordre LRU
+_TABLES_MEMOIRE: "OrderedDict[str, TableChemins]" = OrderedDict()
+
+
+def hash_grille(grille: Sequence[Sequence[int]]) -> str:
+    """Clé de cache : dimensions + contenu de la grille."""
+    rows, cols = len(grille), len(grille[0])
+    h = hashlib.sha1(f"{rows}x{cols}:".encode())
+    h.update(bytes(code for row in grille for code in row))
+    return h.hexdigest()
+
+
+class TableChemins:
+    """Distances (`dist`) et premiers pas (`pas`) entre toutes les cases de sol, indexées par `index`."""
+
+    def __init__(self, grille: Sequence[Sequence[int]], bloquants: Set[int], dossier: Optional[str] = None) -> None:
+        self.rows = len(grille)
+        self.cols = len(grille[0])
+        self.cle = hash_grille(grille)
+
+        # index[y * cols + x] = numéro de la case de sol, ou -1
+        self.index = np.full(self.rows * self.cols, -1, dtype=np.int16)
+        self.cases: List[Coord] = []
+        for y, row in enumerate(grille):
+            for x, code in enumerate(row):
+                if code not in bloquants:
+                    self.index[y * self.cols + x] = len(self.cases)
+                    self.cases.append((x, y))
+
+        chemin = os.path.join(dossier, self.cle + ".npz") if dossier else None
+        if not (chemin and self._charger(chemin)):
+            self.dist, self.pas = self._construire()
+            if chemin: self._sauver(chemin)
+
+    @classmethod
+    def pour_grille(cls, grille: Sequence[Sequence[int]], bloquants: Set[int], dossier: Optional[str] = None) -> "TableChemins":
+        """Table partagée en mémoire, sinon relue depuis `dossier` (s'il est donné), sinon calculée."""
+        cle = hash_grille(grille)
+        table = _TABLES_MEMOIRE.get(cle)
+        if table is None:
+            table = cls(grille, bloquants, dossier)
+            _TABLES_MEMOIRE[cle] = table
+            if len(_TABLES_MEMOIRE) > TAILLE_MEMOIRE: _TABLES_MEMOIRE.popitem(last=False)
+        else:
+            _TABLES_MEMOIRE.move_to_end(cle)
+        return table
+
+    # ------------------------------------------------------------------
+    # CONSTRUCTION / PERSISTANCE
+    # ------------------------------------------------------------------
+    def _construire(self) -> Tuple[np.ndarray, np.ndarray]:
+        n = len(self.cases)
+        dist = np.full((n, n), INACCESSIBLE, dtype=np.int16)
+        pas = np.full((n, n), INACCESSIBLE, dtype=np.int16)
+        voisins = [self._voisins_idx(i) for i in range(n)]
+
+        # Un BFS par destination j : le parent de i dans l'arbre enraciné en j
+        # est exactement le premier pas de i vers j.
+        for j in range(n):
+            d_col = [INACCESSIBLE] * n
+            p_col = [INACCESSIBLE] * n
+            d_col[j] = 0
+            p_col[j] = j
+            q = deque([j])
+            while q:
+                cur = q.popleft()
+                for nxt in voisins[cur]:
+                    if d_col[nxt] == INACCESSIBLE:
+                        d_col[nxt] = d_col[cur] + 1
+                        p_col[nxt] = cur
+                        q.append(nxt)
+            dist[:, j] = d_col
+            pas[:, j] = p_col
+        return dist, pas
+
+    def _voisins_idx(self, i: int) -> List[int]:
+        x, y = self.cases[i]
+        res = []
+        for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
+            nx, ny = x+dx, y+dy
+            if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                k = int(self.index[ny * self.cols + nx])
+                if k >= 0: res.append(k)
+        return res
+
+    def _charger(self, chemin: str) -> bool:
+        try:
+            with np.load(chemin) as data:
+                dist, pas = data["dist"], data["pas"]
+        except (OSError, KeyError, ValueError):
+            return False
+        n = len(self.cases)
+        if dist.shape != (n, n) or pas.shape != (n, n):
+            return False
+        self.dist, self.pas = dist, pas
+        return True
+
+    def _sauver(self, chemin: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(chemin), exist_ok=True)
+            tmp = f"{chemin}.{os.getpid()}.tmp.npz"  # un fichier par processus (workers parallèles)
+            np.savez_compressed(tmp, dist=self.dist, pas=self.pas)
+            os.replace(tmp, chemin)
+        except OSError as e:
+            print(f"Impossible de sauvegarder la table de chemins {chemin} :", e)
+
+    # ------------------------------------------------------------------
+    # REQUÊTES
+    # ------------------------------------------------------------------
+    def idx(self, pos: Coord) -> int:
+        x, y = pos
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return int(self.index[y * self.cols + x])
+        return -1
+
+    def distance(self, a: Coord, b: Coord) -> Optional[int]:
+        """Nombre de pas entre deux cases de sol (None si hors sol ou inaccessible)."""
+        i, j = self.idx(a), self.idx(b)
+        if i < 0 or j < 0: return None
+        d = int(self.dist[i, j])
+        return None if d == INACCESSIBLE else d
+
+    def chemin(self, start: Coord, goals: Iterable[Coord]) -> Optional[List[Coord]]:
+        """Plus court chemin (start inclus) vers le but le plus proche, par lecture de `pas`."""
+        i = self.idx(start)
+        if i < 0: return None
+        cibles = [j for j in (self.idx(g) for g in goals) if j >= 0]
+        if not cibles: return None
+        d = self.dist[i, cibles]
+        atteignables = d >= 0
+        if not atteignables.any(): return None
+        j = cibles[int(np.argmin(np.where(atteignables, d, np.iinfo(np.int16).max)))]
+        path = [self.cases[i]]
+        while i != j:
+            i = int(self.pas[i, j])
+            path.append(self.cases[i])
+        return path
@@ -0,0 +1,34 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+# Les modules du jeu sont à la racine du dépôt
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from carte import Carte
+from graines import GrainesMatch
+from map_generator import generate_map
+from recette import ALIMENTS_BAC
+
+
+@pytest.fixture(scope="session")
+def cartes():
+    """Cartes des graines de match 0 à 7 : (graines, grille, spawn 1, spawn 2)."""
+    res = []
+    for i in range(8):
+        g = GrainesMatch(i)
+        grille, s1, s2 = generate_map(rng=g.carte())
+        res.append((g, grille, s1, s2))
+    return res
+
+
+@pytest.fixture(scope="session")
+def carte_de():
+    """Carte de jeu (sans textures, bacs assignés) d'une grille."""
+    def fabriquer(grille) -> Carte:
+        carte = Carte(grille, textures=False)
+        carte.assigner_bacs(ALIMENTS_BAC)
+        return carte
+    return fabriquer
@@ -0,0 +1,69 @@
+# tests/test_anticipation.py
+import time
+
+from simulation import Simulation
+
+BUDGET_S = 0.01
+TOLERANCE_S = 0.001  # au-delà, le dépassement doit avoir été compté
+
+
+def _jeu(cartes, budget_s=BUDGET_S):
+    g, grille, s1, s2 = cartes[0]
+    jeu = Simulation(grille, [s1, s2], ["anticipation", "complexe"], 60, move_every_ticks=1.0,
+                     graine=g.graine, budget_calcul_s=budget_s)
+    for _ in range(20):
+        jeu.pas()
+    return jeu
+
+
+def _decider(jeu):
+    """Une décision dans un nouveau tick (budget plein) ; rend la recette choisie et le temps écoulé."""
+    jeu.tick_courant += 1
+    t0 = time.perf_counter()
+    choix = jeu.anticipation.choisir(jeu.agents[0], list(jeu.recettes))
+    return choix, time.perf_counter() - t0
+
+
+def test_decision_tient_dans_le_budget(cartes):
+    jeu = _jeu(cartes)
+    recherche = jeu.anticipation
+    etat = (jeu.current_sim_time, jeu.score, [(p.x, p.y) for p in jeu.players])
+    debut = recherche.stats()
+    for _ in range(10):
+        avant = recherche.depassements
+        choix, duree = _decider(jeu)
+        assert choix in jeu.recettes
+        assert duree < BUDGET_S + recherche.depassement_max_s + TOLERANCE_S
+        if duree > BUDGET_S + TOLERANCE_S: assert recherche.depassements == avant + 1
+        # La recherche joue la suite puis revient à l'état de départ
+        assert etat == (jeu.current_sim_time, jeu.score, [(p.x, p.y) for p in jeu.players])
+    stats = recherche.stats()
+    assert stats["decisions"] - debut["decisions"] == 10 and stats["rollouts"] > debut["rollouts"]
+    assert stats["decisions_sans_budget"] == debut["decisions_sans_budget"]
+    assert stats["duree_max_ms"] < BUDGET_S * 1000 + stats["depassement_max_ms"] + TOLERANCE_S * 1000
+
+
+def test_recherche_interrompue_rend_une_recette_valide(cartes, monkeypatch):
+    jeu = _jeu(cartes)
+    pas = jeu.pas
+
+    def pas_lent(*args, **kwargs):
+        time.sleep(2 * BUDGET_S)
+        return pas(*args, **kwargs)
+
+    # Le premier pas simulé déborde de l'échéance : aucun horizon n'est achevé
+    monkeypatch.setattr(jeu, "pas", pas_lent)
+    candidates = list(jeu.recettes)
+    recherche = jeu.anticipation
+    avant = (recherche.depassements, recherche.profondeur_totale)
+    choix, _ = _decider(jeu)
+    assert choix is candidates[0] and choix in jeu.recettes
+    assert recherche.depassements == avant[0] + 1 and recherche.profondeur_totale == avant[1]
+    stats = recherche.stats()
+    assert stats["depassements"] == recherche.depassements and stats["depassement_max_ms"] >= BUDGET_S * 1000
+
+    # Budget déjà épuisé dans le tick : repli immédiat, sans simulation
+    sans_budget = stats["decisions_sans_budget"]
+    assert recherche.choisir(jeu.agents[0], candidates) is candidates[0]
+    apres = recherche.stats()
+    assert apres["decisions_sans_budget"] == sans_budget + 1 and apres["rollouts"] == stats["rollouts"]
@@ -0,0 +1,61 @@
+# tests/test_arret_sequentiel.py
+import random
+import statistics
+
+import pytest
+
+from arret_sequentiel import SuiviSequentiel, Welford
+
+
+def test_welford_egal_statistics():
+    rng = random.Random(0)
+    valeurs = [rng.gauss(300, 80) for _ in range(500)]
+    flux = Welford()
+    for n, x in enumerate(valeurs, 1):
+        flux.ajouter(x)
+        assert flux.moyenne == pytest.approx(statistics.mean(valeurs[:n]), rel=1e-12)
+        if n > 1:
+            assert flux.variance == pytest.approx(statistics.variance(valeurs[:n]), rel=1e-9)
+    assert Welford().variance == 0.0
+
+
+def test_difference_symetrique():
+    suivi = SuiviSequentiel(["a", "b", "c"], min_cartes=2)
+    rng = random.Random(1)
+    for _ in range(5):
+        suivi.ajouter_carte({"a": rng.uniform(0, 100), "b": rng.uniform(0, 100), "c": rng.uniform(0, 100)})
+    for x, y in [("a", "b"), ("a", "c"), ("b", "c")]:
+        bas, haut = suivi.difference(x, y)
+        assert suivi.difference(y, x) == (-haut, -bas)
+        assert bas <= haut
+
+
+def _suivi_jusqu_a_l_arret(ecart: float, max_cartes: int = 200) -> SuiviSequentiel:
+    rng = random.Random(2)
+    suivi = SuiviSequentiel(["fort", "faible"], largeur_cible=0.0)  # seules les comparaisons décident
+    while not suivi.arreter() and suivi.nb_cartes < max_cartes:
+        base = rng.uniform(200, 600)  # difficulté de la carte, commune aux deux scénarios
+        suivi.ajouter_carte({"fort": base + ecart + rng.gauss(0, 10), "faible": base + rng.gauss(0, 10)})
+    return suivi
+
+
+def test_arret_scenarios_separes():
+    suivi = _suivi_jusqu_a_l_arret(ecart=100.0)
+    assert suivi.arreter() and suivi.nb_cartes == suivi.min_cartes
+    assert suivi.comparaisons_tranchees() == 1
+    assert suivi.difference("fort", "faible")[0] > 0
+
+
+def test_arret_scenarios_equivalents():
+    suivi = _suivi_jusqu_a_l_arret(ecart=0.0)
+    assert suivi.arreter() and suivi.nb_cartes < 200
+    assert suivi.comparaisons_tranchees() == 0 and suivi.comparaisons_equivalentes() == 1
+
+
+def test_pas_d_arret_avant_min_cartes():
+    suivi = SuiviSequentiel(["a", "b"], largeur_cible=1e9)
+    for i in range(suivi.min_cartes - 1):
+        suivi.ajouter_carte({"a": 100.0 + i, "b": 50.0})
+        assert not suivi.arreter()
+    suivi.ajouter_carte({"a": 100.0, "b": 50.0})
+    assert suivi.arreter()
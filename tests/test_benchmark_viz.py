@@ -0,0 +1,82 @@
+# tests/test_benchmark_viz.py
+import numpy as np
+import pandas as pd
+
+from arret_sequentiel import SuiviSequentiel
+from benchmark_viz import SCENARIOS, balayer, jouer_matchs, process_smoothed_curves
+
+
+def _jobs(nb_cartes: int, duree: int = 20):
+    return [(i, k, duree) for i in range(nb_cartes) for k in range(len(SCENARIOS))]
+
+
+def test_processus_identiques_au_sequentiel():
+    jobs = _jobs(3)
+    sequentiel = list(jouer_matchs(jobs, processus=1))
+    assert len(sequentiel) == len(jobs)
+    assert list(jouer_matchs(jobs, processus=2)) == sequentiel
+    assert list(jouer_matchs(jobs, processus=3)) == sequentiel
+
+
+# ----------------------------------------------------------------------
+# LISSAGE DES COURBES
+# ----------------------------------------------------------------------
+def _lissage_reference(df_history, max_duration):
+    """Version par boucle sur les simulations (avant vectorisation), gardée comme référence."""
+    common_time = pd.Index(np.arange(0, max_duration + 1, 1.0), name="Temps")
+    smoothed_data = []
+    for sim_id in df_history["Sim_ID"].unique():
+        subset = df_history[df_history["Sim_ID"] == sim_id]
+        label = subset["Label"].iloc[0]
+        category = subset["Category"].iloc[0]
+        s = subset.set_index("Temps")["Score"]
+        s = s[~s.index.duplicated(keep='last')]
+        s_resampled = s.reindex(s.index.union(common_time)).sort_index().ffill().reindex(common_time).fillna(0)
+        for t, val in s_resampled.items():
+            smoothed_data.append({"Temps": t, "Score": val, "Label": label, "Category": category})
+    df_mean = pd.DataFrame(smoothed_data).groupby(["Label", "Temps", "Category"])["Score"].mean().reset_index()
+    df_mean["Score_Lisse"] = df_mean.groupby("Label")["Score"].transform(
+        lambda x: x.rolling(window=10, min_periods=1).mean()
+    )
+    return df_mean
+
+
+def _historiques(graine: int, nb_sims: int = 12, duree: int = 40) -> pd.DataFrame:
+    rng = np.random.default_rng(graine)
+    labels = [("Solo - Naïf", "1 Agent"), ("Duo - Simple", "2 Agents"), ("Duo - Complexe", "2 Agents")]
+    lignes = []
+    for sim_id in range(1, nb_sims + 1):
+        label, cat = labels[sim_id % len(labels)]
+        temps = np.sort(rng.uniform(0.5, duree + 5, size=rng.integers(1, 15)))
+        temps = np.concatenate([temps, temps[rng.integers(len(temps), size=2)], [3.0, 7.0]])  # doublons, temps entiers
+        score = 0
+        for t in temps:
+            score += int(rng.integers(0, 3)) * 20
+            lignes.append({"Temps": float(t), "Score": score, "Label": label, "Category": cat, "Sim_ID": sim_id})
+    return pd.DataFrame(lignes)
+
+
+def test_lissage_vectorise_identique_a_la_reference():
+    for graine in range(5):
+        df = _historiques(graine)
+        attendu = _lissage_reference(df, 40)
+        obtenu = process_smoothed_curves(df, 40)
+        pd.testing.assert_frame_equal(obtenu, attendu, check_dtype=False)
+
+
+# ----------------------------------------------------------------------
+# BALAYAGE AVEC ARRÊT SÉQUENTIEL
+# ----------------------------------------------------------------------
+def test_balayage_sequentiel_independant_des_processus(tmp_path):
+    def balayage(chemin, processus):
+        suivi = SuiviSequentiel([s["id"] for s in SCENARIOS], min_cartes=3, largeur_cible=1e9)
+        return balayer(processus=processus, chemin_stock=str(chemin), iterations=8, duration=20, suivi=suivi)
+
+    retenues, bilan = balayage(tmp_path / "seq.csv", 1)
+    assert len(retenues) == 3 * len(SCENARIOS)
+    assert bilan["joues"] + bilan["relus"] + bilan["evites"] == 8 * len(SCENARIOS)
+    assert balayage(tmp_path / "pool.csv", 4)[0] == retenues
+
+    # Reprise sur le même stock : tout ce qui est retenu est relu, rien n'est rejoué
+    reprise, bilan = balayage(tmp_path / "seq.csv", 1)
+    assert reprise == retenues and bilan["joues"] == 0
@@ -0,0 +1,52 @@
+# tests/test_environnement.py
+import random
+
+import numpy as np
+
+from environnement import EnvCuisine, EnvsCuisine, NB_ACTIONS
+
+
+def _jouer(env, seed, actions):
+    """Rejoue `actions` depuis `reset(seed)` ; rend des copies des observations et les récompenses."""
+    grille, vecteur = env.reset(seed)
+    assert grille is env.grille and vecteur is env.vecteur
+    traces = [(grille.copy(), vecteur.copy(), 0.0, False)]
+    for a in actions:
+        (grille, vecteur), r, done, _ = env.step(a)
+        # Observations écrites en place : toujours les mêmes tableaux
+        assert grille is env.grille and vecteur is env.vecteur
+        traces.append((grille.copy(), vecteur.copy(), r, done))
+        if done: break
+    return traces
+
+
+def test_reset_puis_memes_actions_rejoue_a_l_identique():
+    env = EnvCuisine(partenaires=["complexe"], duree_s=20)
+    actions = [random.Random(0).randrange(NB_ACTIONS) for _ in range(400)]
+    premiere = _jouer(env, 7, actions)
+    tampons = (env.grille, env.vecteur)
+    seconde = _jouer(env, 7, actions)
+    assert env.grille is tampons[0] and env.vecteur is tampons[1]  # pas de réallocation au reset
+    assert len(premiere) == len(seconde) > 1
+    for (g1, v1, r1, d1), (g2, v2, r2, d2) in zip(premiere, seconde):
+        assert np.array_equal(g1, g2) and np.array_equal(v1, v2) and r1 == r2 and d1 == d2
+    # Une autre graine donne un autre match
+    autre = _jouer(env, 8, actions)
+    assert any(not np.array_equal(a[0], b[0]) for a, b in zip(premiere, autre))
+
+
+def test_envs_ecrivent_dans_le_tampon_commun():
+    envs = EnvsCuisine(3, partenaires=["simple"], duree_s=5)
+    grilles, vecteurs = envs.grilles, envs.vecteurs
+    obs = envs.reset(0)
+    assert obs[0] is grilles and obs[1] is vecteurs
+    for i, env in enumerate(envs.envs):
+        assert env.grille.base is grilles and env.vecteur.base is vecteurs
+        assert np.array_equal(grilles[i], env.grille)
+    rng = random.Random(1)
+    for _ in range(300):
+        (g, v), r, d = envs.step([rng.randrange(NB_ACTIONS) for _ in range(3)])
+        assert g is grilles and v is vecteurs and r is envs.recompenses and d is envs.dones
+    # Les relances après la fin de match réutilisent les mêmes vues
+    assert envs.nb_resets > 0
+    assert all(env.grille.base is grilles and env.vecteur.base is vecteurs for env in envs.envs)
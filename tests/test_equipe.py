@@ -0,0 +1,50 @@
+# tests/test_equipe.py
+import pytest
+
+from equipe import GrilleOccupation, RegistreRevendications
+from map_generator import extra_spawns
+from simulation import Simulation
+
+
+def test_grille_occupation():
+    grille = GrilleOccupation(4, 3)
+    grille.placer(0, (1, 1))
+    grille.placer(1, (2, 1))
+    grille.placer(0, (1, 2))
+    assert grille.occupant((1, 1)) is None and grille.occupant((1, 2)) == 0
+    assert grille.occupee_par_autre((2, 1), 0) and not grille.occupee_par_autre((2, 1), 1)
+    assert grille.occupant((9, 9)) is None
+
+
+def test_revendications():
+    reg = RegistreRevendications()
+    recette = object()
+    reg.viser_station(0, (3, 3))
+    reg.viser_station(1, (3, 3))
+    reg.choisir_recette(1, recette)
+    assert list(reg.agents_sur_station((3, 3))) == [0, 1]
+    assert reg.recettes_des_autres(0) == {id(recette)} and reg.recettes_des_autres(1) == set()
+    version = reg.version
+    reg.viser_station(0, None)
+    assert list(reg.agents_sur_station((3, 3))) == [1] and reg.version > version
+
+
+@pytest.mark.parametrize("nb_agents", [2, 4, 8])
+def test_equipe_sans_chevauchement_ni_croisement(cartes, nb_agents):
+    """Quelle que soit la taille de l'équipe, deux joueurs ne partagent jamais une case ni ne s'échangent leurs cases."""
+    for g, grille, s1, s2 in cartes[:4]:
+        spawns = extra_spawns(grille, [s1, s2], nb_agents, rng=g.spawns())
+        for strategie in ("naive", "simple", "complexe"):
+            for move_every_ticks in (1.0, 2.0):
+                jeu = Simulation(grille, spawns, [strategie] * nb_agents, 20,
+                                 move_every_ticks=move_every_ticks, graine=g.graine)
+                assert len(jeu.players) == nb_agents
+                while not jeu.termine:
+                    avant = [(p.x, p.y) for p in jeu.players]
+                    jeu.pas()
+                    apres = [(p.x, p.y) for p in jeu.players]
+                    assert len(set(apres)) == len(apres)
+                    for a in range(len(apres)):
+                        for b in range(a + 1, len(apres)):
+                            assert not (apres[a] == avant[b] and apres[b] == avant[a])
+                    assert jeu.occupation.positions == {i: c for i, c in enumerate(apres)}
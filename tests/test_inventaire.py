@@ -0,0 +1,61 @@
+# tests/test_inventaire.py
+from typing import Optional
+
+from benchmark_viz import HeadlessGame
+from inventaire import InventaireCuisine
+from map_generator import extra_spawns
+
+
+def _prochain_requis_force_brute(jeu, recette, main) -> Optional[int]:
+    """Parcours complet de la main, des tables et des cuissons (calcul d'avant l'index)."""
+    en_cuisson = {alim.nom for (alim, _, _) in jeu.cuissons.values()}
+    couverts = [False] * len(recette.requis)
+
+    def couvrir(aliment):
+        for i, req in enumerate(recette.requis):
+            if not couverts[i] and aliment.nom == req.nom and aliment.etat == req.etat_final:
+                couverts[i] = True
+                return
+
+    if main is not None: couvrir(main)
+    for stock in jeu.carte.assemblage_stock.values():
+        for a in stock: couvrir(a)
+    for alim, _, _ in jeu.cuissons.values():
+        couvrir(alim)
+    for i, req in enumerate(recette.requis):
+        if not couverts[i] and req.nom not in en_cuisson: return i
+    return None
+
+
+def _reconstruire(jeu) -> InventaireCuisine:
+    """Recalcule tout l'index depuis l'état du jeu, sans passer par les événements."""
+    inv = InventaireCuisine()
+    for p in jeu.players:
+        if p.item is not None: inv._ajouter("mains", p.item)
+    for (_, _, aliment, _, _) in jeu.actions_en_cours.values():
+        inv._retirer("mains", aliment)
+        inv._ajouter("decoupe", aliment)
+    for stock in jeu.carte.assemblage_stock.values():
+        for a in stock: inv._ajouter("tables", a)
+    for (a, _, _) in jeu.cuissons.values():
+        inv._ajouter("cuisson", a)
+    return inv
+
+
+def test_index_egal_a_la_force_brute(cartes):
+    verifications = 0
+    for g, grille, s1, s2 in cartes[:4]:
+        for strategies in (["simple"], ["complexe", "complexe"], ["naive"] * 3):
+            spawns = extra_spawns(grille, [s1, s2], len(strategies), rng=g.spawns())
+            jeu = HeadlessGame(grille, spawns, strategies, 45, graine=g.graine)
+            while not jeu.termine:
+                jeu.pas()
+                reconstruit = _reconstruire(jeu)
+                assert jeu.inventaire.zones == reconstruit.zones
+                assert jeu.inventaire.noms_en_cuisson == reconstruit.noms_en_cuisson
+                for recette in jeu.recettes:
+                    for p in jeu.players:
+                        assert (jeu.inventaire.prochain_requis_manquant(recette, p.item)
+                                == _prochain_requis_force_brute(jeu, recette, p.item))
+                        verifications += 1
+    assert verifications > 0
@@ -0,0 +1,75 @@
+# tests/test_recette.py
+import random
+from collections import Counter
+
+from agent import items_completent_recette, matched_flags_for_recipe, recettes_possibles_pour_items
+from recette import (BITS_PAR_CODE, RECETTES_POOL, TEXTURES_ALIMENTS, Aliment, EtatAliment, code_de,
+                     inclus_dans, masque_compatibles, signature_aliments)
+
+
+# ----------------------------------------------------------------------
+# MATCHERS PAR BOUCLES (avant le codage packé), gardés comme référence
+# ----------------------------------------------------------------------
+def _completent_reference(items, r) -> bool:
+    used = [False] * len(r.requis)
+    for a in items:
+        found = False
+        for i, req in enumerate(r.requis):
+            if used[i]: continue
+            if a.nom == req.nom and a.etat == req.etat_final:
+                used[i] = True
+                found = True
+                break
+        if not found: return False
+    return True
+
+
+def _possibles_reference(items, recettes):
+    return [r for r in recettes if _completent_reference(items, r)]
+
+
+def _flags_reference(items, r):
+    flags = [False] * len(r.requis)
+    for a in items:
+        for i, req in enumerate(r.requis):
+            if not flags[i] and a.nom == req.nom and a.etat == req.etat_final:
+                flags[i] = True
+                break
+    return flags
+
+
+def _multiensembles(rng: random.Random, nb: int):
+    """Pour chaque recette : ses requis (en double, dans le désordre) mêlés à des aliments quelconques."""
+    aliments = sorted({n for (n, _) in TEXTURES_ALIMENTS}) + ["inconnu"]
+    for _ in range(nb):
+        for r in RECETTES_POOL:
+            items = [Aliment(req.nom, req.etat_final) for req in r.requis for _ in range(rng.randint(0, 2))]
+            items += [Aliment(rng.choice(aliments), rng.choice(list(EtatAliment)))
+                      for _ in range(rng.choice((0, 0, 1, 2)))]
+            rng.shuffle(items)
+            yield r, items[:rng.randint(0, len(items))]
+
+
+def test_signature_compte_chaque_aliment():
+    for _, items in _multiensembles(random.Random(0), 20):
+        sig = signature_aliments(items)
+        comptes = Counter(code_de(a) for a in items)
+        assert sig == sum(n << (BITS_PAR_CODE * c) for c, n in comptes.items())
+
+
+def test_matchers_packes_egaux_aux_boucles():
+    compatibles = 0
+    for r, items in _multiensembles(random.Random(1), 50):
+        sig = signature_aliments(items)
+        attendu = _completent_reference(items, r)
+        compatibles += attendu
+        assert inclus_dans(sig, r.signature) == attendu
+        assert r.accepte(sig) == attendu
+        assert items_completent_recette(items, r) == attendu
+        assert matched_flags_for_recipe(items, r) == _flags_reference(items, r)
+        m = masque_compatibles(sig)
+        assert [q for q in RECETTES_POOL if (m >> q.uid) & 1] == _possibles_reference(items, RECETTES_POOL)
+        commandes = random.Random(len(items)).sample(RECETTES_POOL, 3)
+        assert recettes_possibles_pour_items(items, commandes) == _possibles_reference(items, commandes)
+    # Les tirages couvrent les deux issues
+    assert 0 < compatibles < 50 * len(RECETTES_POOL)
@@ -0,0 +1,48 @@
+# tests/test_replanification.py
+import random
+from collections import deque
+
+from replanification import ReplanificateurIncremental
+
+
+def _distance_bfs(carte, depart, buts, bloques):
+    if depart in buts: return 0
+    dist = {depart: 0}
+    file = deque([depart])
+    while file:
+        c = file.popleft()
+        for v in carte.voisins_praticables(*c):
+            if v in dist or v in bloques: continue
+            dist[v] = dist[c] + 1
+            if v in buts: return dist[v]
+            file.append(v)
+    return None
+
+
+def test_reparations_aussi_courtes_qu_un_bfs(cartes, carte_de):
+    """D* Lite, réparé d'un appel à l'autre, rend toujours un plus court chemin valide (ou aucun)."""
+    for g, grille, _, _ in cartes:
+        carte = carte_de(grille)
+        rng = random.Random(g.graine)
+        cases = carte.table_chemins.cases
+        for stations in (carte.pos_decoupes, carte.pos_services, carte.pos_assemblages):
+            replanif = ReplanificateurIncremental(carte)
+            buts = {c for c, d in carte.champ_distance(tuple(sorted(stations))).items() if d == 0}
+            pos, bloques = rng.choice(cases), set()
+            for _ in range(30):
+                if rng.random() < 0.5:
+                    bloques = set(rng.sample([c for c in cases if c != pos], rng.randint(0, 3)))
+                chemin = replanif.chemin(pos, stations, bloques)
+                attendu = _distance_bfs(carte, pos, buts, bloques)
+                if attendu is None:
+                    assert chemin is None
+                    pos = rng.choice(cases)
+                    continue
+                assert chemin is not None and len(chemin) - 1 == attendu
+                assert chemin[0] == pos and chemin[-1] in buts
+                assert not bloques.intersection(chemin[1:])
+                for a, b in zip(chemin, chemin[1:]):
+                    assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+                # L'agent avance d'une case, ou est déplacé ailleurs
+                pos = chemin[1] if len(chemin) > 1 and rng.random() < 0.7 else rng.choice(cases)
+    assert replanif.stats()["reparations"] > 0
@@ -0,0 +1,51 @@
+# tests/test_reservations.py
+import random
+
+import pytest
+
+from reservations import FENETRE_PAS, TableReservations, astar_cooperatif
+
+
+def test_reserver_puis_liberer():
+    table = TableReservations()
+    table.reserver(0, (1, 1), [(2, 1), (3, 1)], t0=10, pas=2)
+    assert table.occupant((1, 1), 10) == 0 and table.occupant((1, 1), 12) is None
+    assert table.occupant((2, 1), 12) == 0 and table.occupant((2, 1), 13) == 0
+    # Chemin tenu dans la fenêtre : l'agent reste garé à l'arrivée
+    assert table.occupant((3, 1), 1000) == 0
+    assert table.est_libre((3, 1), 1000, 0) and not table.est_libre((3, 1), 1000, 1)
+    table.liberer(0)
+    assert table.occupant((2, 1), 12) is None and table.occupant((3, 1), 1000) is None
+
+
+@pytest.mark.parametrize("nb_agents", [2, 4, 8])
+@pytest.mark.parametrize("pas", [1, 2])
+def test_chemins_cooperatifs_sans_conflit(cartes, carte_de, nb_agents, pas):
+    """Des agents qui planifient tour à tour ne partagent jamais une case ni ne se croisent dans la fenêtre."""
+    for g, grille, _, _ in cartes:
+        carte = carte_de(grille)
+        rng = random.Random(g.graine)
+        stations = [s for s in (carte.pos_decoupes, carte.pos_services, carte.pos_bacs, carte.pos_assemblages) if s]
+        departs = rng.sample(carte.table_chemins.cases, nb_agents)
+        table, t0 = TableReservations(), 100
+        for a, depart in enumerate(departs):
+            table.garer(a, depart, t0)  # agents immobiles en attendant leur tour
+        chemins = []
+        for a, depart in enumerate(departs):
+            chemin = astar_cooperatif(carte, depart, rng.choice(stations), table, a, t0, pas)
+            assert chemin is not None
+            table.reserver(a, depart, chemin, t0, pas)
+            chemins.append(chemin)
+
+        def position(a, k):
+            chemin = chemins[a]
+            return departs[a] if k == 0 or not chemin else chemin[min(k, len(chemin)) - 1]
+
+        for k in range(FENETRE_PAS + 1):
+            cases = [position(a, k) for a in range(nb_agents)]
+            assert len(set(cases)) == nb_agents
+            if k == 0: continue
+            for a in range(nb_agents):
+                for b in range(a + 1, nb_agents):
+                    croisement = position(a, k) == position(b, k - 1) and position(b, k) == position(a, k - 1)
+                    assert not croisement
@@ -0,0 +1,89 @@
+# tests/test_simulation.py
+import os
+import subprocess
+import sys
+
+from benchmark_viz import HeadlessGame
+from map_generator import extra_spawns
+from simulation import Simulation
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_coeur_sans_dependance_graphique():
+    code = ("import sys, simulation; "
+            "print(sorted(m for m in ('tkinter', 'PIL') if m in sys.modules))")
+    sortie = subprocess.run([sys.executable, "-c", code], cwd=RACINE, capture_output=True, text=True, check=True)
+    assert sortie.stdout.strip() == "[]"
+
+
+def test_pas_et_run_identiques(cartes):
+    """La vue Tk avance la simulation par `pas()`, le benchmark par `run()` : mêmes résultats."""
+    for g, grille, s1, s2 in cartes[:3]:
+        res = HeadlessGame(grille, [s1, s2], ["complexe", "simple"], 40, graine=g.graine).run()
+        jeu = Simulation(grille, [s1, s2], ["complexe", "simple"], 40, move_every_ticks=1.0, graine=g.graine)
+        while not jeu.termine:
+            jeu.pas()
+        assert jeu.resultats() == res
+
+
+def test_meme_graine_meme_match(cartes):
+    g, grille, s1, s2 = cartes[0]
+    a = HeadlessGame(grille, [s1, s2], ["simple", "simple"], 40, graine=g.graine).run()
+    b = HeadlessGame(grille, [s1, s2], ["simple", "simple"], 40, graine=g.graine).run()
+    assert a == b and a["score"] > 0
+
+
+def test_instantane_restaurer_rejoue_a_l_identique(cartes):
+    """instantané -> on joue la suite -> restauration (plusieurs fois) : la fin du match ne change pas."""
+    for g, grille, s1, s2 in cartes[:4]:
+        spawns = extra_spawns(grille, [s1, s2], 3, rng=g.spawns())
+        for strategies in (["naive"], ["complexe", "complexe"], ["simple"] * 3, ["ordonnance"] * 2):
+            attendu = HeadlessGame(grille, spawns, strategies, 50, graine=g.graine).run()
+            jeu = HeadlessGame(grille, spawns, strategies, 50, graine=g.graine)
+            while jeu.current_sim_time < 15: jeu.pas()
+            inst = jeu.instantane()
+            for _ in range(3):
+                while jeu.current_sim_time < 30: jeu.pas()
+                jeu.restaurer(inst)
+            assert jeu.run() == attendu
+
+
+def _match_compte(jeu: Simulation, **kwargs):
+    """(résultats, état final, nombre de pas réellement joués) d'un `run`."""
+    joues = []
+    pas = jeu.pas
+    jeu.pas = lambda dt: (joues.append(dt), pas(dt))
+    res = jeu.run(**kwargs)
+    return (res, jeu.tick_courant, jeu.current_sim_time, [a.instantane() for a in jeu.agents]), len(joues)
+
+
+def test_evenementiel_identique_aux_ticks(cartes):
+    """Même graine : le mode événementiel rend exactement le match du mode ticks, en jouant moins de pas."""
+    joues = sautes = 0
+    for g, grille, s1, s2 in cartes:
+        spawns = extra_spawns(grille, [s1, s2], 2, rng=g.spawns())
+        for strategies in (["naive"], ["simple"], ["complexe", "complexe"], ["ordonnance"] * 2, ["simple"] * 4):
+            for vitesse in (1.0, 2.0):
+                def match():
+                    return Simulation(grille, spawns, strategies, 60, move_every_ticks=vitesse, graine=g.graine)
+                ticks, n_ticks = _match_compte(match())
+                evenements, n_evenements = _match_compte(match(), evenementiel=True)
+                assert evenements == ticks
+                joues += n_evenements
+                sautes += n_ticks - n_evenements
+    assert sautes > joues // 5
+
+
+def test_evenementiel_en_cours_de_match(cartes):
+    """Cuissons et découpes déjà lancées avant `run` sont dans la file des échéances."""
+    verifies = 0
+    for g, grille, s1, s2 in cartes:
+        jeux = [HeadlessGame(grille, [s1, s2], ["simple", "complexe"], 60, graine=g.graine) for _ in range(2)]
+        for jeu in jeux:
+            while jeu.current_sim_time < 20 or not (jeu.cuissons or jeu.actions_en_cours or jeu.termine):
+                jeu.pas()
+        if jeux[0].termine: continue
+        assert jeux[0].run(evenementiel=True) == jeux[1].run()
+        verifies += 1
+    assert verifies >= 2
@@ -0,0 +1,33 @@
+# tests/test_simulation_lot.py
+from benchmark_viz import HeadlessGame
+from simulation import Simulation
+from simulation_lot import SimulationLot
+
+
+def test_solo_identique_a_headless(cartes):
+    """En solo (aucune collision possible), chaque cuisine du lot rejoue le match de même graine."""
+    lots = [(grille, [s1, s2]) for _, grille, s1, s2 in cartes]
+    graines = [g.graine for g, _, _, _ in cartes]
+    for strats in (["naive"], ["simple"], ["complexe"]):
+        res = SimulationLot(lots, strats, 90, graines=graines).run()
+        assert sum(r["score"] for r in res) > 0
+        for (g, grille, s1, s2), r in zip(cartes, res):
+            attendu = HeadlessGame(grille, [s1, s2], strats, 90, graine=g.graine).run()
+            assert r == {c: attendu[c] for c in r}
+
+
+def test_solo_pas_lents_identique_a_simulation(cartes):
+    lots = [(grille, [s1, s2]) for _, grille, s1, s2 in cartes[:4]]
+    res = SimulationLot(lots, ["complexe"], 60, move_every_ticks=2.0, graines=[g.graine for g, _, _, _ in cartes[:4]]).run()
+    for (g, grille, s1, s2), r in zip(cartes, res):
+        attendu = Simulation(grille, [s1, s2], ["complexe"], 60, move_every_ticks=2.0, graine=g.graine).run()
+        assert r == {c: attendu[c] for c in r}
+
+
+def test_cuisines_independantes(cartes):
+    """Le résultat d'une cuisine ne dépend ni de ses voisines dans le lot, ni de leur nombre."""
+    g, grille, s1, s2 = cartes[0]
+    seule = SimulationLot([(grille, [s1, s2])], ["simple", "complexe"], 40, graines=[g.graine]).run()[0]
+    lots = [(gr, [a, b]) for _, gr, a, b in cartes] + [(grille, [s1, s2])]
+    res = SimulationLot(lots, ["simple", "complexe"], 40, graines=[x.graine for x, _, _, _ in cartes] + [g.graine]).run()
+    assert res[0] == res[-1] == seule and seule["score"] > 0
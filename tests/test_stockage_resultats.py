@@ -0,0 +1,70 @@
+# tests/test_stockage_resultats.py
+import os
+import subprocess
+import sys
+
+import pytest
+
+from stockage_resultats import StockResultats
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _ligne(score: float) -> dict:
+    return {"Label": "Solo - Simple", "Category": "1 Agent", "Score": score}
+
+
+def test_ajout_puis_relecture(tmp_path):
+    chemin = str(tmp_path / "matchs.csv")
+    stock = StockResultats(chemin)
+    stock.ajouter(("abc", "solo_simp", 1, 90), _ligne(0.1 + 0.2), [(0.0, 0), (12.5, 40)])
+    stock.ajouter(("abc", "solo_simp", 1, 90), _ligne(999.0), [])  # clé déjà stockée : ignoré
+    stock.ajouter(("def", "solo_simp", 2, 90), _ligne(80.0), [(0.0, 0)])
+
+    relu = StockResultats(chemin)
+    assert len(relu) == 2 and ("abc", "solo_simp", 1, 90) in relu
+    assert relu.scores()[("abc", "solo_simp", 1, 90)] == 0.1 + 0.2
+    resumes, historiques = relu.charger([("def", "solo_simp", 2, 90), ("abc", "solo_simp", 1, 90)])
+    assert list(resumes["Graine"]) == [2, 1]
+    assert list(historiques["Sim_ID"]) == [1, 2, 2] and list(historiques["Score"]) == [0, 0, 40]
+
+
+def test_reprise_apres_ligne_tronquee(tmp_path):
+    chemin = tmp_path / "matchs.csv"
+    stock = StockResultats(str(chemin))
+    for graine in range(3):
+        stock.ajouter(("abc", "duo_comp", graine, 90), _ligne(graine * 10.0), [(0.0, 0)])
+    contenu = chemin.read_bytes()
+    chemin.write_bytes(contenu[:-7])  # arrêt brutal au milieu de la dernière ligne
+
+    repris = StockResultats(str(chemin))
+    assert len(repris) == 2 and ("abc", "duo_comp", 2, 90) not in repris
+    repris.ajouter(("abc", "duo_comp", 2, 90), _ligne(20.0), [(0.0, 0)])
+    assert StockResultats(str(chemin)).scores() == {("abc", "duo_comp", g, 90): g * 10.0 for g in range(3)}
+
+
+def test_retrouver_rend_la_cle_la_plus_recente(tmp_path):
+    stock = StockResultats(str(tmp_path / "matchs.csv"))
+    assert stock.retrouver("solo_naif", 4, 90) is None
+    stock.ajouter(("ancienne", "solo_naif", 4, 90), _ligne(1.0), [])
+    stock.ajouter(("nouvelle", "solo_naif", 4, 90), _ligne(2.0), [])
+    assert stock.retrouver("solo_naif", 4, 90) == ("nouvelle", "solo_naif", 4, 90)
+    assert StockResultats(stock.chemin).retrouver("solo_naif", 4, 90) == ("nouvelle", "solo_naif", 4, 90)
+
+
+def test_colonnes_incompatibles(tmp_path):
+    stock = StockResultats(str(tmp_path / "matchs.csv"))
+    stock.ajouter(("abc", "solo_naif", 0, 90), _ligne(1.0), [])
+    with pytest.raises(ValueError):
+        stock.ajouter(("abc", "solo_naif", 1, 90), {"Score": 1.0}, [])
+
+
+def test_chemin_defaut_a_cote_du_code(tmp_path):
+    """Le stock par défaut ne dépend pas du dossier d'où l'on lance le benchmark."""
+    code = ("import stockage_resultats, table_chemins; "
+            "print(stockage_resultats.CHEMIN_DEFAUT); print(table_chemins.DOSSIER_CACHE)")
+    sortie = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": RACINE})
+    chemin, dossier_chemins = sortie.stdout.splitlines()
+    assert os.path.isabs(chemin)
+    assert os.path.dirname(os.path.dirname(chemin)) == os.path.dirname(dossier_chemins) == os.path.join(RACINE, "cache")
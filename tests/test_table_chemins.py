@@ -0,0 +1,108 @@
+# tests/test_table_chemins.py
+from collections import deque
+
+import numpy as np
+import pytest
+
+from agent import cases_adjacentes_a_stations
+from carte import BLOQUANTS, MUR, SOL
+from table_chemins import TableChemins
+
+
+def _bfs_reference(grille, start, goals):
+    """BFS case par case d'avant la table (agent.bfs_path sans obstacle) : [] si déjà arrivé."""
+    goal_set = set(goals)
+    if start in goal_set: return []
+    rows, cols = len(grille), len(grille[0])
+    parent = {start: None}
+    q = deque([start])
+    while q:
+        cur = q.popleft()
+        if cur in goal_set:
+            path = [cur]
+            while parent[cur] is not None:
+                cur = parent[cur]
+                path.append(cur)
+            return path[::-1]
+        x, y = cur
+        for nx, ny in ((x+1, y), (x-1, y), (x, y+1), (x, y-1)):
+            if 0 <= nx < cols and 0 <= ny < rows and grille[ny][nx] not in BLOQUANTS and (nx, ny) not in parent:
+                parent[(nx, ny)] = cur
+                q.append((nx, ny))
+    return None
+
+
+def _pas_reference(grille, start, goals):
+    path = _bfs_reference(grille, start, goals)
+    return None if path is None else max(len(path) - 1, 0)
+
+
+def _verifier(table, grille, start, goals):
+    attendu = _pas_reference(grille, start, goals)
+    distances = [d for d in (table.distance(start, g) for g in goals) if d is not None]
+    assert (min(distances) if distances else None) == attendu
+    path = table.chemin(start, goals)
+    if attendu is None:
+        assert path is None
+        return
+    assert len(path) - 1 == attendu and path[0] == start and path[-1] in set(goals)
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1 and grille[y2][x2] not in BLOQUANTS
+
+
+def test_distance_et_chemin_egaux_au_bfs(cartes, carte_de):
+    verifications = 0
+    for _, grille, _, _ in cartes:
+        carte = carte_de(grille)
+        table = TableChemins(carte.grille, BLOQUANTS)
+        noms_bacs = sorted({nom for nom, _ in carte.bacs_config.values()})
+        ensembles = [cases_adjacentes_a_stations(carte, carte.bacs_pour(nom)) for nom in noms_bacs]
+        ensembles += [cases_adjacentes_a_stations(carte, carte.stations_par_type(t))
+                      for t in ("DECOUPE", "FOUR_OU_POELE", "ASSEMBLAGE", "SERVICE")]
+        for start in table.cases:
+            for goals in ensembles:
+                _verifier(table, carte.grille, start, goals)
+                verifications += 1
+            # Départ compris dans les buts : zéro pas
+            _verifier(table, carte.grille, start, [start])
+    assert verifications > 0
+
+
+def test_buts_inaccessibles():
+    # Deux pièces séparées par un mur : rien ne passe de l'une à l'autre
+    grille = [[SOL, SOL, MUR, SOL, SOL],
+              [SOL, SOL, MUR, SOL, SOL]]
+    table = TableChemins(grille, BLOQUANTS)
+    _verifier(table, grille, (0, 0), [(4, 1), (3, 0)])
+    _verifier(table, grille, (0, 0), [(4, 1), (1, 1)])
+    assert table.distance((0, 0), (4, 1)) is None
+    assert table.chemin((0, 0), [(4, 1)]) is None
+    # Buts hors sol (mur, hors grille) et départ hors sol
+    assert table.chemin((0, 0), [(2, 0), (9, 9)]) is None
+    assert table.distance((2, 0), (0, 0)) is None and table.chemin((2, 0), [(0, 0)]) is None
+
+
+def test_table_sauvee_puis_relue_identique(cartes, tmp_path, monkeypatch):
+    _, grille, _, _ = cartes[0]
+    construite = TableChemins(grille, BLOQUANTS, str(tmp_path))
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    # Relue depuis le disque, sans refaire de BFS
+    monkeypatch.setattr(TableChemins, "_construire", lambda self: pytest.fail("table recalculée"))
+    relue = TableChemins(grille, BLOQUANTS, str(tmp_path))
+    assert np.array_equal(relue.dist, construite.dist) and np.array_equal(relue.pas, construite.pas)
+    assert relue.dist.dtype == construite.dist.dtype and relue.pas.dtype == construite.pas.dtype
+
+
+def test_fichier_de_mauvaise_forme_rejete(cartes, tmp_path):
+    _, grille, _, _ = cartes[0]
+    attendue = TableChemins(grille, BLOQUANTS)
+    n = len(attendue.cases)
+    chemin = tmp_path / f"{attendue.cle}.npz"
+    np.savez_compressed(chemin, dist=np.zeros((n - 1, n), dtype=np.int16), pas=np.zeros((n, n - 1), dtype=np.int16))
+
+    table = TableChemins(grille, BLOQUANTS, str(tmp_path))
+    assert np.array_equal(table.dist, attendue.dist) and np.array_equal(table.pas, attendue.pas)
+    # Le fichier rejeté a été remplacé par la bonne table
+    with np.load(chemin) as data:
+        assert np.array_equal(data["dist"], attendue.dist) and np.array_equal(data["pas"], attendue.pas)